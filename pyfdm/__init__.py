@@ -1,6 +1,13 @@
+from . import config
 from . import methods
 from . import correlations
+from . import dominance
+from . import codebook
+from . import accumulators
+from . import adapters
+from . import aggregation
 from . import helpers
+from . import io
 from . import weights
 from . import TFN
-from . import graphs
\ No newline at end of file
+from . import graphs
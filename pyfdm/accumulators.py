@@ -0,0 +1,259 @@
+# Copyright (c) 2024 Jakub Więckowski
+
+import numpy as np
+from .correlations import pearson_coef_matrix, weighted_spearman_coef_matrix, ws_rank_similarity_coef_matrix
+
+__all__ = [
+    'CorrelationAccumulator',
+    'RankAccumulator'
+]
+
+
+class _RunningMoments():
+    # running mean and sum of squared deviations merged batch by batch (Chan et al. parallel algorithm)
+    def __init__(self, shape=()):
+        self.count = 0
+        self.mean = np.zeros(shape)
+        self.m2 = np.zeros(shape)
+
+    def update(self, values):
+        values = np.asarray(values, dtype=float)
+        n = values.shape[0]
+        if n == 0:
+            return
+        mean = np.mean(values, axis=0)
+        m2 = np.sum((values - mean)**2, axis=0)
+        self.merge_moments(n, mean, m2)
+
+    def merge_moments(self, n, mean, m2):
+        total = self.count + n
+        delta = mean - self.mean
+        self.mean = self.mean + delta * n / total
+        self.m2 = self.m2 + m2 + delta**2 * self.count * n / total
+        self.count = total
+
+    def variance(self, ddof=0):
+        if self.count - ddof <= 0:
+            return np.full(np.shape(self.mean), np.nan)
+        return self.m2 / (self.count - ddof)
+
+
+class CorrelationAccumulator():
+    # coefficients calculated between the reference ranking and rankings given in batches
+    COEFFICIENTS = {
+        'ws': ws_rank_similarity_coef_matrix,
+        'weighted_spearman': weighted_spearman_coef_matrix,
+        'pearson': pearson_coef_matrix,
+    }
+
+    def __init__(self, reference, coefficients=('ws', 'weighted_spearman', 'pearson')):
+        """
+            Creates accumulator of correlations between reference ranking and rankings given in batches.
+            Only running means and variances are stored, memory usage does not depend on the number of rankings
+
+            Parameters
+            ----------
+                reference: ndarray
+                    Reference ranking of m alternatives
+
+                coefficients: tuple, default=('ws', 'weighted_spearman', 'pearson')
+                    Names of calculated coefficients
+
+        """
+        unknown = set(coefficients) - set(self.COEFFICIENTS)
+        if unknown:
+            raise ValueError(f'Unknown correlation coefficients: {sorted(unknown)}')
+
+        self.reference = np.asarray(reference, dtype=float)
+        self.coefficients = tuple(coefficients)
+        self.__moments = {name: _RunningMoments() for name in self.coefficients}
+
+    @property
+    def count(self):
+        return self.__moments[self.coefficients[0]].count if self.coefficients else 0
+
+    def update(self, rankings):
+        """
+            Includes the batch of rankings in the statistics
+
+            Parameters
+            ----------
+                rankings : ndarray
+                    Ranking (m, ) or batch of rankings (b, m)
+
+            Returns
+            ----------
+                CorrelationAccumulator:
+                    Updated accumulator
+        """
+        rankings = np.atleast_2d(rankings)
+        if rankings.shape[1] != self.reference.shape[0]:
+            raise ValueError(f'Rankings should have {self.reference.shape[0]} alternatives, not {rankings.shape[1]}')
+
+        for name in self.coefficients:
+            self.__moments[name].update(self.COEFFICIENTS[name](self.reference, rankings)[0])
+        return self
+
+    def merge(self, other):
+        """
+            Includes statistics from other accumulator with the same reference ranking
+
+            Parameters
+            ----------
+                other : CorrelationAccumulator
+                    Accumulator with partial statistics
+
+            Returns
+            ----------
+                CorrelationAccumulator:
+                    Updated accumulator
+        """
+        if not np.array_equal(self.reference, other.reference) or self.coefficients != other.coefficients:
+            raise ValueError('Accumulators should have the same reference ranking and coefficients')
+
+        for name in self.coefficients:
+            moments = other.__moments[name]
+            if moments.count:
+                self.__moments[name].merge_moments(moments.count, moments.mean, moments.m2)
+        return self
+
+    def mean(self):
+        """
+            Returns
+            ----------
+                dict:
+                    Mean value of each coefficient
+        """
+        return {name: float(m.mean) if m.count else np.nan for name, m in self.__moments.items()}
+
+    def variance(self, ddof=0):
+        """
+            Parameters
+            ----------
+                ddof : int, default=0
+                    Delta degrees of freedom
+
+            Returns
+            ----------
+                dict:
+                    Variance of each coefficient
+        """
+        return {name: float(m.variance(ddof)) for name, m in self.__moments.items()}
+
+    def std(self, ddof=0):
+        """
+            Parameters
+            ----------
+                ddof : int, default=0
+                    Delta degrees of freedom
+
+            Returns
+            ----------
+                dict:
+                    Standard deviation of each coefficient
+        """
+        return {name: np.sqrt(v) for name, v in self.variance(ddof).items()}
+
+
+class RankAccumulator():
+    def __init__(self, m):
+        """
+            Creates accumulator of rank positions of m alternatives given in batches.
+            Memory usage does not depend on the number of rankings
+
+            Parameters
+            ----------
+                m: int
+                    Number of alternatives
+
+        """
+        self.m = m
+        self.histogram = np.zeros((m, m), dtype=np.int64)
+        self.__moments = _RunningMoments((m, ))
+
+    @property
+    def count(self):
+        return self.__moments.count
+
+    def update(self, rankings):
+        """
+            Includes the batch of rankings in the statistics
+
+            Parameters
+            ----------
+                rankings : ndarray
+                    Ranking (m, ) or batch of rankings (b, m)
+
+            Returns
+            ----------
+                RankAccumulator:
+                    Updated accumulator
+        """
+        rankings = np.atleast_2d(np.asarray(rankings, dtype=float))
+        if rankings.shape[1] != self.m:
+            raise ValueError(f'Rankings should have {self.m} alternatives, not {rankings.shape[1]}')
+
+        # fractional ranks of tied alternatives are assigned to the lower position
+        positions = np.clip(np.floor(rankings).astype(int) - 1, 0, self.m - 1)
+        alternatives = np.broadcast_to(np.arange(self.m), positions.shape)
+        np.add.at(self.histogram, (alternatives.ravel(), positions.ravel()), 1)
+
+        self.__moments.update(rankings)
+        return self
+
+    def merge(self, other):
+        """
+            Includes statistics from other accumulator
+
+            Parameters
+            ----------
+                other : RankAccumulator
+                    Accumulator with partial statistics
+
+            Returns
+            ----------
+                RankAccumulator:
+                    Updated accumulator
+        """
+        if other.m != self.m:
+            raise ValueError(f'Accumulators should have the same number of alternatives, not {self.m}, {other.m}')
+
+        self.histogram += other.histogram
+        moments = other.__moments
+        if moments.count:
+            self.__moments.merge_moments(moments.count, moments.mean, moments.m2)
+        return self
+
+    def acceptability(self):
+        """
+            Returns
+            ----------
+                ndarray:
+                    Share of rankings with alternative (rows) on the given position (columns)
+        """
+        if self.count == 0:
+            return np.zeros(self.histogram.shape)
+        return self.histogram / self.count
+
+    def mean(self):
+        """
+            Returns
+            ----------
+                ndarray:
+                    Mean rank of each alternative
+        """
+        return self.__moments.mean.copy()
+
+    def variance(self, ddof=0):
+        """
+            Parameters
+            ----------
+                ddof : int, default=0
+                    Delta degrees of freedom
+
+            Returns
+            ----------
+                ndarray:
+                    Variance of rank of each alternative
+        """
+        return self.__moments.variance(ddof)
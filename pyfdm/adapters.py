@@ -0,0 +1,244 @@
+# Copyright (c) 2024 Jakub Więckowski
+
+import numpy as np
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+__all__ = [
+    'tfn_layout',
+    'from_pandas',
+    'from_arrow',
+    'as_tfn_matrix'
+]
+
+COMPONENTS = ('l', 'm', 'u')
+
+
+class _StridedBuffer():
+    # memory of column arrays described as one strided array, arrays are kept alive as long as the view
+    def __init__(self, pointer, shape, strides, dtype, owners):
+        self.__array_interface__ = {
+            'data': (pointer, True),
+            'shape': shape,
+            'strides': strides,
+            'typestr': dtype.str,
+            'version': 3
+        }
+        self.owners = owners
+
+
+def tfn_layout(columns, components=COMPONENTS, sep='_'):
+    """
+        Recognizes columns with components of Triangular Fuzzy Numbers of criteria.
+        Columns are given as pairs (criterion, component), e.g. from pandas MultiIndex,
+        or as names with the component after the separator, e.g. 'C1_l', 'C1_m', 'C1_u'
+
+        Parameters
+        ----------
+            columns : iterable
+                Names of columns
+
+            components : tuple, default=('l', 'm', 'u')
+                Names of the lower, middle and upper component
+
+            sep : str, default='_'
+                Separator of criterion and component in names of columns
+
+        Returns
+        -------
+            list
+                Names of criteria in order of their first column
+
+            ndarray
+                Positions of columns with components of criteria, shape (n, 3)
+    """
+    positions = {}
+    for i, column in enumerate(columns):
+        if isinstance(column, tuple) and len(column) == 2:
+            criterion, component = column
+        elif isinstance(column, str) and sep in column:
+            criterion, component = column.rsplit(sep, 1)
+        else:
+            raise ValueError(f'Column {column!r} is not a component of Triangular Fuzzy Number')
+        if component not in components:
+            raise ValueError(f'Component of column {column!r} should be one of {list(components)}')
+        criterion_positions = positions.setdefault(criterion, [None] * 3)
+        if criterion_positions[components.index(component)] is not None:
+            raise ValueError(f'Component {component!r} of criterion {criterion!r} is given more than once')
+        criterion_positions[components.index(component)] = i
+
+    for criterion, criterion_positions in positions.items():
+        if None in criterion_positions:
+            missing = [c for c, p in zip(components, criterion_positions) if p is None]
+            raise ValueError(f'Criterion {criterion!r} has no columns with components {missing}')
+    return list(positions), np.array(list(positions.values()), dtype=int).reshape(-1, 3)
+
+
+def _pointer(a):
+    return a.__array_interface__['data'][0]
+
+
+def _view(arrays, positions, copy):
+    # (m, n, 3) strided view of 1D column arrays if their memory is evenly spaced, otherwise stacked copy
+    columns = [[arrays[p] for p in row] for row in positions]
+    first = columns[0][0]
+    dtype, stride = first.dtype, first.strides[0]
+    same = all(a.dtype == dtype and a.strides[0] == stride and a.shape == first.shape for row in columns for a in row)
+
+    if same and copy is not True:
+        base = _pointer(first)
+        offsets = np.array([[_pointer(a) - base for a in row] for row in columns])
+        criterion_step = offsets[1, 0] if offsets.shape[0] > 1 else 0
+        component_step = offsets[0, 1]
+        expected = np.arange(offsets.shape[0])[:, None] * criterion_step + np.arange(3)[None, :] * component_step
+        if np.array_equal(offsets, expected):
+            buffer = _StridedBuffer(base, (first.shape[0], offsets.shape[0], 3),
+                                    (stride, int(criterion_step), int(component_step)), dtype, arrays)
+            view = np.asarray(buffer)
+            # the data belongs to the source, it should not be changed through the view
+            view.flags.writeable = False
+            return view
+
+    if copy is False:
+        raise ValueError('Decision matrix cannot be created without copying the data')
+    return np.stack([np.stack(row, axis=1) for row in columns], axis=1)
+
+
+def from_pandas(frame, components=COMPONENTS, sep='_', copy=None):
+    """
+        Creates the TFN decision matrix from the DataFrame with columns of components of criteria.
+        Matrix is a read-only view of the DataFrame data if the columns are evenly spaced in memory,
+        e.g. the DataFrame has one block of floating point values
+
+        Parameters
+        ----------
+            frame : DataFrame
+                Alternatives are in rows, columns with components of criteria recognized with tfn_layout
+
+            components : tuple, default=('l', 'm', 'u')
+                Names of the lower, middle and upper component
+
+            sep : str, default='_'
+                Separator of criterion and component in names of columns
+
+            copy : bool, default=None
+                True to always copy the data, False to raise ValueError if the view cannot be created,
+                None to copy only if needed
+
+        Returns
+        -------
+            ndarray
+                Decision matrix, shape (m, n, 3), criteria ordered as their first columns
+    """
+    if pd is None:
+        raise ImportError('pandas is required to convert DataFrame')
+    _, positions = tfn_layout(frame.columns, components, sep)
+    arrays = [frame.iloc[:, i].to_numpy(copy=False) for i in range(frame.shape[1])]
+    return _view(arrays, positions, copy)
+
+
+def _arrow_array(column, copy):
+    if column.null_count > 0:
+        raise ValueError('Columns of decision matrix should not contain missing values')
+    if column.num_chunks != 1:
+        if copy is False:
+            raise ValueError('Decision matrix cannot be created without copying the data of chunked columns')
+        column = column.combine_chunks()
+    else:
+        column = column.chunk(0)
+    return column.to_numpy(zero_copy_only=False)
+
+
+def from_arrow(table, components=COMPONENTS, sep='_', copy=None):
+    """
+        Creates the TFN decision matrix from the Arrow table with columns of components of criteria
+        or with fixed size list columns of length 3 for criteria.
+        Matrix is a read-only view of the table data if the columns are evenly spaced in memory
+
+        Parameters
+        ----------
+            table : pyarrow.Table
+                Alternatives are in rows, columns with components of criteria recognized with tfn_layout
+                or fixed size list columns with TFNs of criteria
+
+            components : tuple, default=('l', 'm', 'u')
+                Names of the lower, middle and upper component
+
+            sep : str, default='_'
+                Separator of criterion and component in names of columns
+
+            copy : bool, default=None
+                True to always copy the data, False to raise ValueError if the view cannot be created,
+                None to copy only if needed
+
+        Returns
+        -------
+            ndarray
+                Decision matrix, shape (m, n, 3), criteria ordered as their columns
+    """
+    if pa is None:
+        raise ImportError('pyarrow is required to convert Arrow table')
+
+    if all(pa.types.is_fixed_size_list(field.type) and field.type.list_size == 3 for field in table.schema):
+        arrays = []
+        for column in table.columns:
+            if column.num_chunks == 1:
+                column = column.chunk(0)
+            elif copy is False:
+                raise ValueError('Decision matrix cannot be created without copying the data of chunked columns')
+            else:
+                column = column.combine_chunks()
+            if column.null_count > 0 or column.values.null_count > 0:
+                raise ValueError('Columns of decision matrix should not contain missing values')
+            # values of TFNs stored one after another
+            values = column.flatten().to_numpy(zero_copy_only=False).reshape(-1, 3)
+            arrays.extend(values[:, c] for c in range(3))
+        positions = np.arange(len(arrays)).reshape(-1, 3)
+    else:
+        _, positions = tfn_layout(table.column_names, components, sep)
+        arrays = [_arrow_array(column, copy) for column in table.columns]
+    return _view(arrays, positions, copy)
+
+
+def as_tfn_matrix(data, components=COMPONENTS, sep='_', copy=None):
+    """
+        Creates the TFN decision matrix from the DataFrame, Arrow table or array without copying the data if possible
+
+        Parameters
+        ----------
+            data : DataFrame, pyarrow.Table or ndarray
+                Decision matrix / alternatives data
+
+            components : tuple, default=('l', 'm', 'u')
+                Names of the lower, middle and upper component
+
+            sep : str, default='_'
+                Separator of criterion and component in names of columns
+
+            copy : bool, default=None
+                True to always copy the data, False to raise ValueError if the view cannot be created,
+                None to copy only if needed
+
+        Returns
+        -------
+            ndarray
+                Decision matrix, shape (m, n, 3)
+    """
+    if pd is not None and isinstance(data, pd.DataFrame):
+        return from_pandas(data, components, sep, copy)
+    if pa is not None and isinstance(data, pa.Table):
+        return from_arrow(data, components, sep, copy)
+    matrix = np.array(data) if copy else np.asarray(data)
+    if copy is False and not np.shares_memory(matrix, data):
+        raise ValueError('Decision matrix cannot be created without copying the data')
+    if matrix.ndim != 3 or matrix.shape[2] != 3:
+        raise ValueError('TFN matrix elements should all have length of 3')
+    return matrix
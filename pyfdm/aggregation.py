@@ -0,0 +1,296 @@
+# Copyright (c) 2024 Jakub Więckowski
+
+import numpy as np
+from .config import resolve_dtype
+
+__all__ = [
+    'GroupAggregator',
+    'arithmetic_aggregation',
+    'geometric_aggregation',
+    'min_mean_max_aggregation',
+    'min_geometric_max_aggregation'
+]
+
+# maximum number of values of expert matrices processed at once
+_BATCH_ELEMENTS = 2**22
+
+
+class GroupAggregator():
+    # lower, middle and upper component of aggregated TFN
+    OPERATORS = {
+        'arithmetic': ('mean', 'mean', 'mean'),
+        'geometric': ('geometric', 'geometric', 'geometric'),
+        'min_mean_max': ('min', 'mean', 'max'),
+        'min_geometric_max': ('min', 'geometric', 'max'),
+    }
+
+    def __init__(self, operator='arithmetic', dtype=None):
+        """
+            Creates aggregator of decision matrices given by experts one by one or in batches.
+            Only running statistics are stored, memory usage does not depend on the number of experts
+
+            Parameters
+            ----------
+                operator: str, default='arithmetic'
+                    Aggregation operator, 'arithmetic', 'geometric', 'min_mean_max' or 'min_geometric_max'
+
+                dtype : dtype, default=None
+                    Floating point data type used in computations, configured data type if None
+
+        """
+        if operator not in self.OPERATORS:
+            raise ValueError(f'Operator should be one of {list(self.OPERATORS)}, not {operator}')
+
+        self.operator = operator
+        self.dtype = resolve_dtype(dtype)
+        self.count = 0
+        self.total_weight = 0.0
+        self.__statistics = None
+
+    def _empty(self, shape):
+        components = set(self.OPERATORS[self.operator])
+        statistics = {}
+        if 'min' in components:
+            statistics['min'] = np.full(shape, np.inf, dtype=self.dtype)
+        if 'max' in components:
+            statistics['max'] = np.full(shape, -np.inf, dtype=self.dtype)
+        if 'mean' in components:
+            statistics['mean'] = np.zeros(shape, dtype=self.dtype)
+        if 'geometric' in components:
+            statistics['geometric'] = np.zeros(shape, dtype=self.dtype)
+        return statistics
+
+    def update(self, matrices, weights=None):
+        """
+            Includes the decision matrix or the batch of matrices in the aggregation
+
+            Parameters
+            ----------
+                matrices : ndarray
+                    Decision matrix (m, n, 3) or batch of matrices (k, m, n, 3)
+
+                weights : float or ndarray, default=None
+                    Weight of the expert or weights of experts in the batch, equal weights if None
+
+            Returns
+            ----------
+                GroupAggregator:
+                    Updated aggregator
+        """
+        matrices = np.asarray(matrices, dtype=self.dtype)
+        if matrices.ndim == 3:
+            matrices = matrices[None]
+        if matrices.ndim != 4 or matrices.shape[3] != 3:
+            raise ValueError(f'Matrices should have shape (m, n, 3) or (k, m, n, 3), not {matrices.shape}')
+
+        k = matrices.shape[0]
+        weights = np.ones(k, dtype=self.dtype) if weights is None else np.asarray(weights, dtype=self.dtype).reshape(-1)
+        if weights.shape != (k, ):
+            raise ValueError(f'Number of weights should equal number of matrices, not {weights.shape[0]}, {k}')
+        if np.any(weights < 0):
+            raise ValueError('Weights of experts should not be negative')
+
+        if self.__statistics is None:
+            self.__statistics = self._empty(matrices.shape[1:])
+        elif matrices.shape[1:] != self.shape:
+            raise ValueError(f'Matrices should have shape {self.shape}, not {matrices.shape[1:]}')
+
+        statistics = self.__statistics
+        if 'min' in statistics:
+            statistics['min'] = np.minimum(statistics['min'], np.min(matrices, axis=0))
+        if 'max' in statistics:
+            statistics['max'] = np.maximum(statistics['max'], np.max(matrices, axis=0))
+        if 'mean' in statistics:
+            statistics['mean'] += np.tensordot(weights, matrices, axes=1)
+        if 'geometric' in statistics:
+            with np.errstate(divide='ignore'):
+                statistics['geometric'] += np.tensordot(weights, np.log(matrices), axes=1)
+
+        self.count += k
+        self.total_weight += float(np.sum(weights))
+        return self
+
+    def merge(self, other):
+        """
+            Includes matrices aggregated by other aggregator with the same operator
+
+            Parameters
+            ----------
+                other : GroupAggregator
+                    Aggregator with partial statistics
+
+            Returns
+            ----------
+                GroupAggregator:
+                    Updated aggregator
+        """
+        if other.operator != self.operator:
+            raise ValueError(f'Aggregators should have the same operator, not {self.operator}, {other.operator}')
+        if other.__statistics is None:
+            return self
+        if self.__statistics is None:
+            self.__statistics = self._empty(other.shape)
+        elif other.shape != self.shape:
+            raise ValueError(f'Aggregators should have the same shape, not {self.shape}, {other.shape}')
+
+        statistics = self.__statistics
+        for name, value in other.__statistics.items():
+            if name == 'min':
+                statistics[name] = np.minimum(statistics[name], value)
+            elif name == 'max':
+                statistics[name] = np.maximum(statistics[name], value)
+            else:
+                statistics[name] = statistics[name] + value
+
+        self.count += other.count
+        self.total_weight += other.total_weight
+        return self
+
+    @property
+    def shape(self):
+        return None if self.__statistics is None else next(iter(self.__statistics.values())).shape
+
+    def result(self):
+        """
+            Returns
+            ----------
+                ndarray:
+                    Aggregated decision matrix
+        """
+        if self.count == 0:
+            raise ValueError('Cannot aggregate before any matrix is given')
+        if self.total_weight <= 0:
+            raise ValueError('Sum of weights of experts should be positive')
+
+        statistics = self.__statistics
+        values = {}
+        for name in set(self.OPERATORS[self.operator]):
+            if name == 'mean':
+                values[name] = statistics[name] / self.total_weight
+            elif name == 'geometric':
+                values[name] = np.exp(statistics[name] / self.total_weight)
+            else:
+                values[name] = statistics[name]
+
+        lower, middle, upper = self.OPERATORS[self.operator]
+        return np.stack([values[lower][..., 0], values[middle][..., 1], values[upper][..., 2]], axis=-1)
+
+
+def _aggregate(operator, matrices, weights, dtype):
+    aggregator = GroupAggregator(operator, dtype)
+    if isinstance(matrices, np.ndarray) and matrices.ndim == 4:
+        if weights is not None and np.shape(weights)[0] != matrices.shape[0]:
+            raise ValueError(f'Number of weights should equal number of matrices, not {np.shape(weights)[0]}, {matrices.shape[0]}')
+        # stack (also memory-mapped) is aggregated in batches of experts
+        size = max(1, _BATCH_ELEMENTS // max(1, int(np.prod(matrices.shape[1:]))))
+        for start in range(0, matrices.shape[0], size):
+            aggregator.update(matrices[start:start + size], None if weights is None else weights[start:start + size])
+        return aggregator.result()
+
+    weights = None if weights is None else iter(weights)
+    k = 0
+    for matrix in matrices:
+        weight = None
+        if weights is not None:
+            weight = next(weights, None)
+            if weight is None:
+                raise ValueError(f'Number of weights should equal number of matrices, weight of matrix {k} is not given')
+        aggregator.update(matrix, weight)
+        k += 1
+    if weights is not None and next(weights, None) is not None:
+        raise ValueError(f'Number of weights should equal number of matrices, more weights than {k} matrices are given')
+    return aggregator.result()
+
+
+def arithmetic_aggregation(matrices, weights=None, dtype=None):
+    """
+        Aggregates decision matrices of experts with the (weighted) arithmetic mean of TFN components
+
+        Parameters
+        ----------
+            matrices : ndarray or iterable
+                Stack of matrices (k, m, n, 3) or iterable of matrices (m, n, 3), e.g. generator loading them one by one
+
+            weights : ndarray, default=None
+                Weights of experts, equal weights if None
+
+            dtype : dtype, default=None
+                Floating point data type of the result, configured data type if None
+
+        Returns
+        -------
+            ndarray
+                Aggregated Triangular Fuzzy matrix
+    """
+    return _aggregate('arithmetic', matrices, weights, dtype)
+
+
+def geometric_aggregation(matrices, weights=None, dtype=None):
+    """
+        Aggregates decision matrices of experts with the (weighted) geometric mean of TFN components
+
+        Parameters
+        ----------
+            matrices : ndarray or iterable
+                Stack of matrices (k, m, n, 3) or iterable of matrices (m, n, 3), e.g. generator loading them one by one
+
+            weights : ndarray, default=None
+                Weights of experts, equal weights if None
+
+            dtype : dtype, default=None
+                Floating point data type of the result, configured data type if None
+
+        Returns
+        -------
+            ndarray
+                Aggregated Triangular Fuzzy matrix
+    """
+    return _aggregate('geometric', matrices, weights, dtype)
+
+
+def min_mean_max_aggregation(matrices, weights=None, dtype=None):
+    """
+        Aggregates decision matrices of experts using minimum of lower values, (weighted) arithmetic mean of middle values
+        and maximum of upper values
+
+        Parameters
+        ----------
+            matrices : ndarray or iterable
+                Stack of matrices (k, m, n, 3) or iterable of matrices (m, n, 3), e.g. generator loading them one by one
+
+            weights : ndarray, default=None
+                Weights of experts, equal weights if None
+
+            dtype : dtype, default=None
+                Floating point data type of the result, configured data type if None
+
+        Returns
+        -------
+            ndarray
+                Aggregated Triangular Fuzzy matrix
+    """
+    return _aggregate('min_mean_max', matrices, weights, dtype)
+
+
+def min_geometric_max_aggregation(matrices, weights=None, dtype=None):
+    """
+        Aggregates decision matrices of experts using minimum of lower values, (weighted) geometric mean of middle values
+        and maximum of upper values
+
+        Parameters
+        ----------
+            matrices : ndarray or iterable
+                Stack of matrices (k, m, n, 3) or iterable of matrices (m, n, 3), e.g. generator loading them one by one
+
+            weights : ndarray, default=None
+                Weights of experts, equal weights if None
+
+            dtype : dtype, default=None
+                Floating point data type of the result, configured data type if None
+
+        Returns
+        -------
+            ndarray
+                Aggregated Triangular Fuzzy matrix
+    """
+    return _aggregate('min_geometric_max', matrices, weights, dtype)
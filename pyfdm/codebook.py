@@ -0,0 +1,241 @@
+# Copyright (c) 2024 Jakub Więckowski
+
+import numpy as np
+from .config import resolve_dtype
+from .methods.utils.normalizations import NormalizationStatistics, apply_normalization
+
+__all__ = [
+    'TFNCodebook'
+]
+
+
+def _code_dtype(k):
+    for dtype in (np.uint8, np.uint16, np.uint32):
+        if k <= np.iinfo(dtype).max + 1:
+            return dtype
+    return np.uint64
+
+
+class TFNCodebook():
+    def __init__(self, codes, terms):
+        """
+            Creates compact representation of the Triangular Fuzzy matrix built from linguistic terms.
+            Each cell stores the index of the term, Triangular Fuzzy Numbers are stored once in the lookup table.
+            fTOPSIS, fMOORA, fWSM and fWPM called with the codebook normalize the lookup table of terms and gather
+            the normalized matrix by codes, other methods decode the whole matrix and assess it as the ordinary array.
+            evaluate_chunked decodes only one chunk of alternatives at once and calculates statistics from counts of terms
+
+            Parameters
+            ----------
+                codes: ndarray
+                    Matrix of term indices, alternatives are in rows and criteria are in columns
+
+                terms: ndarray
+                    Lookup table of K Triangular Fuzzy Numbers with shape (K, 3)
+
+        """
+        codes = np.asarray(codes)
+        terms = np.asarray(terms, dtype=float)
+        if codes.ndim != 2:
+            raise ValueError(f'Codes should be given as a matrix, not array with shape {codes.shape}')
+        if terms.ndim != 2 or terms.shape[1] != 3:
+            raise ValueError('Terms should be given as Triangular Fuzzy Numbers')
+        if codes.size and (np.min(codes) < 0 or np.max(codes) >= terms.shape[0]):
+            raise ValueError(f'Codes should be indices of {terms.shape[0]} terms')
+
+        self.codes = codes.astype(_code_dtype(terms.shape[0]), copy=False)
+        self.terms = terms
+
+    @classmethod
+    def encode(cls, matrix, terms=None):
+        """
+            Encodes the Triangular Fuzzy matrix with the linguistic terms
+
+            Parameters
+            ----------
+                matrix : ndarray
+                    Decision matrix / alternatives data.
+                    Alternatives are in rows and Criteria are in columns.
+
+                terms : ndarray, default=None
+                    Lookup table of Triangular Fuzzy Numbers, unique TFNs of the matrix are used if None
+
+            Returns
+            -------
+                TFNCodebook
+                    Encoded matrix
+        """
+        matrix = np.asarray(matrix, dtype=float)
+        if matrix.ndim != 3 or matrix.shape[2] != 3:
+            raise ValueError('TFN matrix elements should all have length of 3')
+
+        cells = np.ascontiguousarray(matrix.reshape(-1, 3))
+        keys = cells.view(np.dtype((np.void, cells.dtype.itemsize * 3))).ravel()
+        _, index, inverse = np.unique(keys, return_index=True, return_inverse=True)
+        unique = cells[index]
+
+        if terms is None:
+            terms, lookup = unique, np.arange(unique.shape[0])
+        else:
+            terms = np.asarray(terms, dtype=float)
+            matches = np.all(unique[:, None, :] == terms[None, :, :], axis=2)
+            if not np.all(np.any(matches, axis=1)):
+                raise ValueError(f'Matrix contains TFNs not given in terms: {unique[~np.any(matches, axis=1)].tolist()}')
+            lookup = np.argmax(matches, axis=1)
+
+        return cls(lookup[inverse.ravel()].reshape(matrix.shape[:2]), terms)
+
+    def decode(self, dtype=None):
+        """
+            Decodes the Triangular Fuzzy matrix
+
+            Parameters
+            ----------
+                dtype : dtype, default=None
+                    Floating point data type of the result, configured data type if None
+
+            Returns
+            -------
+                ndarray
+                    Triangular Fuzzy matrix
+        """
+        return self.terms.astype(resolve_dtype(dtype))[self.codes]
+
+    @property
+    def shape(self):
+        return self.codes.shape + (3, )
+
+    @property
+    def ndim(self):
+        return 3
+
+    @property
+    def nbytes(self):
+        return self.codes.nbytes + self.terms.nbytes
+
+    def __len__(self):
+        return self.codes.shape[0]
+
+    def __getitem__(self, key):
+        # selected alternatives are decoded with the configured data type, e.g. chunks in evaluate_chunked
+        return self.terms.astype(resolve_dtype(), copy=False)[self.codes[key]]
+
+    def __array__(self, dtype=None, copy=None):
+        # the whole matrix is decoded, e.g. when the codebook is given to the method without normalization
+        return self.terms.astype(resolve_dtype() if dtype is None else dtype, copy=False)[self.codes]
+
+    def counts(self):
+        """
+            Calculates the number of occurrences of each term for each criterion
+
+            Returns
+            -------
+                ndarray
+                    Counts of terms, criteria are in rows and terms are in columns
+        """
+        n, k = self.codes.shape[1], self.terms.shape[0]
+        offsets = self.codes.astype(np.int64) + np.arange(n) * k
+        return np.bincount(offsets.ravel(), minlength=n * k).reshape(n, k)
+
+    def column_sum(self, function=None, dtype=None):
+        """
+            Calculates the sum of function values of all alternatives for each criterion using counts of terms
+
+            Parameters
+            ----------
+                function : callable, default=None
+                    Function applied to the lookup table of terms, identity if None
+
+                dtype : dtype, default=None
+                    Floating point data type of the result, configured data type if None
+
+            Returns
+            -------
+                ndarray
+                    Sums of Triangular Fuzzy Numbers for each criterion
+        """
+        dtype = resolve_dtype(dtype)
+        terms = self.terms.astype(dtype)
+        counts = self.counts()[:, :, None]
+        # terms absent in the criterion are skipped, so their infinite or undefined values do not propagate
+        with np.errstate(all='ignore'):
+            values = terms if function is None else function(terms)
+            return np.sum(np.where(counts > 0, counts.astype(dtype) * values[None], 0), axis=1).astype(dtype)
+
+    def variance(self, dtype=None):
+        """
+            Calculates the variance of Triangular Fuzzy Numbers components for each criterion using counts of terms
+
+            Parameters
+            ----------
+                dtype : dtype, default=None
+                    Floating point data type of the result, configured data type if None
+
+            Returns
+            -------
+                ndarray
+                    Variance of components for each criterion
+        """
+        dtype = resolve_dtype(dtype)
+        terms = self.terms.astype(dtype)
+        counts = self.counts().astype(dtype)
+        mean = self.column_sum(dtype=dtype) / self.codes.shape[0]
+        return np.einsum('jk,jkc->jc', counts, (terms[None, :, :] - mean[:, None, :])**2) / self.codes.shape[0]
+
+    def statistics(self, dtype=None):
+        """
+            Calculates the statistics of criteria used by normalizations from counts of terms
+
+            Parameters
+            ----------
+                dtype : dtype, default=None
+                    Floating point data type of the statistics, configured data type if None
+
+            Returns
+            -------
+                NormalizationStatistics
+                    Statistics of criteria
+        """
+        dtype = resolve_dtype(dtype)
+        terms = self.terms.astype(dtype)
+        present = self.counts() > 0
+
+        statistics = NormalizationStatistics(self.codes.shape[1], dtype)
+        statistics.count = self.codes.shape[0]
+        for j in range(self.codes.shape[1]):
+            if np.any(present[j]):
+                statistics.min[j] = np.min(terms[present[j]], axis=0)
+                statistics.max[j] = np.max(terms[present[j]], axis=0)
+        statistics.sum = self.column_sum(dtype=dtype)
+        statistics.sum_reciprocal = self.column_sum(lambda t: 1/t, dtype)
+        statistics.sum_squares = self.column_sum(lambda t: t**2, dtype)
+        return statistics
+
+    def normalize(self, normalization, types=None, dtype=None):
+        """
+            Normalizes the lookup table of terms for each criterion with statistics of the whole matrix
+            and gathers normalized values of alternatives
+
+            Parameters
+            ----------
+                normalization : callable
+                    Normalization function from pyfdm.methods.utils.normalizations
+
+                types : ndarray, default=None
+                    Types of criteria, 1 profit, -1 cost
+
+                dtype : dtype, default=None
+                    Floating point data type of the result, configured data type if None
+
+            Returns
+            -------
+                ndarray
+                    Normalized Triangular Fuzzy matrix
+        """
+        dtype = resolve_dtype(dtype)
+        n = self.codes.shape[1]
+        # each term normalized as if it was given for every criterion
+        table = np.broadcast_to(self.terms[:, None, :], (self.terms.shape[0], n, 3))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ntable = apply_normalization(normalization, self.statistics(dtype), table, types, dtype)
+        return ntable[self.codes, np.arange(n)]
@@ -0,0 +1,88 @@
+# Copyright (c) 2024 Jakub Więckowski
+
+import threading
+from contextlib import contextmanager
+
+import numpy as np
+
+__all__ = [
+    'get_dtype',
+    'set_dtype',
+    'use_dtype',
+    'resolve_dtype'
+]
+
+_SUPPORTED_DTYPES = (np.dtype(np.float32), np.dtype(np.float64))
+
+_default_dtype = np.dtype(np.float64)
+_local = threading.local()
+
+
+def _validate_dtype(dtype):
+    dtype = np.dtype(dtype)
+    if dtype not in _SUPPORTED_DTYPES:
+        raise ValueError(f'Computation data type should be float32 or float64, not {dtype}')
+    return dtype
+
+
+def get_dtype():
+    """
+        Returns the floating point data type used in computations
+
+        Returns
+        -------
+            dtype
+                Data type set for the current thread or the global one
+    """
+    return getattr(_local, 'dtype', None) or _default_dtype
+
+
+def set_dtype(dtype):
+    """
+        Sets the global floating point data type used in computations
+
+        Parameters
+        ----------
+            dtype : dtype
+                Data type, float32 or float64
+    """
+    global _default_dtype
+    _default_dtype = _validate_dtype(dtype)
+
+
+@contextmanager
+def use_dtype(dtype):
+    """
+        Temporarily sets the floating point data type used in computations in the current thread
+
+        Parameters
+        ----------
+            dtype : dtype
+                Data type, float32 or float64. Current data type is kept if None
+    """
+    previous = getattr(_local, 'dtype', None)
+    if dtype is not None:
+        _local.dtype = _validate_dtype(dtype)
+    try:
+        yield get_dtype()
+    finally:
+        _local.dtype = previous
+
+
+def resolve_dtype(dtype=None):
+    """
+        Returns the data type given for the call or the one used in computations
+
+        Parameters
+        ----------
+            dtype : dtype, default=None
+                Data type given for the call
+
+        Returns
+        -------
+            dtype
+                Data type which should be used
+    """
+    if dtype is None:
+        return get_dtype()
+    return _validate_dtype(dtype)
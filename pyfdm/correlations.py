@@ -1,14 +1,22 @@
-# Copyright (c) 2022-2023 Jakub Więckowski
+# Copyright (c) 2022-2024 Jakub Więckowski
 
 import numpy as np
+from scipy.stats import rankdata
 
 __all__ = [
     'spearman_coef',
     'pearson_coef',
     'weighted_spearman_coef',
-    'ws_rank_similarity_coef'
+    'ws_rank_similarity_coef',
+    'pearson_coef_matrix',
+    'spearman_rank_coef_matrix',
+    'weighted_spearman_coef_matrix',
+    'ws_rank_similarity_coef_matrix'
 ]
 
+# maximum number of elements of temporary arrays created in the chunked calculations
+_CHUNK_ELEMENTS = 2**22
+
 
 def spearman_coef(x, y):
     """
@@ -90,3 +98,147 @@ def ws_rank_similarity_coef(x, y):
     """
     N = x.shape[0]
     return 1 - np.sum(2.0**(-1.0 * x) * (np.fabs(x - y)) / (np.max((np.fabs(1 - x), np.fabs(N - x)), axis=0)))
+
+
+def _prepare(x, y):
+    x = np.atleast_2d(np.asarray(x, dtype=float))
+    y = x if y is None else np.atleast_2d(np.asarray(y, dtype=float))
+    if x.ndim != 2 or y.ndim != 2 or x.shape[1] != y.shape[1]:
+        raise ValueError(f'Rankings should be given as (k, m) arrays with the same number of alternatives, not {x.shape}, {y.shape}')
+    return x, y
+
+
+def _chunks(k, row_elements, chunk_size=None):
+    if chunk_size is None:
+        chunk_size = max(1, _CHUNK_ELEMENTS // max(1, row_elements))
+    for start in range(0, k, chunk_size):
+        yield slice(start, min(start + chunk_size, k))
+
+
+def pearson_coef_matrix(x, y=None, chunk_size=None):
+    """
+        Calculate Pearson correlation between all pairs of vectors
+
+        Parameters
+        ----------
+            x : ndarray
+                Array with k vectors in rows
+
+            y : ndarray, default=None
+                Array with l vectors in rows, vectors from x are compared if None
+
+            chunk_size : int, default=None
+                Number of rows of x processed at once, chosen to limit the memory usage if None
+
+        Returns
+        -------
+            ndarray
+                Matrix (k, l) of correlations between vectors
+    """
+    x, y = _prepare(x, y)
+    xc = x - np.mean(x, axis=1, keepdims=True)
+    yc = y - np.mean(y, axis=1, keepdims=True)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        xn = xc / (np.std(x, axis=1, keepdims=True) * np.sqrt(x.shape[1]))
+        yn = yc / (np.std(y, axis=1, keepdims=True) * np.sqrt(y.shape[1]))
+
+    corr = np.zeros((x.shape[0], y.shape[0]))
+    for c in _chunks(x.shape[0], y.shape[0], chunk_size):
+        corr[c] = xn[c] @ yn.T
+    return corr
+
+
+def spearman_rank_coef_matrix(x, y=None, chunk_size=None):
+    """
+        Calculate Spearman rank correlation between all pairs of vectors.
+        Values are ranked (ties get average rank) before calculating the correlation
+
+        Parameters
+        ----------
+            x : ndarray
+                Array with k vectors in rows
+
+            y : ndarray, default=None
+                Array with l vectors in rows, vectors from x are compared if None
+
+            chunk_size : int, default=None
+                Number of rows of x processed at once, chosen to limit the memory usage if None
+
+        Returns
+        -------
+            ndarray
+                Matrix (k, l) of correlations between vectors
+    """
+    x, y = _prepare(x, y)
+    rx = rankdata(x, axis=1)
+    ry = rx if y is x else rankdata(y, axis=1)
+    return pearson_coef_matrix(rx, ry, chunk_size)
+
+
+def weighted_spearman_coef_matrix(x, y=None, chunk_size=None):
+    """
+        Calculate Weighted Spearman correlation between all pairs of rankings
+
+        Parameters
+        ----------
+            x : ndarray
+                Array with k rankings in rows
+
+            y : ndarray, default=None
+                Array with l rankings in rows, rankings from x are compared if None
+
+            chunk_size : int, default=None
+                Number of rows of x processed at once, chosen to limit the memory usage if None
+
+        Returns
+        -------
+            ndarray
+                Matrix (k, l) of correlations between rankings
+    """
+    x, y = _prepare(x, y)
+    N = x.shape[1]
+    c = 2 * N + 2
+
+    # sum of (x - y)^2 * (c - x - y) expanded into terms computed with matrix products
+    x2, y2 = x**2, y**2
+    ax = c * np.sum(x2, axis=1) - np.sum(x2 * x, axis=1)
+    ay = c * np.sum(y2, axis=1) - np.sum(y2 * y, axis=1)
+
+    corr = np.zeros((x.shape[0], y.shape[0]))
+    for s in _chunks(x.shape[0], y.shape[0], chunk_size):
+        total = ax[s, None] + ay[None] + x2[s] @ y.T + x[s] @ y2.T - 2 * c * (x[s] @ y.T)
+        corr[s] = 1 - (6 * total) / (N**4 + N**3 - N**2 - N)
+    return corr
+
+
+def ws_rank_similarity_coef_matrix(x, y=None, chunk_size=None):
+    """
+        Calculate WS Rank Similarity Coefficient between all pairs of rankings.
+        Rankings from x are used as the reference rankings
+
+        Parameters
+        ----------
+            x : ndarray
+                Array with k rankings in rows
+
+            y : ndarray, default=None
+                Array with l rankings in rows, rankings from x are compared if None
+
+            chunk_size : int, default=None
+                Number of rows of x processed at once, chosen to limit the memory usage if None
+
+        Returns
+        -------
+            ndarray
+                Matrix (k, l) of coefficients between rankings
+    """
+    x, y = _prepare(x, y)
+    N = x.shape[1]
+
+    # weights of positions depend only on the reference ranking
+    a = 2.0**(-1.0 * x) / np.maximum(np.fabs(1 - x), np.fabs(N - x))
+
+    corr = np.zeros((x.shape[0], y.shape[0]))
+    for s in _chunks(x.shape[0], y.shape[0] * N, chunk_size):
+        corr[s] = 1 - np.sum(a[s, None] * np.fabs(x[s, None] - y[None]), axis=2)
+    return corr
@@ -0,0 +1,87 @@
+# Copyright (c) 2024 Jakub Więckowski
+
+import numpy as np
+from .methods.validator import Validator
+from .methods.utils.defuzzifications import tfn_defuzzify
+
+__all__ = [
+    'pareto_filter'
+]
+
+# maximum number of compared pairs of alternatives held in memory at once
+_BLOCK_ELEMENTS = 2**22
+
+
+def _oriented(matrix, types, ordering):
+    # values oriented so that greater is better on every coordinate
+    if ordering == 'componentwise':
+        values = matrix * types[None, :, None]
+        # components of cost criteria are reversed to keep the TFN order after negation
+        values[:, types == -1] = values[:, types == -1, ::-1]
+        return values.reshape(matrix.shape[0], -1)
+    if callable(ordering):
+        return tfn_defuzzify(ordering, matrix) * types
+    raise ValueError(f'Ordering should be componentwise or defuzzification function, not {ordering}')
+
+
+def _dominated(window, candidates):
+    # candidates dominated by at least one point of the window, compared coordinate by coordinate
+    ge = np.ones((candidates.shape[0], window.shape[0]), dtype=bool)
+    gt = np.zeros((candidates.shape[0], window.shape[0]), dtype=bool)
+    for k in range(candidates.shape[1]):
+        ge &= window[None, :, k] >= candidates[:, None, k]
+        gt |= window[None, :, k] > candidates[:, None, k]
+    return np.any(ge & gt, axis=1)
+
+
+def pareto_filter(matrix, types, ordering='componentwise'):
+    """
+        Removes alternatives dominated by other alternatives on all criteria.
+        Alternatives are sorted by the sum of oriented values, so the alternative can be dominated only by the preceding ones,
+        and compared in blocks with the set of non-dominated alternatives found so far (block-nested-loop skyline)
+
+        Parameters
+        ----------
+            matrix : ndarray
+                Decision matrix / alternatives data.
+                Alternatives are in rows and Criteria are in columns.
+
+            types : ndarray
+                Types of criteria, 1 profit, -1 cost
+
+            ordering : str or callable, default='componentwise'
+                Order of Triangular Fuzzy Numbers. With 'componentwise' the TFN is not worse if all its components are not worse,
+                with defuzzification function the crisp values are compared
+
+        Returns
+        -------
+            ndarray
+                Indices of non-dominated alternatives in the ascending order
+    """
+    matrix = np.asarray(matrix, dtype=float)
+    types = np.asarray(types)
+    Validator.validate_tfn_matrix(matrix)
+    if types.shape != (matrix.shape[1], ):
+        raise ValueError(f'Number of criteria should equals number of types, not {matrix.shape[1]}, {types.shape[0]}')
+
+    values = _oriented(matrix, types, ordering)
+    m, d = values.shape
+    order = np.argsort(-np.sum(values, axis=1), kind='stable')
+    values = values[order]
+
+    kept = []
+    window = np.empty((0, d))
+    start = 0
+    while start < m:
+        # block is compared with the window and with itself
+        size = max(1, min(m - start, int(np.sqrt(_BLOCK_ELEMENTS)), _BLOCK_ELEMENTS // max(1, window.shape[0])))
+        block = np.arange(start, start + size)
+        candidates = block[~_dominated(window, values[block])] if window.shape[0] else block
+        # dominance is transitive, so the remaining candidates are compared only with each other
+        candidates = candidates[~_dominated(values[candidates], values[candidates])]
+
+        kept.append(candidates)
+        window = np.concatenate([window, values[candidates]])
+        start += size
+
+    return np.sort(order[np.concatenate(kept)])
@@ -1,10 +1,14 @@
 # Copyright (c) 2022-2024 Jakub Więckowski
 
+import heapq
+
 import numpy as np
-from .methods.utils.normalizations import sum_normalization, vector_normalization
+from scipy.stats import rankdata
 
 __all__ = [
     'rank',
+    'top_k',
+    'top_k_chunked',
     'generate_fuzzy_matrix',
     'normalize_weights'
 ]
@@ -17,7 +21,7 @@ def rank(x, descending=True):
         Parameters
         ----------
             x: ndarray
-                Array with values
+                Array with values, rows of values are ranked separately
 
             descending: boolean, default=True
                 Switch to change ranking order
@@ -28,11 +32,102 @@ def rank(x, descending=True):
                 Ranking with given order
 
     """
+    # tied values get the average of their positions
     try:
-        s = [sorted(x, reverse=descending).index(r)+1 for r in x]
+        x = np.asarray(x, dtype=float)
+        return rankdata(-x if descending else x, method='average', axis=-1)
     except:
         raise ValueError('Error occurred in ranking calculation')
-    return np.array([(ss * s.count(ss) + s.count(ss) - 1) / s.count(ss) if s.count(ss) <= 2 else np.sum(list(range(ss, ss+s.count(ss)))) / s.count(ss) for ss in s])
+
+
+def _selection_key(x, descending):
+    return -x if descending else x
+
+
+def _select(key, indices, k):
+    # k smallest keys, ties resolved by the lower index
+    if k < key.shape[0]:
+        threshold = key[np.argpartition(key, k - 1)[k - 1]]
+        candidates = np.flatnonzero(key <= threshold)
+        key, indices = key[candidates], indices[candidates]
+    order = np.lexsort((indices, key))[:k]
+    return key[order], indices[order]
+
+
+def top_k(x, k, descending=True):
+    """
+        Selects the best k values without calculating the whole ranking
+
+        Parameters
+        ----------
+            x: ndarray
+                Array with values, values in rows of matrix are selected separately
+
+            k: int
+                Number of selected values
+
+            descending: boolean, default=True
+                Switch to change ranking order
+
+        Returns
+        -------
+            ndarray
+                Indices of the best values, from the best one. Ties are resolved by the lower index
+
+    """
+    x = np.asarray(x, dtype=float)
+    if x.ndim not in (1, 2):
+        raise ValueError(f'Values should be given as a vector or matrix, not array with shape {x.shape}')
+    if k < 1:
+        raise ValueError(f'Number of selected values should be positive, not {k}')
+
+    if x.ndim == 2:
+        return np.array([top_k(row, k, descending) for row in x])
+    return _select(_selection_key(x, descending), np.arange(x.shape[0]), k)[1]
+
+
+def top_k_chunked(x, k, descending=True, chunk_size=65536):
+    """
+        Selects the best k values from the array processed in chunks, e.g. memory-mapped preferences
+
+        Parameters
+        ----------
+            x: ndarray or iterable
+                Array with values or iterable of consecutive chunks of values
+
+            k: int
+                Number of selected values
+
+            descending: boolean, default=True
+                Switch to change ranking order
+
+            chunk_size : int, default=65536
+                Number of values processed at once if array is given
+
+        Returns
+        -------
+            ndarray
+                Indices of the best values, from the best one. Ties are resolved by the lower index
+
+    """
+    if k < 1:
+        raise ValueError(f'Number of selected values should be positive, not {k}')
+
+    if hasattr(x, 'shape'):
+        chunks = (x[start:start + chunk_size] for start in range(0, x.shape[0], chunk_size))
+    else:
+        chunks = iter(x)
+
+    # best values of each chunk are merged with the best values found so far
+    selected = []
+    offset = 0
+    for chunk in chunks:
+        chunk = np.asarray(chunk, dtype=float)
+        key, indices = _select(_selection_key(chunk, descending), np.arange(offset, offset + chunk.shape[0]), k)
+        selected = list(heapq.merge(selected, zip(key.tolist(), indices.tolist())))[:k]
+        offset += chunk.shape[0]
+
+    return np.array([index for _, index in selected], dtype=int)
 
 
 def generate_fuzzy_matrix(m, n, lower=0.0, upper=1.0):
@@ -86,8 +181,7 @@ def normalize_weights(weights):
         raise ValueError(
             'Fuzzy weights should be given as Triangular Fuzzy Numbers')
 
-    if any([x > 1 for x in weights.flatten()]):
-        nweights = weights.copy()
+    if np.any(weights > 1):
         nweights = weights / np.max(weights, axis=0)[2]
 
         return nweights
@@ -0,0 +1,408 @@
+# Copyright (c) 2024 Jakub Więckowski
+
+import csv
+import json
+import itertools
+from collections import namedtuple
+from contextlib import contextmanager
+
+import numpy as np
+from .config import resolve_dtype
+
+__all__ = [
+    'DecisionData',
+    'iter_csv',
+    'read_csv',
+    'write_csv',
+    'convert_csv',
+    'read_json',
+    'write_json',
+    'write_results',
+    'save',
+    'load'
+]
+
+# decision matrix with criteria types and weights, None if not given
+DecisionData = namedtuple('DecisionData', ['matrix', 'types', 'weights'])
+
+# characters around and between values of TFNs, replaced with whitespaces before parsing numbers
+_SEPARATORS = '()[]"\';,\t\r'
+
+
+@contextmanager
+def _open(source, mode):
+    # file objects are used as given, paths are opened and closed
+    if hasattr(source, 'read') or hasattr(source, 'write'):
+        yield source
+    else:
+        with open(source, mode, newline='' if 'b' not in mode else None) as f:
+            yield f
+
+
+def _parse(lines, table, separators, n, dtype, start):
+    text = ''.join(lines)
+    chars = np.frombuffer(text.encode(), dtype=np.uint8)
+
+    # TFNs are found from brackets, values from characters following separators
+    opening = (chars == ord('(')) | (chars == ord('['))
+    depth = np.cumsum(opening.astype(np.int64) - ((chars == ord(')')) | (chars == ord(']'))))
+    row = np.cumsum(chars == ord('\n')) - (chars == ord('\n'))
+    separator = separators[chars]
+    value = ~separator & np.concatenate([[True], separator[:-1]])
+    # values outside brackets, nested or not closed brackets
+    invalid = (depth < 0) | (depth > 1) | (value & (depth == 0)) | ((chars == ord('\n')) & (depth != 0))
+    if np.any(invalid) or depth[-1] != 0:
+        i = int(row[np.argmax(invalid)]) if np.any(invalid) else len(lines) - 1
+        raise ValueError(f'Row {start + i} should contain TFNs written as (l, m, u) or [l, m, u]')
+
+    tfns = np.bincount(row[opening], minlength=len(lines))
+    if n is None:
+        n = int(tfns[0])
+        if n == 0:
+            raise ValueError('Row 0 should contain at least one Triangular Fuzzy Number')
+    if np.any(tfns != n):
+        i = int(np.argmax(tfns != n))
+        raise ValueError(f'Row {start + i} should contain {n} TFNs, not {tfns[i]}')
+    counts = np.bincount(np.cumsum(opening)[value] - 1, minlength=len(lines) * n)
+    if np.any(counts != 3):
+        i = int(np.argmax(counts != 3))
+        raise ValueError(f'TFN {i % n} in row {start + i // n} should contain 3 values, not {counts[i]}')
+
+    # values of all TFNs of lines parsed at once
+    values = np.array(text.translate(table).split(), dtype=dtype)
+    return values.reshape(len(lines), n, 3), n
+
+
+def iter_csv(source, delimiter=',', header=True, chunk_size=65536, dtype=None):
+    """
+        Reads the decision matrix from CSV file in chunks of alternatives.
+        Cells contain TFNs written as '(l, m, u)' or '[l, m, u]', quoted or not,
+        values of chunk are parsed at once instead of row by row after the brackets of TFNs are checked
+
+        Parameters
+        ----------
+            source : str or file
+                Path or opened text file
+
+            delimiter : str, default=','
+                Separator of cells
+
+            header : bool, default=True
+                Whether the first line contains names of criteria
+
+            chunk_size : int, default=65536
+                Number of alternatives parsed at once
+
+            dtype : dtype, default=None
+                Floating point data type of values, configured data type if None
+
+        Returns
+        -------
+            generator
+                Consecutive chunks of decision matrix, shape (chunk_size, n, 3)
+    """
+    if chunk_size < 1:
+        raise ValueError(f'Chunk size should be positive, not {chunk_size}')
+    dtype = resolve_dtype(dtype)
+    table = str.maketrans(_SEPARATORS + delimiter, ' ' * (len(_SEPARATORS) + len(delimiter)))
+    separators = np.zeros(256, dtype=bool)
+    separators[list((_SEPARATORS + delimiter + ' \n').encode())] = True
+
+    with _open(source, 'r') as f:
+        if header:
+            next(f, None)
+        rows = (line for line in f if line.strip())
+        n, start = None, 0
+        while True:
+            lines = list(itertools.islice(rows, chunk_size))
+            if not lines:
+                return
+            chunk, n = _parse(lines, table, separators, n, dtype, start)
+            start += len(lines)
+            yield chunk
+
+
+def read_csv(source, delimiter=',', header=True, chunk_size=65536, dtype=None):
+    """
+        Reads the decision matrix from CSV file with TFNs written as '(l, m, u)' in cells
+
+        Parameters
+        ----------
+            source : str or file
+                Path or opened text file
+
+            delimiter : str, default=','
+                Separator of cells
+
+            header : bool, default=True
+                Whether the first line contains names of criteria
+
+            chunk_size : int, default=65536
+                Number of alternatives parsed at once
+
+            dtype : dtype, default=None
+                Floating point data type of values, configured data type if None
+
+        Returns
+        -------
+            ndarray
+                Decision matrix, shape (m, n, 3)
+    """
+    chunks = list(iter_csv(source, delimiter, header, chunk_size, dtype))
+    if not chunks:
+        raise ValueError('File does not contain alternatives')
+    return np.concatenate(chunks)
+
+
+def write_csv(target, matrix, names=None, delimiter=','):
+    """
+        Writes the decision matrix to CSV file with TFNs written as '(l, m, u)' in cells
+
+        Parameters
+        ----------
+            target : str or file
+                Path or opened text file
+
+            matrix : ndarray
+                Decision matrix / alternatives data.
+                Alternatives are in rows and Criteria are in columns.
+
+            names : list, default=None
+                Names of criteria written in the first line, 'C1', 'C2', ... if None
+
+            delimiter : str, default=','
+                Separator of cells
+    """
+    matrix = np.asarray(matrix)
+    if matrix.ndim != 3 or matrix.shape[2] != 3:
+        raise ValueError('TFN matrix elements should all have length of 3')
+    if names is None:
+        names = [f'C{j + 1}' for j in range(matrix.shape[1])]
+
+    with _open(target, 'w') as f:
+        writer = csv.writer(f, delimiter=delimiter, lineterminator='\n')
+        writer.writerow(names)
+        # values are written with the shortest representation read back without changes
+        writer.writerows([f'({l!r}, {m!r}, {u!r})' for l, m, u in row] for row in matrix.tolist())
+
+
+def convert_csv(source, target, delimiter=',', header=True, chunk_size=65536, dtype=None):
+    """
+        Converts the decision matrix from CSV file into .npy file chunk by chunk,
+        so the matrix can be loaded with mmap_mode and assessed with evaluate_chunked
+
+        Parameters
+        ----------
+            source : str
+                Path of CSV file
+
+            target : str
+                Path of created .npy file
+
+            delimiter : str, default=','
+                Separator of cells
+
+            header : bool, default=True
+                Whether the first line contains names of criteria
+
+            chunk_size : int, default=65536
+                Number of alternatives parsed at once
+
+            dtype : dtype, default=None
+                Floating point data type of values, configured data type if None
+
+        Returns
+        -------
+            ndarray
+                Decision matrix memory-mapped from the created file, shape (m, n, 3)
+    """
+    # number of alternatives is counted before the file is created
+    with open(source, 'r', newline='') as f:
+        m = sum(1 for line in f if line.strip()) - int(header)
+
+    out, start = None, 0
+    for chunk in iter_csv(source, delimiter, header, chunk_size, dtype):
+        if out is None:
+            out = np.lib.format.open_memmap(target, mode='w+', dtype=chunk.dtype, shape=(m, ) + chunk.shape[1:])
+        out[start:start + chunk.shape[0]] = chunk
+        start += chunk.shape[0]
+    if out is None:
+        raise ValueError('File does not contain alternatives')
+    out.flush()
+    return out
+
+
+def read_json(source, dtype=None):
+    """
+        Reads the decision matrix from JSON file with list of alternatives given as lists of TFNs, e.g. [[[1, 2, 3], ...], ...].
+        Structure of lists is checked and values are parsed at once instead of building nested lists
+
+        Parameters
+        ----------
+            source : str or file
+                Path or opened text file
+
+            dtype : dtype, default=None
+                Floating point data type of values, configured data type if None
+
+        Returns
+        -------
+            ndarray
+                Decision matrix, shape (m, n, 3)
+    """
+    dtype = resolve_dtype(dtype)
+    with _open(source, 'r') as f:
+        text = f.read()
+
+    chars = np.frombuffer(text.encode(), dtype=np.uint8)
+    opening, closing = chars == ord('['), chars == ord(']')
+    depth = np.cumsum(opening.astype(np.int64) - closing)
+    if depth.shape[0] == 0 or depth[-1] != 0 or np.any(depth < 0) or np.max(depth) != 3 \
+            or text.strip()[0] != '[':
+        raise ValueError('JSON should contain list of alternatives given as lists of TFNs')
+
+    # lists opened at the depth of alternatives and TFNs
+    alternatives = opening & (depth == 2)
+    tfns = opening & (depth == 3)
+    m = int(np.sum(alternatives))
+    counts = np.bincount(np.cumsum(alternatives)[tfns] - 1, minlength=m)
+    if m == 0 or np.any(counts != counts[0]) or counts[0] == 0:
+        raise ValueError('Alternatives should contain the same number of TFNs')
+    # values of each TFN are separated with two commas
+    commas = np.bincount(np.cumsum(tfns)[(chars == ord(',')) & (depth == 3)] - 1, minlength=m * counts[0])
+    if np.any(commas != 2):
+        raise ValueError('TFN matrix elements should all have length of 3')
+
+    try:
+        values = np.array(text.translate(str.maketrans('[],', '   ')).split(), dtype=dtype)
+    except ValueError:
+        raise ValueError('Values of TFNs should be numbers')
+    if values.shape[0] != m * counts[0] * 3:
+        raise ValueError('TFN matrix elements should all have length of 3')
+    return values.reshape(m, counts[0], 3)
+
+
+def write_json(target, matrix):
+    """
+        Writes the decision matrix to JSON file as list of alternatives given as lists of TFNs
+
+        Parameters
+        ----------
+            target : str or file
+                Path or opened text file
+
+            matrix : ndarray
+                Decision matrix / alternatives data.
+                Alternatives are in rows and Criteria are in columns.
+    """
+    matrix = np.asarray(matrix)
+    if matrix.ndim != 3 or matrix.shape[2] != 3:
+        raise ValueError('TFN matrix elements should all have length of 3')
+    with _open(target, 'w') as f:
+        json.dump(matrix.tolist(), f)
+
+
+def write_results(target, preferences, ranking=None, names=None, delimiter=','):
+    """
+        Writes preferences and ranking of alternatives to CSV file, one alternative in each row
+
+        Parameters
+        ----------
+            target : str or file
+                Path or opened text file
+
+            preferences : ndarray or tuple
+                Preferences of alternatives, (m, ) or (k, m) for several preferences, e.g. fVIKOR or arrays of parameters
+
+            ranking : ndarray, default=None
+                Ranking of alternatives with the shape of preferences, not written if None
+
+            names : list, default=None
+                Names of alternatives, 'A1', 'A2', ... if None
+
+            delimiter : str, default=','
+                Separator of cells
+    """
+    preferences = np.atleast_2d(np.asarray(preferences, dtype=float))
+    m = preferences.shape[-1]
+    if preferences.ndim != 2:
+        raise ValueError(f'Preferences should be given as a vector or matrix, not array with shape {preferences.shape}')
+    if names is None:
+        names = [f'A{i + 1}' for i in range(m)]
+    if len(names) != m:
+        raise ValueError(f'Number of names should equal number of alternatives, not {len(names)}, {m}')
+
+    columns = [preferences]
+    header = ['preference'] if preferences.shape[0] == 1 else [f'preference_{k + 1}' for k in range(preferences.shape[0])]
+    if ranking is not None:
+        ranking = np.atleast_2d(np.asarray(ranking))
+        if ranking.shape != preferences.shape:
+            raise ValueError(f'Ranking should have the shape of preferences, not {ranking.shape}')
+        columns.append(ranking)
+        header += ['rank'] if ranking.shape[0] == 1 else [f'rank_{k + 1}' for k in range(ranking.shape[0])]
+
+    with _open(target, 'w') as f:
+        writer = csv.writer(f, delimiter=delimiter, lineterminator='\n')
+        writer.writerow(['alternative'] + header)
+        values = zip(*(c.T.tolist() for c in columns))
+        writer.writerows([name] + [v for row in rows for v in row] for name, rows in zip(names, values))
+
+
+def save(target, matrix, types=None, weights=None):
+    """
+        Saves the decision matrix to .npy file or with criteria types and weights to .npz file
+
+        Parameters
+        ----------
+            target : str
+                Path of .npy or .npz file
+
+            matrix : ndarray
+                Decision matrix / alternatives data.
+                Alternatives are in rows and Criteria are in columns.
+
+            types : ndarray, default=None
+                Types of criteria, 1 profit, -1 cost
+
+            weights : ndarray, default=None
+                Vector of criteria weights in a crisp form or as a TFNs
+    """
+    matrix = np.asarray(matrix)
+    if matrix.ndim != 3 or matrix.shape[2] != 3:
+        raise ValueError('TFN matrix elements should all have length of 3')
+    metadata = {name: np.asarray(value) for name, value in (('types', types), ('weights', weights)) if value is not None}
+    for name, value in metadata.items():
+        if value.shape[0] != matrix.shape[1]:
+            raise ValueError(f'Number of criteria should equal number of {name}, not {matrix.shape[1]}, {value.shape[0]}')
+
+    if str(target).endswith('.npy'):
+        if metadata:
+            raise ValueError('Criteria types and weights can be saved only to .npz file')
+        np.save(target, matrix)
+    else:
+        np.savez(target, matrix=matrix, **metadata)
+
+
+def load(source, mmap_mode=None):
+    """
+        Loads the decision matrix with criteria types and weights saved with save
+
+        Parameters
+        ----------
+            source : str
+                Path of .npy or .npz file
+
+            mmap_mode : str, default=None
+                Memory-map mode of matrix from .npy file, e.g. 'r' for evaluate_chunked
+
+        Returns
+        -------
+            DecisionData
+                Decision matrix, criteria types and weights, None if they were not saved
+    """
+    data = np.load(source, mmap_mode=mmap_mode, allow_pickle=False)
+    if isinstance(data, np.ndarray):
+        return DecisionData(data, None, None)
+    with data:
+        return DecisionData(data['matrix'], data['types'] if 'types' in data else None,
+                            data['weights'] if 'weights' in data else None)
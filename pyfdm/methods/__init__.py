@@ -13,4 +13,16 @@ from .f_vikor import fVIKOR
 from .f_waspas import fWASPAS
 from .f_wpm import fWPM
 from .f_wsm import fWSM
+from .cache import ResultCache, MemoizedMethod, memoize
+from .runner import compare_methods
+from .chunked import evaluate_chunked
+from .incremental import IncrementalEvaluator
+from .dedup import multiplicity_dependence, unique_alternatives
+from .shared import evaluate_shared
+from .result import MethodResult
+from .service import AsyncEvaluator, row_separable
+from .gradients import weights_jacobian
+from .stability import weight_stability
+from .smaa import SMAAResult, smaa, triangular_samples
+from .sweep import SweepResult, sweep
 from .utils import *
@@ -1,8 +1,9 @@
 # Copyright (c) 2022 Jakub Więckowski
 
 import numpy as np
+from ...config import resolve_dtype
 
-def fuzzy(matrix, weights, types, normalization):
+def fuzzy(matrix, weights, types, normalization, trace=None):
     """
         Calculates the alternatives preferences based on Triangular Fuzzy Number extension
 
@@ -21,6 +22,9 @@ def fuzzy(matrix, weights, types, normalization):
             normalization: callable
                 Function used to normalize the decision matrix
                 
+            trace : dict, default=None
+                Dictionary filled with intermediate results if given
+
         Returns
         -------
             ndarray:
@@ -30,7 +34,7 @@ def fuzzy(matrix, weights, types, normalization):
 
     # extended decision matrix
     exmatrix = np.zeros(
-        (matrix.shape[0]+1, matrix.shape[1], matrix.shape[2]), dtype=object)
+        (matrix.shape[0]+1, matrix.shape[1], matrix.shape[2]), dtype=resolve_dtype())
     exmatrix[1:] = matrix
 
     exmatrix[0, :] = np.repeat(np.max(np.max(matrix, axis=0), axis=1), 3).reshape(
@@ -47,4 +51,8 @@ def fuzzy(matrix, weights, types, normalization):
 
     # overall preference
     S = 1/3 * np.sum(np.sum(wmatrix, axis=1), axis=1)
+    # intermediate results
+    if trace is not None:
+        trace.update(nmatrix=nmatrix, S=S)
+
     return S[1:] / S[0]
@@ -0,0 +1,292 @@
+# Copyright (c) 2024 Jakub Więckowski
+
+import hashlib
+import threading
+from collections import OrderedDict, namedtuple
+
+import numpy as np
+from ..config import get_dtype
+
+__all__ = [
+    'ResultCache',
+    'MemoizedMethod',
+    'memoize',
+    'array_digest'
+]
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'max_entries', 'max_bytes', 'entries', 'nbytes'])
+
+
+def array_digest(a):
+    """
+        Calculates a fast digest of the array buffer, shape and data type
+
+        Parameters
+        ----------
+            a : ndarray
+                Array to hash
+
+        Returns
+        -------
+            str
+                Hexadecimal digest of the array
+    """
+    a = np.asarray(a)
+    h = hashlib.blake2b(digest_size=16)
+    h.update(str(a.dtype).encode())
+    h.update(str(a.shape).encode())
+    if a.dtype == object:
+        h.update(repr(a.tolist()).encode())
+    else:
+        h.update(np.ascontiguousarray(a).data)
+    return h.hexdigest()
+
+
+def _key_part(value):
+    # arrays are identified by the content, callables and other hashable objects by themselves
+    if isinstance(value, np.ndarray):
+        return ('ndarray', array_digest(value))
+    if isinstance(value, (list, tuple)):
+        return (type(value).__name__, tuple(_key_part(v) for v in value))
+    if isinstance(value, dict):
+        return ('dict', tuple(sorted((k, _key_part(v)) for k, v in value.items())))
+    try:
+        hash(value)
+    except TypeError:
+        return ('repr', repr(value))
+    return value
+
+
+def _nbytes(value):
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, (list, tuple)):
+        return sum(_nbytes(v) for v in value)
+    return 0
+
+
+def _copy(value):
+    if isinstance(value, np.ndarray):
+        return value.copy()
+    if isinstance(value, tuple):
+        return tuple(_copy(v) for v in value)
+    if isinstance(value, list):
+        return [_copy(v) for v in value]
+    return value
+
+
+class ResultCache():
+    def __init__(self, max_entries=128, max_bytes=None):
+        """
+            Creates thread-safe Least Recently Used cache for the methods results
+
+            Parameters
+            ----------
+                max_entries: int, default=128
+                    Maximum number of stored results
+
+                max_bytes: int, default=None
+                    Maximum number of bytes occupied by stored results, no limit if None
+
+        """
+        if max_entries is not None and max_entries < 1:
+            raise ValueError('Maximum number of entries should be positive')
+        if max_bytes is not None and max_bytes < 0:
+            raise ValueError('Maximum number of bytes should not be negative')
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.nbytes = 0
+        self.__entries = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.__entries)
+
+    def __contains__(self, key):
+        with self.__lock:
+            return key in self.__entries
+
+    def get(self, key, default=None):
+        """
+            Returns the stored result and marks it as recently used
+
+            Parameters
+            ----------
+                key : hashable
+                    Key of the result
+
+                default : object, default=None
+                    Value returned if the key is not stored
+
+            Returns
+            ----------
+                object:
+                    Copy of the stored result or default value
+        """
+        with self.__lock:
+            try:
+                value = self.__entries[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self.__entries.move_to_end(key)
+            self.hits += 1
+        return _copy(value)
+
+    def put(self, key, value):
+        """
+            Stores the result and evicts the least recently used results exceeding limits
+
+            Parameters
+            ----------
+                key : hashable
+                    Key of the result
+
+                value : object
+                    Result to store, ndarray or tuple of ndarrays
+        """
+        value = _copy(value)
+        size = _nbytes(value)
+
+        with self.__lock:
+            if self.max_bytes is not None and size > self.max_bytes:
+                return
+            if key in self.__entries:
+                self.nbytes -= _nbytes(self.__entries.pop(key))
+            self.__entries[key] = value
+            self.nbytes += size
+
+            while (self.max_entries is not None and len(self.__entries) > self.max_entries) or \
+                    (self.max_bytes is not None and self.nbytes > self.max_bytes):
+                _, evicted = self.__entries.popitem(last=False)
+                self.nbytes -= _nbytes(evicted)
+
+    def clear(self):
+        """
+            Removes all stored results and resets the counters
+        """
+        with self.__lock:
+            self.__entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.nbytes = 0
+
+    def info(self):
+        """
+            Returns the cache statistics
+
+            Returns
+            ----------
+                CacheInfo:
+                    Hits, misses, limits, number of entries and occupied bytes
+        """
+        with self.__lock:
+            return CacheInfo(self.hits, self.misses, self.max_entries, self.max_bytes, len(self.__entries), self.nbytes)
+
+
+class MemoizedMethod():
+    def __init__(self, method, cache=None):
+        """
+            Wraps the method object to reuse the results for repeated identical evaluations
+
+            Parameters
+            ----------
+                method: object
+                    Method object from pyfdm.methods
+
+                cache: ResultCache, default=None
+                    Cache shared between wrapped methods, new cache is created if None
+
+        """
+        self.method = method
+        self.cache = cache if cache is not None else ResultCache()
+
+    def key(self, matrix, weights, types=None, *args, **kwargs):
+        """
+            Builds the cache key from the input data and the method configuration
+
+            Returns
+            ----------
+                tuple:
+                    Key identifying the evaluation
+        """
+        # private attributes (e.g. ranking direction) and results are not part of the configuration
+        config = tuple(sorted((name, _key_part(value)) for name, value in vars(self.method).items()
+                              if name != 'preferences' and not name.startswith('_')))
+        return (
+            type(self.method),
+            config,
+            get_dtype(),
+            _key_part(np.asarray(matrix)),
+            _key_part(np.asarray(weights)),
+            _key_part(None if types is None else np.asarray(types)),
+            _key_part(args),
+            _key_part(kwargs),
+        )
+
+    def __call__(self, matrix, weights, types=None, *args, **kwargs):
+        """
+            Calculates the alternatives preferences or returns the stored ones
+
+            Parameters
+            ----------
+                matrix : ndarray
+                    Decision matrix / alternatives data.
+                    Alternatives are in rows and Criteria are in columns.
+
+                weights : ndarray
+                    Vector of criteria weights
+
+                types : ndarray
+                    Types of criteria, 1 profit, -1 cost
+
+            Returns
+            ----------
+                ndarray:
+                    Preference calculated for alternatives
+        """
+        key = self.key(matrix, weights, types, *args, **kwargs)
+        preferences = self.cache.get(key)
+        if preferences is None:
+            preferences = self.method(matrix, weights, types, *args, **kwargs)
+            self.cache.put(key, preferences)
+        else:
+            self.method.preferences = preferences
+        return self.method.preferences
+
+    def __getattr__(self, name):
+        # rank() and configuration are taken from the wrapped method
+        if name == 'method':
+            raise AttributeError(name)
+        return getattr(self.method, name)
+
+
+def memoize(method, max_entries=128, max_bytes=None, cache=None):
+    """
+        Enables memoization of the method results in the bounded LRU cache
+
+        Parameters
+        ----------
+            method: object
+                Method object from pyfdm.methods
+
+            max_entries: int, default=128
+                Maximum number of stored results, used if cache is not given
+
+            max_bytes: int, default=None
+                Maximum number of bytes occupied by stored results, used if cache is not given
+
+            cache: ResultCache, default=None
+                Existing cache which can be shared between methods
+
+        Returns
+        -------
+            MemoizedMethod
+                Method object wrapped with cache
+    """
+    if cache is None:
+        cache = ResultCache(max_entries, max_bytes)
+    return MemoizedMethod(method, cache)
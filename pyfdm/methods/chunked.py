@@ -0,0 +1,123 @@
+# Copyright (c) 2024 Jakub Więckowski
+
+import os
+
+import numpy as np
+from .f_moora import fMOORA
+from .f_topsis import fTOPSIS
+from .f_wpm import fWPM
+from .f_wsm import fWSM
+from .moora.fuzzy import fuzzy as moora
+from .topsis.fuzzy import fuzzy as topsis
+from .wpm.fuzzy import fuzzy as wpm
+from .wsm.fuzzy import fuzzy as wsm
+from .utils.normalizations import NormalizationStatistics, apply_normalization
+from .validator import Validator
+from ..config import resolve_dtype, use_dtype
+from ..helpers import normalize_weights
+
+__all__ = [
+    'evaluate_chunked'
+]
+
+
+def _bind(normalization, statistics, dtype):
+    # normalization of chunk with statistics of the whole matrix
+    def normalize(matrix, types=None, *args):
+        return apply_normalization(normalization, statistics, matrix, types, dtype)
+
+    return normalize
+
+
+def _scorer(method, weights, types, normalization):
+    if isinstance(method, fTOPSIS):
+        weights = normalize_weights(weights)
+        return lambda chunk: topsis(chunk, weights, types, normalization, method.distance)
+    if isinstance(method, fMOORA):
+        return lambda chunk: moora(chunk, weights, types, normalization)
+    if isinstance(method, fWSM):
+        return lambda chunk: wsm(chunk, weights, normalization, method.defuzzify)
+    if isinstance(method, fWPM):
+        return lambda chunk: wpm(chunk, weights, normalization, method.defuzzify)
+    raise ValueError(f'{type(method).__name__} method cannot be evaluated in chunks')
+
+
+def evaluate_chunked(method, matrix, weights, types=None, out=None, chunk_size=65536, dtype=None):
+    """
+        Calculates the alternatives preferences for the decision matrix which does not fit in memory.
+        Statistics of criteria required by the normalization are gathered in the first pass over chunks,
+        the alternatives are assessed chunk by chunk in the second pass.
+        Available for fTOPSIS, fMOORA, fWSM and fWPM methods
+
+        Parameters
+        ----------
+            method : object
+                Method object from pyfdm.methods
+
+            matrix : ndarray or TFNCodebook
+                Decision matrix / alternatives data, e.g. np.memmap, array loaded with mmap_mode or encoded matrix.
+                Alternatives are in rows and Criteria are in columns.
+
+            weights : ndarray
+                Vector of criteria weights
+
+            types : ndarray, default=None
+                Types of criteria, 1 profit, -1 cost
+
+            out : ndarray or str, default=None
+                Array (e.g. np.memmap) for preferences or path of created .npy file, new array if None
+
+            chunk_size : int, default=65536
+                Number of alternatives processed at once
+
+            dtype : dtype, default=None
+                Floating point data type used in computations, configured data type if None
+
+        Returns
+        -------
+            ndarray
+                Preference calculated for alternatives
+    """
+    # criteria types of all methods are validated only against the number of criteria
+    Validator.validate_input(matrix, weights, None if types is None else np.asarray(types))
+    Validator.validate_tfn_matrix(matrix)
+    Validator.validate_weights(weights)
+    if chunk_size < 1:
+        raise ValueError(f'Chunk size should be positive, not {chunk_size}')
+
+    dtype = resolve_dtype(dtype)
+    weights = np.asarray(weights, dtype=dtype)
+    types = None if types is None else np.asarray(types)
+    m = matrix.shape[0]
+
+    if out is None:
+        out = np.empty(m, dtype=dtype)
+    elif isinstance(out, (str, os.PathLike)):
+        out = np.lib.format.open_memmap(out, mode='w+', dtype=dtype, shape=(m, ))
+    elif out.shape != (m, ):
+        raise ValueError(f'Output array should have shape {(m, )}, not {out.shape}')
+
+    chunks = [slice(start, min(start + chunk_size, m)) for start in range(0, m, chunk_size)]
+
+    normalization = getattr(method, 'normalization', None)
+    if normalization is not None:
+        # fails early for normalizations which cannot be calculated from statistics
+        apply_normalization(normalization, NormalizationStatistics(matrix.shape[1], dtype, normalization),
+                            np.zeros((0, ) + matrix.shape[1:]), np.ones(matrix.shape[1]), dtype)
+        if hasattr(matrix, 'statistics'):
+            # statistics of encoded matrices are calculated from counts of terms
+            statistics = matrix.statistics(dtype)
+        else:
+            statistics = NormalizationStatistics(matrix.shape[1], dtype, normalization)
+            for chunk in chunks:
+                statistics.update(matrix[chunk])
+        normalization = _bind(normalization, statistics, dtype)
+
+    score = _scorer(method, weights, types, normalization)
+    with use_dtype(dtype):
+        for chunk in chunks:
+            out[chunk] = score(np.asarray(matrix[chunk], dtype=dtype))
+
+    if isinstance(out, np.memmap):
+        out.flush()
+    return out
@@ -1,8 +1,9 @@
-# Copyright (c) 2023 Jakub Więckowski
+# Copyright (c) 2023-2024 Jakub Więckowski
 
 import numpy as np
+from ..utils.defuzzifications import tfn_defuzzify
 
-def fuzzy(matrix, weights, types, normalization, defuzzify, d=0.5):
+def fuzzy(matrix, weights, types, normalization, defuzzify, d=0.5, trace=None):
     """
         Calculates the alternatives preferences based on Triangular Fuzzy Number extension
 
@@ -24,12 +25,16 @@ def fuzzy(matrix, weights, types, normalization, defuzzify, d=0.5):
             defuzzify: callable
                 Function used to defuzzify the TFN into crisp value
 
-            d: float, default=0.5
-                Parameter included in the assessment score, determined by decision-maker
+            d: float or ndarray, default=0.5
+                Parameter included in the assessment score, determined by decision-maker.
+                Preferences are calculated for each value if array is given
+            trace : dict, default=None
+                Dictionary filled with intermediate results if given
+
         Returns
         -------
             ndarray:
-                Crisp preferences of alternatives
+                Crisp preferences of alternatives, (len(d), m) if array of parameters is given
 
     """
 
@@ -48,14 +53,20 @@ def fuzzy(matrix, weights, types, normalization, defuzzify, d=0.5):
     # fuzzy evaluation score
     fa = np.array([(P[i, :] + S[i, :]) / (np.sum(P + S, axis=0)[..., ::-1]) for i in range(matrix.shape[0])])
     fb = np.array([S[i, :]/np.min(S) + P[i, :]/np.min(P) for i in range(matrix.shape[0])])
-    fc = np.array([(d*S[i, :] + (1-d) * P[i, :]) / (d * np.max(S) + (1-d) * np.max(P)) for i in range(matrix.shape[0])])
+    # score depending on the parameter is calculated for each value of d, (len(d), m, 3) if array is given
+    dc = np.asarray(d, dtype=S.dtype).reshape(np.shape(d) + (1, 1))
+    fc = (dc*S + (1-dc) * P) / (dc * np.max(S) + (1-dc) * np.max(P))
 
     # fuzzy net assessment scores
     nfa = np.array([defuzzify(f) for f in fa])
     nfb = np.array([defuzzify(f) for f in fb])
-    nfc = np.array([defuzzify(f) for f in fc])
+    nfc = tfn_defuzzify(defuzzify, fc)
 
     # # crisp assessment
     f = (nfa * nfb * nfc) * (1/3) + ( (nfa + nfb + nfc) / 3)
 
+    # intermediate results
+    if trace is not None:
+        trace.update(nmatrix=nmatrix, S=S, P=P, fa=fa, fb=fb, fc=fc)
+
     return f
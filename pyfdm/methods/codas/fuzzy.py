@@ -1,8 +1,66 @@
-# Copyright (c) 2022 Jakub Więckowski
+# Copyright (c) 2022-2024 Jakub Więckowski
 
 import numpy as np
+from ...config import resolve_dtype
+from ..utils.distances import tfn_distances
+from ..utils.jit import jit_distances, codas_assessment
 
-def fuzzy(matrix, weights, types, normalization, distance_1, distance_2, tau):
+# calculations of assessment scores
+ALGORITHMS = ('pairwise', 'sorted')
+
+
+def _sorted_assessment(D1, D2, tau):
+    """
+        Calculates assessment scores in O(m log m) using alternatives sorted by the first distance.
+        Alternatives k with |D1_i - D1_k| < tau form a window in the sorted order, and the sums over
+        the remaining alternatives are obtained from prefix sums
+
+        Parameters
+        ----------
+            D1 : ndarray
+                Distances from fuzzy negative solution
+
+            D2 : ndarray
+                Distances from fuzzy negative solution
+
+            tau: float
+                Threshold parameter
+
+        Returns
+        -------
+            ndarray:
+                Assessment scores of alternatives
+    """
+    m = D1.shape[0]
+    order = np.argsort(D1, kind='stable')
+    s1, s2 = D1[order], D2[order]
+    prefix = np.concatenate(([0], np.cumsum(s2)))
+
+    # window [lo, hi) of alternatives below the threshold
+    lo = np.searchsorted(s1, D1 - tau, side='right')
+    hi = np.maximum(np.searchsorted(s1, D1 + tau, side='left'), lo)
+
+    # bounds are moved to agree with the threshold test on computed differences
+    def below(k):
+        return np.abs(D1 - s1[np.clip(k, 0, m - 1)]) < tau
+
+    changed = True
+    while changed:
+        lo_down = (lo > 0) & below(lo - 1)
+        lo_up = ~lo_down & (lo < hi) & ~below(lo)
+        hi_up = (hi < m) & below(hi)
+        hi_down = ~hi_up & (hi > lo) & ~below(hi - 1)
+        lo = lo - lo_down + lo_up
+        hi = hi + hi_up - hi_down
+        changed = np.any(lo_down | lo_up | hi_up | hi_down)
+
+    count = m - (hi - lo)
+    D2_sum = prefix[-1] - (prefix[hi] - prefix[lo])
+
+    return (m * D1 - np.sum(D1)) + (count * D2 - D2_sum)
+
+
+def fuzzy(matrix, weights, types, normalization, distance_1, distance_2, tau, algorithm='pairwise', trace=None, backend='numpy'):
     """
         Calculates the alternatives preferences based on Triangular Fuzzy Number extension
 
@@ -27,37 +85,27 @@ def fuzzy(matrix, weights, types, normalization, distance_1, distance_2, tau):
             distance_2: callable
                 Function used to calculate distance form fuzzy negative solution
 
-            tau: float
-                Threshold parameter
+            tau: float or ndarray
+                Threshold parameter, preferences are calculated for each value if array is given
+
+            algorithm: str, default='pairwise'
+                'pairwise' builds the relative assessment matrix, 'sorted' calculates the same scores in O(m log m)
+
+            trace : dict, default=None
+                Dictionary filled with intermediate results if given
+
+            backend : str, default='numpy'
+                'numba' for compiled kernels, 'numpy' for NumPy implementation
 
         Returns
         -------
             ndarray:
-                Crisp preferences of alternatives
+                Crisp preferences of alternatives, (len(tau), m) if array of threshold parameters is given
 
     """
 
-    def _psi(x, tau=0.02):
-        """
-            Threshold function
-
-            Parameters
-            ----------
-                x: float
-                    Value to assess
-
-                tau: float, default=0.02
-                    Threshold parameter
-
-            Returns
-            -------
-                int
-                    0 if absolute value of x below threshold, otherwise 1
-        """
-        # tau from 0.01 to 0.05
-        if np.abs(x) >= tau:
-            return 1
-        return 0
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f'Algorithm should be one of {list(ALGORITHMS)}, not {algorithm}')
 
     # normalized decision matrix
     nmatrix = normalization(matrix, types)
@@ -72,21 +120,31 @@ def fuzzy(matrix, weights, types, normalization, distance_1, distance_2, tau):
     NS = np.min(wmatrix, axis=0)
 
     # distances from fuzzy negative solution
-    D1, D2 = np.zeros((matrix.shape[0], ), dtype=object), np.zeros(
-        (matrix.shape[0], ), dtype=object)
-    for i in range(matrix.shape[0]):
-        D1[i] = np.sum([distance_1(wmatrix[i, j], NS[j])
-                       for j in range(matrix.shape[1])])
-        D2[i] = np.sum([distance_2(wmatrix[i, j], NS[j])
-                       for j in range(matrix.shape[1])])
-
-    # relative assessment matrix
-    RA = np.zeros((matrix.shape[0], matrix.shape[0]), dtype=object)
-    for i in range(RA.shape[0]):
-        for j in range(RA.shape[1]):
-            RA[i, j] = (D1[i] - D1[j]) + \
-                (_psi(D1[i] - D1[j], tau) * (D2[i] - D2[j]))
-
-    # assessment score
-    AS = np.sum(RA, axis=1)
-    return AS
+    distances = jit_distances if backend == 'numba' else tfn_distances
+    D1 = np.sum(distances(distance_1, wmatrix, NS), axis=1).astype(resolve_dtype())
+    D2 = np.sum(distances(distance_2, wmatrix, NS), axis=1).astype(resolve_dtype())
+
+    # intermediate results
+    if trace is not None:
+        trace.update(nmatrix=nmatrix, wmatrix=wmatrix, NS=NS, D1=D1, D2=D2)
+
+    if algorithm == 'pairwise' and backend != 'numba':
+        # relative assessment matrix without the threshold function, psi is 1 if |D1_i - D1_k| >= tau
+        diff_1 = D1[:, None] - D1[None, :]
+        diff_2 = D2[:, None] - D2[None, :]
+        abs_diff = np.abs(diff_1)
+
+    def assessment(t):
+        if algorithm == 'sorted':
+            return _sorted_assessment(D1, D2, t)
+        if backend == 'numba':
+            return codas_assessment(D1, D2, t)
+        RA = diff_1 + (abs_diff >= t) * diff_2
+        # assessment score
+        return np.sum(RA, axis=1)
+
+    # distances are calculated once for all values of threshold parameter
+    if np.ndim(tau) == 0:
+        return assessment(tau)
+    AS = np.array([assessment(t) for t in np.ravel(tau)], dtype=resolve_dtype())
+    return AS.reshape(np.shape(tau) + D1.shape)
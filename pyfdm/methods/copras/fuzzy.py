@@ -1,8 +1,9 @@
 # Copyright (c) 2022 Jakub Więckowski
 
 import numpy as np
+from ...config import resolve_dtype
 
-def fuzzy(matrix, weights, types, normalization):
+def fuzzy(matrix, weights, types, normalization, trace=None):
     """
         Calculates the alternatives preferences based on Triangular Fuzzy Number extension
 
@@ -24,6 +25,9 @@ def fuzzy(matrix, weights, types, normalization):
             a : float
                 Threshold parameter
 
+            trace : dict, default=None
+                Dictionary filled with intermediate results if given
+
         Returns
         -------
             ndarray:
@@ -45,10 +49,14 @@ def fuzzy(matrix, weights, types, normalization):
     Tm = np.sum(wmatrix[:, types == -1], axis=1)
 
     # distance
-    Q = Tp + (np.sum(Tm)) / (Tm * np.sum(np.divide(1,Tm.astype(float))))
-    if np.isnan(np.max(Q.astype(float).ravel())):
-        Q = np.nan_to_num(Q.ravel().astype(float)).reshape(Tp.shape)
+    Q = Tp + (np.sum(Tm)) / (Tm * np.sum(np.divide(1,Tm.astype(resolve_dtype()))))
+    if np.isnan(np.max(Q.astype(resolve_dtype()).ravel())):
+        Q = np.nan_to_num(Q.ravel().astype(resolve_dtype())).reshape(Tp.shape)
 
     # defuzzified values
     Q = Q[:, 0] + ((Q[:, 2] - Q[:, 0]) - (Q[:, 1] - Q[:, 2])) / 3
+    # intermediate results
+    if trace is not None:
+        trace.update(nmatrix=nmatrix, Tp=Tp, Tm=Tm)
+
     return Q / np.max(Q) 
\ No newline at end of file
@@ -0,0 +1,152 @@
+# Copyright (c) 2024 Jakub Więckowski
+
+import numpy as np
+from .utils.normalizations import sum_normalization, vector_normalization, sqrt_normalization
+
+__all__ = [
+    'multiplicity_dependence',
+    'unique_alternatives',
+    'deduplicate',
+    'scatter',
+    'scatter_rows'
+]
+
+# methods aggregating statistics over all alternatives, their results change when alternatives are repeated
+MULTIPLICITY_METHODS = {
+    'fCOCOSO': 'sums of comparability sequences over all alternatives',
+    'fCODAS': 'assessment summed over pairs of alternatives',
+    'fCOPRAS': 'sums of cost ratings over all alternatives',
+    'fEDAS': 'average solution of all alternatives',
+    'fMABAC': 'geometric mean of all alternatives in border approximation area',
+    'fMAIRCA': 'selection probability equal to 1/m',
+    'fWASPAS': 'sums of WSM and WPM scores over all alternatives',
+}
+
+# normalizations with statistics summed over all alternatives
+MULTIPLICITY_NORMALIZATIONS = {
+    sum_normalization: 'sums of criteria values',
+    vector_normalization: 'L2 norms of criteria values',
+    sqrt_normalization: 'L2 norms of criteria values',
+}
+
+
+def multiplicity_dependence(method):
+    """
+        Checks if the preferences calculated with the method depend on the number of repeated alternatives
+
+        Parameters
+        ----------
+            method : object
+                Method object from pyfdm.methods
+
+        Returns
+        -------
+            str
+                Description of the statistic depending on repeated alternatives, None if preferences do not depend on them
+    """
+    name = type(method).__name__
+    if name in MULTIPLICITY_METHODS:
+        return f'{name} uses {MULTIPLICITY_METHODS[name]}'
+    normalization = getattr(method, 'normalization', None)
+    if normalization in MULTIPLICITY_NORMALIZATIONS:
+        return f'{normalization.__name__} uses {MULTIPLICITY_NORMALIZATIONS[normalization]}'
+    return None
+
+
+def unique_alternatives(matrix):
+    """
+        Finds unique alternatives of the decision matrix
+
+        Parameters
+        ----------
+            matrix : ndarray
+                Decision matrix / alternatives data.
+                Alternatives are in rows and Criteria are in columns.
+
+        Returns
+        -------
+            ndarray
+                Decision matrix with unique alternatives
+
+            ndarray
+                Indices of unique alternatives reconstructing the given matrix
+    """
+    matrix = np.asarray(matrix)
+    rows = np.ascontiguousarray(matrix.reshape(matrix.shape[0], -1))
+    # rows are compared as raw bytes, so sorting does not depend on the number of criteria
+    keys = rows.view(np.dtype((np.void, rows.dtype.itemsize * rows.shape[1])))
+    _, index, inverse = np.unique(keys.ravel(), return_index=True, return_inverse=True)
+    return matrix[index], inverse.ravel()
+
+
+def deduplicate(method, matrix):
+    """
+        Finds unique alternatives which can be assessed instead of the whole decision matrix
+
+        Parameters
+        ----------
+            method : object
+                Method object from pyfdm.methods
+
+            matrix : ndarray
+                Decision matrix / alternatives data.
+                Alternatives are in rows and Criteria are in columns.
+
+        Returns
+        -------
+            ndarray
+                Decision matrix with unique alternatives
+
+            ndarray
+                Indices of unique alternatives reconstructing the given matrix
+    """
+    reason = multiplicity_dependence(method)
+    if reason is not None:
+        raise ValueError(f'Alternatives cannot be deduplicated, {reason}')
+    return unique_alternatives(matrix)
+
+
+def scatter(preferences, inverse):
+    """
+        Assigns preferences of unique alternatives to all alternatives
+
+        Parameters
+        ----------
+            preferences : ndarray or tuple
+                Preferences of unique alternatives, alternatives in the last dimension
+
+            inverse : ndarray
+                Indices of unique alternatives reconstructing the decision matrix
+
+        Returns
+        -------
+            ndarray or tuple
+                Preferences of all alternatives
+    """
+    if isinstance(preferences, tuple):
+        return tuple(p[..., inverse] for p in preferences)
+    return preferences[..., inverse]
+
+
+def scatter_rows(values, inverse, offset=0):
+    """
+        Assigns rows of intermediate results of unique alternatives to all alternatives
+
+        Parameters
+        ----------
+            values : ndarray
+                Intermediate results with unique alternatives in rows
+
+            inverse : ndarray
+                Indices of unique alternatives reconstructing the decision matrix
+
+            offset : int, default=0
+                Number of rows preceding the alternatives, e.g. optimal alternative of fARAS, kept unchanged
+
+        Returns
+        -------
+            ndarray
+                Intermediate results of all alternatives
+    """
+    return np.asarray(values)[np.concatenate([np.arange(offset), inverse + offset])]
+
@@ -1,8 +1,10 @@
-# Copyright (c) 2022 Jakub Więckowski
+# Copyright (c) 2022-2024 Jakub Więckowski
 
 import numpy as np
+from ...config import resolve_dtype
+from ..utils.jit import JIT_DEFUZZIFICATIONS, edas_distances
 
-def fuzzy(matrix, weights, types, defuzzify):
+def fuzzy(matrix, weights, types, defuzzify, trace=None, backend='numpy'):
     """
         Calculates the alternatives preferences based on Triangular Fuzzy Number extension
 
@@ -20,6 +22,13 @@ def fuzzy(matrix, weights, types, defuzzify):
 
             defuzzify: callable
                 Function used to defuzzify the TFN into crisp value
+
+            trace : dict, default=None
+                Dictionary filled with intermediate results if given
+
+            backend : str, default='numpy'
+                'numba' for compiled kernels, 'numpy' for NumPy implementation
+
         Returns
         -------
             ndarray:
@@ -50,19 +59,22 @@ def fuzzy(matrix, weights, types, defuzzify):
     k = np.array([defuzzify(a) for a in av_matrix])
 
     # positive and negative distances from average
-    pda, nda = np.zeros((matrix.shape)), np.zeros((matrix.shape))
-    for i in range(matrix.shape[0]):
-        for j in range(matrix.shape[1]):
-            if types[j] == 1:
-                pda[i, j] = psi(
-                    matrix[i, j] - av_matrix[j][..., ::-1]) / k[j]
-                nda[i, j] = psi(
-                    av_matrix[j] - matrix[i, j][..., ::-1]) / k[j]
-            else:
-                pda[i, j] = psi(
-                    av_matrix[j] - matrix[i, j][..., ::-1]) / k[j]
-                nda[i, j] = psi(
-                    matrix[i, j] - av_matrix[j][..., ::-1]) / k[j]
+    pda, nda = np.zeros(matrix.shape, dtype=resolve_dtype()), np.zeros(matrix.shape, dtype=resolve_dtype())
+    if backend == 'numba' and defuzzify in JIT_DEFUZZIFICATIONS:
+        edas_distances(matrix, av_matrix, k, np.asarray(types), JIT_DEFUZZIFICATIONS[defuzzify], pda, nda)
+    else:
+        for i in range(matrix.shape[0]):
+            for j in range(matrix.shape[1]):
+                if types[j] == 1:
+                    pda[i, j] = psi(
+                        matrix[i, j] - av_matrix[j][..., ::-1]) / k[j]
+                    nda[i, j] = psi(
+                        av_matrix[j] - matrix[i, j][..., ::-1]) / k[j]
+                else:
+                    pda[i, j] = psi(
+                        av_matrix[j] - matrix[i, j][..., ::-1]) / k[j]
+                    nda[i, j] = psi(
+                        matrix[i, j] - av_matrix[j][..., ::-1]) / k[j]
 
     if weights.ndim == 1:
         weights = np.repeat(weights, 3).reshape((len(weights), 3))
@@ -77,4 +89,8 @@ def fuzzy(matrix, weights, types, defuzzify):
 
     # fuzzy appraisal score
     a = (nsp + nsn) / 2
+    # intermediate results
+    if trace is not None:
+        trace.update(av_matrix=av_matrix, pda=pda, nda=nda, sp=sp, sn=sn)
+
     return np.array([defuzzify(alt) for alt in a])
@@ -1,14 +1,18 @@
-# Copyright (c) 2022 Jakub Więckowski
+# Copyright (c) 2022-2024 Jakub Więckowski
 
 from .aras.fuzzy import fuzzy
 from .utils.normalizations import sum_normalization
-from ..helpers import rank
 
-from .validator import Validator
+from .result import EvaluationMixin
 
 
-class fARAS():
-    def __init__(self, normalization=sum_normalization):
+class fARAS(EvaluationMixin):
+    # intermediate results with alternatives in rows, scattered to repeated alternatives
+    _trace_rows = ('nmatrix', 'S')
+    # row of the optimal alternative precedes the alternatives
+    _trace_offset = 1
+
+    def __init__(self, normalization=sum_normalization, deduplicate=False):
         """
             Create fuzzy ARAS method object with sum normalization function
 
@@ -16,12 +20,16 @@ class fARAS():
             ----------
                     normalization: callable
                             Function used to calculate normalized decision matrix
+
+                    deduplicate: bool, default=False
+                            Assess only unique alternatives and assign their preferences to repeated ones
         """
 
         self.normalization = normalization
-        self.__descending = True
+        self.deduplicate = deduplicate
+        self._descending = True
 
-    def __call__(self, matrix, weights, types, *args, **kwargs):
+    def __call__(self, matrix, weights, types, *args, dtype=None, **kwargs):
         """
             Calculates the alternatives preferences
 
@@ -37,30 +45,17 @@ class fARAS():
                 types : ndarray
                     Types of criteria, 1 profit, -1 cost
 
+                dtype : dtype, default=None
+                    Floating point data type used in computations, configured data type if None
+
             Returns
             ----------
                 ndarray:
                     Preference calculated for alternatives. Greater values are placed higher in ranking
 
         """
-        # validate data
-        Validator.fuzzy_validation(matrix, weights)
-
-        self.preferences = fuzzy(matrix, weights, types, self.normalization).astype(float)
+        self.preferences = self._solve(matrix, weights, types, *args, dtype=dtype, **kwargs)
         return self.preferences
 
-    def rank(self):
-        """
-            Calculates the alternatives ranking based on the obtained preferences
-
-            Returns
-            ----------
-                ndarray:
-                    Ranking of alternatives
-        """
-        try:
-            return rank(self.preferences, self.__descending)
-        except AttributeError:
-            raise AttributeError('Cannot calculate ranking before assessment')
-        except:
-            raise ValueError('Error occurred in ranking calculation')
\ No newline at end of file
+    def _assess(self, matrix, weights, types, *args, trace=None, **kwargs):
+        return fuzzy(matrix, weights, types, self.normalization, trace=trace)
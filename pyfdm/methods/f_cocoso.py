@@ -1,14 +1,13 @@
-# Copyright (c) 2023 Jakub Więckowski
+# Copyright (c) 2023-2024 Jakub Więckowski
 
 from .cocoso.fuzzy import fuzzy
 from .utils.normalizations import cocoso_normalization
 from .utils.defuzzifications import mean_defuzzification
-from ..helpers import rank
 
-from .validator import Validator
+from .result import EvaluationMixin
 
 
-class fCOCOSO():
+class fCOCOSO(EvaluationMixin):
     def __init__(self, normalization=cocoso_normalization, defuzzify=mean_defuzzification):
         """
             Create fuzzy ARAS method object with sum normalization function
@@ -24,9 +23,9 @@ class fCOCOSO():
 
         self.normalization = normalization
         self.defuzzify = defuzzify
-        self.__descending = True
+        self._descending = True
 
-    def __call__(self, matrix, weights, types, d=0.5, *args, **kwargs):
+    def __call__(self, matrix, weights, types, d=0.5, *args, dtype=None, **kwargs):
         """
             Calculates the alternatives preferences
 
@@ -42,32 +41,21 @@ class fCOCOSO():
                 types : ndarray
                     Types of criteria, 1 profit, -1 cost
 
-                d: float, default=0.5
-                    Parameter included in the assessment score, determined by decision-maker
+                d: float or ndarray, default=0.5
+                    Parameter included in the assessment score, determined by decision-maker.
+                    Preferences are calculated for each value if array is given
+                dtype : dtype, default=None
+                    Floating point data type used in computations, configured data type if None
+
             Returns
             ----------
                 ndarray:
-                    Preference calculated for alternatives. Greater values are placed higher in ranking
+                    Preference calculated for alternatives. Greater values are placed higher in ranking.
+                    Preferences for values of parameter are in rows if array is given
 
         """
-        # validate data
-        Validator.fuzzy_validation(matrix, weights)
-
-        self.preferences = fuzzy(matrix, weights, types, self.normalization, self.defuzzify, d).astype(float)
+        self.preferences = self._solve(matrix, weights, types, d, *args, dtype=dtype, **kwargs)
         return self.preferences
 
-    def rank(self):
-        """
-            Calculates the alternatives ranking based on the obtained preferences
-
-            Returns
-            ----------
-                ndarray:
-                    Ranking of alternatives
-        """
-        try:
-            return rank(self.preferences, self.__descending)
-        except AttributeError:
-            raise AttributeError('Cannot calculate ranking before assessment')
-        except:
-            raise ValueError('Error occurred in ranking calculation')
\ No newline at end of file
+    def _assess(self, matrix, weights, types, d=0.5, *args, trace=None, **kwargs):
+        return fuzzy(matrix, weights, types, self.normalization, self.defuzzify, d, trace=trace)
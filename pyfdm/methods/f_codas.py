@@ -1,15 +1,15 @@
-# Copyright (c) 2022 Jakub Więckowski
+# Copyright (c) 2022-2024 Jakub Więckowski
 
-from .codas.fuzzy import fuzzy
+from .codas.fuzzy import fuzzy, ALGORITHMS
 from .utils.normalizations import max_normalization
 from .utils.distances import euclidean_distance, hamming_distance
-from ..helpers import rank
 
-from .validator import Validator
+from .result import EvaluationMixin
+from .utils.jit import resolve_backend
 
 
-class fCODAS():
-    def __init__(self, normalization=max_normalization, distance_1=euclidean_distance, distance_2=hamming_distance):
+class fCODAS(EvaluationMixin):
+    def __init__(self, normalization=max_normalization, distance_1=euclidean_distance, distance_2=hamming_distance, algorithm='pairwise', backend='auto'):
         """
             Create fuzzy CODAS method object with max normalization function and Euclidean and Hamming distances metrics
 
@@ -24,14 +24,25 @@ class fCODAS():
                 distance_2: callable
                     Function used to calculate distance form fuzzy negative solution
 
+                algorithm: str, default='pairwise'
+                    Calculation of assessment scores, 'pairwise' with relative assessment matrix or 'sorted' in O(m log m) for large number of alternatives
+
+                backend: str, default='auto'
+                    'numba' for compiled kernels, 'numpy' for NumPy implementation, 'auto' for compiled kernels if numba is installed
+
         """
 
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f'Algorithm should be one of {list(ALGORITHMS)}, not {algorithm}')
+
         self.normalization = normalization
         self.distance_1 = distance_1
         self.distance_2 = distance_2
-        self.__descending = True
+        self.algorithm = algorithm
+        self.backend = resolve_backend(backend)
+        self._descending = True
 
-    def __call__(self, matrix, weights, types, tau=0.02, *args, **kwargs):
+    def __call__(self, matrix, weights, types, tau=0.02, *args, dtype=None, **kwargs):
         """
             Calculates the alternatives preferences
 
@@ -47,32 +58,20 @@ class fCODAS():
                 types : ndarray
                     Types of criteria, 1 profit, -1 cost
 
-                tau: float, default = 0.02
-                    Threshold parameter
+                tau: float or ndarray, default = 0.02
+                    Threshold parameter, preferences are calculated for each value if array is given
+
+                dtype : dtype, default=None
+                    Floating point data type used in computations, configured data type if None
 
             Returns
             ----------
                 ndarray:
-                    Preference calculated for alternatives. Greater values are placed higher in ranking
+                    Preference calculated for alternatives. Greater values are placed higher in ranking.
+                    Preferences for values of threshold parameter are in rows if array is given
         """
-        # validate data
-        Validator.fuzzy_validation(matrix, weights)
-
-        self.preferences = fuzzy(matrix, weights, types, self.normalization, self.distance_1, self.distance_2, tau).astype(float)
+        self.preferences = self._solve(matrix, weights, types, tau, *args, dtype=dtype, **kwargs)
         return self.preferences
 
-    def rank(self):
-        """
-            Calculates the alternatives ranking based on the obtained preferences
-
-            Returns
-            ----------
-                ndarray:
-                    Ranking of alternatives
-        """
-        try:
-            return rank(self.preferences, self.__descending)
-        except AttributeError:
-            raise AttributeError('Cannot calculate ranking before assessment')
-        except:
-            raise ValueError('Error occurred in ranking calculation')
\ No newline at end of file
+    def _assess(self, matrix, weights, types, tau=0.02, *args, trace=None, **kwargs):
+        return fuzzy(matrix, weights, types, self.normalization, self.distance_1, self.distance_2, tau, self.algorithm, trace=trace, backend=self.backend)
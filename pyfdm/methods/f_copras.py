@@ -1,13 +1,13 @@
-# Copyright (c) 2022 Jakub Więckowski
+# Copyright (c) 2022-2024 Jakub Więckowski
 
 from .copras.fuzzy import fuzzy
 from .utils.normalizations import saw_normalization
-from ..helpers import rank
 
 from .validator import Validator
+from .result import EvaluationMixin
 
 
-class fCOPRAS():
+class fCOPRAS(EvaluationMixin):
     def __init__(self, normalization=saw_normalization):
         """
             Create fuzzy COPRAS method object with saw normalization function
@@ -20,9 +20,9 @@ class fCOPRAS():
         """
 
         self.normalization = normalization
-        self.__descending = True
+        self._descending = True
 
-    def __call__(self, matrix, weights, types, *args, **kwargs):
+    def __call__(self, matrix, weights, types, *args, dtype=None, **kwargs):
         """
             Calculates the alternatives preferences
 
@@ -38,29 +38,19 @@ class fCOPRAS():
                 types : ndarray
                     Types of criteria, 1 profit, -1 cost
 
+                dtype : dtype, default=None
+                    Floating point data type used in computations, configured data type if None
+
             Returns
             ----------
                 ndarray:
                     Preference calculated for alternatives. Greater values are placed higher in ranking
         """
-        # validate data
-        Validator.fuzzy_validation(matrix, weights, types)
-
-        self.preferences = fuzzy(matrix, weights, types, self.normalization).astype(float)
+        self.preferences = self._solve(matrix, weights, types, *args, dtype=dtype, **kwargs)
         return self.preferences
 
-    def rank(self):
-        """
-            Calculates the alternatives ranking based on the obtained preferences
+    def _validate(self, matrix, weights, types, *args, **kwargs):
+        Validator.fuzzy_validation(matrix, weights, types)
 
-            Returns
-            ----------
-                ndarray:
-                    Ranking of alternatives
-        """
-        try:
-            return rank(self.preferences, self.__descending)
-        except AttributeError:
-            raise AttributeError('Cannot calculate ranking before assessment')
-        except:
-            raise ValueError('Error occurred in ranking calculation')
\ No newline at end of file
+    def _assess(self, matrix, weights, types, *args, trace=None, **kwargs):
+        return fuzzy(matrix, weights, types, self.normalization, trace=trace)
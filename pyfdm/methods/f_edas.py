@@ -1,14 +1,14 @@
-# Copyright (c) 2022 Jakub Więckowski
+# Copyright (c) 2022-2024 Jakub Więckowski
 
 from .edas.fuzzy import fuzzy
 from .utils.defuzzifications import mean_defuzzification
-from ..helpers import rank
 
-from .validator import Validator
+from .result import EvaluationMixin
+from .utils.jit import resolve_backend
 
 
-class fEDAS():
-    def __init__(self, defuzzify=mean_defuzzification):
+class fEDAS(EvaluationMixin):
+    def __init__(self, defuzzify=mean_defuzzification, backend='auto'):
         """
             Create fuzzy EDAS method object with mean defuzification function
 
@@ -17,12 +17,16 @@ class fEDAS():
                 defuzzify: callable
                     Function used to defuzzify the TFN into crisp value
 
+                backend: str, default='auto'
+                    'numba' for compiled kernels, 'numpy' for NumPy implementation, 'auto' for compiled kernels if numba is installed
+
         """
 
         self.defuzzify = defuzzify
-        self.__descending = True
+        self.backend = resolve_backend(backend)
+        self._descending = True
 
-    def __call__(self, matrix, weights, types, *args, **kwargs):
+    def __call__(self, matrix, weights, types, *args, dtype=None, **kwargs):
         """
             Calculates the alternatives preferences
 
@@ -38,29 +42,16 @@ class fEDAS():
                 types : ndarray
                     Types of criteria, 1 profit, -1 cost
 
+                dtype : dtype, default=None
+                    Floating point data type used in computations, configured data type if None
+
             Returns
             ----------
                 ndarray:
                     Preference calculated for alternatives. Greater values are placed higher in ranking
         """
-        # validate data
-        Validator.fuzzy_validation(matrix, weights)
-
-        self.preferences = fuzzy(matrix, weights, types, self.defuzzify).astype(float)
+        self.preferences = self._solve(matrix, weights, types, *args, dtype=dtype, **kwargs)
         return self.preferences
 
-    def rank(self):
-        """
-            Calculates the alternatives ranking based on the obtained preferences
-
-            Returns
-            ----------
-                ndarray:
-                    Ranking of alternatives
-        """
-        try:
-            return rank(self.preferences, self.__descending)
-        except AttributeError:
-            raise AttributeError('Cannot calculate ranking before assessment')
-        except:
-            raise ValueError('Error occurred in ranking calculation')
\ No newline at end of file
+    def _assess(self, matrix, weights, types, *args, trace=None, **kwargs):
+        return fuzzy(matrix, weights, types, self.defuzzify, trace=trace, backend=self.backend)
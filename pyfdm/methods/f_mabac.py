@@ -1,14 +1,13 @@
-# Copyright (c) 2022 Jakub Więckowski
+# Copyright (c) 2022-2024 Jakub Więckowski
 
 from .mabac.fuzzy import fuzzy
 from .utils.defuzzifications import mean_defuzzification
 from .utils.normalizations import minmax_normalization
-from ..helpers import rank
 
-from .validator import Validator
+from .result import EvaluationMixin
 
 
-class fMABAC():
+class fMABAC(EvaluationMixin):
     def __init__(self, normalization=minmax_normalization, defuzzify=mean_defuzzification):
         """
             Create fuzzy MAIRCA method object with minmax normalization and mean defuzzification functions
@@ -25,9 +24,9 @@ class fMABAC():
 
         self.normalization = normalization
         self.defuzzify = defuzzify
-        self.__descending = True
+        self._descending = True
 
-    def __call__(self, matrix, weights, types, *args, **kwargs):
+    def __call__(self, matrix, weights, types, *args, dtype=None, **kwargs):
         """
             Calculates the alternatives preferences
 
@@ -43,29 +42,17 @@ class fMABAC():
                 types : ndarray
                     Types of criteria, 1 profit, -1 cost
 
+                dtype : dtype, default=None
+                    Floating point data type used in computations, configured data type if None
+
             Returns
             ----------
                 ndarray:
                     Preference calculated for alternatives. Greater values are placed higher in ranking
         """
-        # validate data
-        Validator.fuzzy_validation(matrix, weights)
-
-        self.preferences = fuzzy(matrix, weights, types, self.normalization, self.defuzzify).astype(float)
+        self.preferences = self._solve(matrix, weights, types, *args, dtype=dtype, **kwargs)
         return self.preferences
-        
-    def rank(self):
-        """
-            Calculates the alternatives ranking based on the obtained preferences
 
-            Returns
-            ----------
-                ndarray:
-                    Ranking of alternatives
-        """
-        try:
-            return rank(self.preferences, self.__descending)
-        except AttributeError:
-            raise AttributeError('Cannot calculate ranking before assessment')
-        except:
-            raise ValueError('Error occurred in ranking calculation')
\ No newline at end of file
+    def _assess(self, matrix, weights, types, *args, trace=None, **kwargs):
+        return fuzzy(matrix, weights, types, self.normalization, self.defuzzify, trace=trace)
+        
@@ -1,14 +1,13 @@
-# Copyright (c) 2022 Jakub Więckowski
+# Copyright (c) 2022-2024 Jakub Więckowski
 
 from .mairca.fuzzy import fuzzy
 from .utils.normalizations import vector_normalization
 from .utils.distances import vertex_distance
-from ..helpers import rank
 
-from .validator import Validator
+from .result import EvaluationMixin
 
 
-class fMAIRCA():
+class fMAIRCA(EvaluationMixin):
     def __init__(self, normalization=vector_normalization, distance=vertex_distance):
         """
             Create fuzzy MAIRCA method object with vector normalization and vertex distance functions
@@ -25,9 +24,9 @@ class fMAIRCA():
 
         self.normalization = normalization
         self.distance = distance
-        self.__descending = True
+        self._descending = True
 
-    def __call__(self, matrix, weights, types, *args, **kwargs):
+    def __call__(self, matrix, weights, types, *args, dtype=None, **kwargs):
         """
             Calculates the alternatives preferences
 
@@ -43,29 +42,16 @@ class fMAIRCA():
                 types : ndarray
                     Types of criteria, 1 profit, -1 cost
 
+                dtype : dtype, default=None
+                    Floating point data type used in computations, configured data type if None
+
             Returns
             ----------
                 ndarray:
                     Preference calculated for alternatives. Greater values are placed higher in ranking
         """
-        # validate data
-        Validator.fuzzy_validation(matrix, weights)
-
-        self.preferences = fuzzy(matrix, weights, types, self.normalization, self.distance).astype(float)
+        self.preferences = self._solve(matrix, weights, types, *args, dtype=dtype, **kwargs)
         return self.preferences
 
-    def rank(self):
-        """
-            Calculates the alternatives ranking based on the obtained preferences
-
-            Returns
-            ----------
-                ndarray:
-                    Ranking of alternatives
-        """
-        try:
-            return rank(self.preferences, self.__descending)
-        except AttributeError:
-            raise AttributeError('Cannot calculate ranking before assessment')
-        except:
-            raise ValueError('Error occurred in ranking calculation')
\ No newline at end of file
+    def _assess(self, matrix, weights, types, *args, trace=None, **kwargs):
+        return fuzzy(matrix, weights, types, self.normalization, self.distance, trace=trace)
@@ -1,14 +1,19 @@
-# Copyright (c) 2022 Jakub Więckowski
+# Copyright (c) 2022-2024 Jakub Więckowski
 
 from .moora.fuzzy import fuzzy
 from .utils.normalizations import vector_normalization
-from ..helpers import rank
 
 from .validator import Validator
+from .result import EvaluationMixin
 
 
-class fMOORA():
-    def __init__(self, normalization=vector_normalization):
+class fMOORA(EvaluationMixin):
+    # intermediate results with alternatives in rows, scattered to repeated alternatives
+    _trace_rows = ('nmatrix', 'Sp', 'Sm')
+    # encoded matrices are normalized with the lookup table of terms and given with the identity normalization
+    _normalized_codebook = True
+
+    def __init__(self, normalization=vector_normalization, deduplicate=False):
         """
             Create fuzzy MOORA method object with vector normalization function
 
@@ -17,12 +22,16 @@ class fMOORA():
                 normalization: callable
                     Function used to normalize the decision matrix
 
+                deduplicate: bool, default=False
+                    Assess only unique alternatives and assign their preferences to repeated ones
+
         """
 
         self.normalization = normalization
-        self.__descending = True
+        self.deduplicate = deduplicate
+        self._descending = True
 
-    def __call__(self, matrix, weights, types, *args, **kwargs):
+    def __call__(self, matrix, weights, types, *args, dtype=None, **kwargs):
         """
             Calculates the alternatives preferences
 
@@ -38,29 +47,19 @@ class fMOORA():
                 types : ndarray
                     Types of criteria, 1 profit, -1 cost
 
+                dtype : dtype, default=None
+                    Floating point data type used in computations, configured data type if None
+
             Returns
             ----------
                 ndarray:
                     Preference calculated for alternatives. Greater values are placed higher in ranking
         """
-        # validate data
-        Validator.fuzzy_validation(matrix, weights, types)
-
-        self.preferences = fuzzy(matrix, weights, types, self.normalization).astype(float)
+        self.preferences = self._solve(matrix, weights, types, *args, dtype=dtype, **kwargs)
         return self.preferences
 
-    def rank(self):
-        """
-            Calculates the alternatives ranking based on the obtained preferences
+    def _validate(self, matrix, weights, types, *args, **kwargs):
+        Validator.fuzzy_validation(matrix, weights, types)
 
-            Returns
-            ----------
-                ndarray:
-                    Ranking of alternatives
-        """
-        try:
-            return rank(self.preferences, self.__descending)
-        except AttributeError:
-            raise AttributeError('Cannot calculate ranking before assessment')
-        except:
-            raise ValueError('Error occurred in ranking calculation')
\ No newline at end of file
+    def _assess(self, matrix, weights, types, *args, trace=None, normalization=None, **kwargs):
+        return fuzzy(matrix, weights, types, normalization or self.normalization, trace=trace)
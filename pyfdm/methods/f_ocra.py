@@ -1,14 +1,17 @@
-# Copyright (c) 2022 Jakub Więckowski
+# Copyright (c) 2022-2024 Jakub Więckowski
 
 from .ocra.fuzzy import fuzzy
 from .utils.defuzzifications import mean_defuzzification
-from ..helpers import rank
 
 from .validator import Validator
+from .result import EvaluationMixin
 
 
-class fOCRA():
-    def __init__(self, defuzzify=mean_defuzzification):
+class fOCRA(EvaluationMixin):
+    # intermediate results with alternatives in rows, scattered to repeated alternatives
+    _trace_rows = ('Iss', 'Oss', 'P')
+
+    def __init__(self, defuzzify=mean_defuzzification, deduplicate=False):
         """
             Creates fuzzy OCRA method object with mean defuzzification function
 
@@ -17,12 +20,16 @@ class fOCRA():
                 defuzzify: callable
                     Function used to defuzzify the TFN into crisp value
 
+                deduplicate: bool, default=False
+                    Assess only unique alternatives and assign their preferences to repeated ones
+
         """
 
         self.defuzzify = defuzzify
-        self.__descending = True
+        self.deduplicate = deduplicate
+        self._descending = True
 
-    def __call__(self, matrix, weights, types, *args, **kwargs):
+    def __call__(self, matrix, weights, types, *args, dtype=None, **kwargs):
         """
             Calculates the alternatives preferences
 
@@ -38,30 +45,21 @@ class fOCRA():
                 types : ndarray
                     Types of criteria, 1 profit, -1 cost
 
+                dtype : dtype, default=None
+                    Floating point data type used in computations, configured data type if None
+
             Returns
             ----------
                 ndarray:
                     Preference calculated for alternatives. Greater values are placed higher in ranking
         """
-        # validate data
+        self.preferences = self._solve(matrix, weights, types, *args, dtype=dtype, **kwargs)
+        return self.preferences
+
+    def _validate(self, matrix, weights, types, *args, **kwargs):
         Validator.fuzzy_validation(matrix, weights, types)
 
-        self.preferences = fuzzy(matrix, weights, types, self.defuzzify).astype(float)
-        return self.preferences
+    def _assess(self, matrix, weights, types, *args, trace=None, **kwargs):
+        return fuzzy(matrix, weights, types, self.defuzzify, trace=trace)
 
         
-    def rank(self):
-        """
-            Calculates the alternatives ranking based on the obtained preferences
-
-            Returns
-            ----------
-                ndarray:
-                    Ranking of alternatives
-        """
-        try:
-            return rank(self.preferences, self.__descending)
-        except AttributeError:
-            raise AttributeError('Cannot calculate ranking before assessment')
-        except:
-            raise ValueError('Error occurred in ranking calculation')
\ No newline at end of file
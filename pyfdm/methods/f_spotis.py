@@ -1,13 +1,17 @@
-# Copyright (c) 2023 Jakub Więckowski, Andrii Shekhovtsov
+# Copyright (c) 2023-2024 Jakub Więckowski, Andrii Shekhovtsov
 
 from .spotis.fuzzy import fuzzy
-from ..helpers import rank
 
 from .validator import Validator
+from .result import EvaluationMixin
+from .utils.jit import resolve_backend
 import numpy as np
 
-class fSPOTIS():
-    def __init__(self, normalization=None):
+class fSPOTIS(EvaluationMixin):
+    # intermediate results with alternatives in rows, scattered to repeated alternatives
+    _trace_rows = ('nmatrix', 'd')
+
+    def __init__(self, normalization=None, deduplicate=False, backend='auto'):
         """
             Creates fuzzy SPOTIS method object
 
@@ -16,12 +20,20 @@ class fSPOTIS():
                 normalization: callable, default=None
                     Function used to normalize the decision matrix
 
+                deduplicate: bool, default=False
+                    Assess only unique alternatives and assign their preferences to repeated ones
+
+                backend: str, default='auto'
+                    'numba' for compiled kernels, 'numpy' for NumPy implementation, 'auto' for compiled kernels if numba is installed
+
         """
 
         self.normalization = normalization
-        self.__descending = True
+        self.deduplicate = deduplicate
+        self.backend = resolve_backend(backend)
+        self._descending = True
 
-    def __call__(self, matrix, weights, types, bounds, *args, **kwargs):
+    def __call__(self, matrix, weights, types, bounds, *args, dtype=None, **kwargs):
         """
             Calculates the alternatives preferences
 
@@ -40,18 +52,24 @@ class fSPOTIS():
                 bounds : ndarray
                     Decision problem bounds / criteria bounds. Should be two dimensional array with [min, max] value for in criterion in rows.
 
+                dtype : dtype, default=None
+                    Floating point data type used in computations, configured data type if None
+
             Returns
             ----------
                 ndarray:
                     Preference calculated for alternatives. Greater values are placed higher in ranking
         """
-        # validate data
+        self.preferences = self._solve(matrix, weights, types, bounds, *args, dtype=dtype, **kwargs)
+        return self.preferences
+
+    def _validate(self, matrix, weights, types, bounds, *args, **kwargs):
         Validator.fuzzy_validation(matrix, weights, types, crisp_required=True)
 
+    def _assess(self, matrix, weights, types, bounds, *args, trace=None, **kwargs):
         isp = bounds[np.arange(bounds.shape[0]), ((types+1)//2).astype('int')]
 
-        self.preferences = fuzzy(matrix, weights, self.normalization, bounds, isp).astype(float)
-        return self.preferences
+        return fuzzy(matrix, weights, self.normalization, bounds, isp, trace=trace, backend=self.backend)
 
     def make_bounds(self, matrix):
 
@@ -61,19 +79,3 @@ class fSPOTIS():
         ))
 
         return bounds
-
-    def rank(self):
-        """
-            Calculates the alternatives ranking based on the obtained preferences
-
-            Returns
-            ----------
-                ndarray:
-                    Ranking of alternatives
-        """
-        try:
-            return rank(self.preferences, self.__descending)
-        except AttributeError:
-            raise AttributeError('Cannot calculate ranking before assessment')
-        except:
-            raise ValueError('Error occurred in ranking calculation')
@@ -1,15 +1,20 @@
-# Copyright (c) 2022 Jakub Więckowski
+# Copyright (c) 2022-2024 Jakub Więckowski
 
 from .topsis.fuzzy import fuzzy
 from .utils.normalizations import linear_normalization
 from .utils.distances import vertex_distance
-from ..helpers import rank, normalize_weights
+from ..helpers import normalize_weights
 
-from .validator import Validator
+from .result import EvaluationMixin
 
 
-class fTOPSIS():
-    def __init__(self, normalization=linear_normalization, distance=vertex_distance):
+class fTOPSIS(EvaluationMixin):
+    # intermediate results with alternatives in rows, scattered to repeated alternatives
+    _trace_rows = ('nmatrix', 'wmatrix', 'fpis', 'fnis')
+    # encoded matrices are normalized with the lookup table of terms and given with the identity normalization
+    _normalized_codebook = True
+
+    def __init__(self, normalization=linear_normalization, distance=vertex_distance, deduplicate=False):
         """
             Creates fuzzy TOPSIS method object with linear normalization and vertex distance function
 
@@ -21,13 +26,17 @@ class fTOPSIS():
                 distance: callable
                     Function used to calculate distance from fuzzy negative solution
 
+                deduplicate: bool, default=False
+                    Assess only unique alternatives and assign their preferences to repeated ones
+
         """
 
         self.normalization = normalization
         self.distance = distance
-        self.__descending = True
+        self.deduplicate = deduplicate
+        self._descending = True
 
-    def __call__(self, matrix, weights, types, *args, **kwargs):
+    def __call__(self, matrix, weights, types, *args, dtype=None, **kwargs):
         """
             Calculates the alternatives preferences
 
@@ -43,29 +52,16 @@ class fTOPSIS():
                 types : ndarray
                     Types of criteria, 1 profit, -1 cost
 
+                dtype : dtype, default=None
+                    Floating point data type used in computations, configured data type if None
+
             Returns
             ----------
                 ndarray:
                     Preference calculated for alternatives. Greater values are placed higher in ranking
         """
-        # validate data
-        Validator.fuzzy_validation(matrix, weights)
-
-        self.preferences = fuzzy(matrix, normalize_weights(weights), types, self.normalization, self.distance).astype(float)
+        self.preferences = self._solve(matrix, weights, types, *args, dtype=dtype, **kwargs)
         return self.preferences
 
-    def rank(self):
-        """
-            Calculates the alternatives ranking based on the obtained preferences
-
-            Returns
-            ----------
-                ndarray:
-                    Ranking of alternatives
-        """
-        try:
-            return rank(self.preferences, self.__descending)
-        except AttributeError:
-            raise AttributeError('Cannot calculate ranking before assessment')
-        except:
-            raise ValueError('Error occurred in ranking calculation')
\ No newline at end of file
+    def _assess(self, matrix, weights, types, *args, trace=None, normalization=None, **kwargs):
+        return fuzzy(matrix, normalize_weights(weights), types, normalization or self.normalization, self.distance, trace=trace)
@@ -1,15 +1,16 @@
-# Copyright (c) 2022 Jakub Więckowski
+# Copyright (c) 2022-2024 Jakub Więckowski
 
-import numpy as np
 from .vikor.fuzzy import fuzzy
 from .utils.defuzzifications import mean_area_defuzzification
-from ..helpers import rank
 
-from .validator import Validator
+from .result import EvaluationMixin
 
 
-class fVIKOR():
-    def __init__(self, defuzzify=mean_area_defuzzification):
+class fVIKOR(EvaluationMixin):
+    # intermediate results with alternatives in rows, scattered to repeated alternatives
+    _trace_rows = ('d', 'S', 'R', 'Q')
+
+    def __init__(self, defuzzify=mean_area_defuzzification, deduplicate=False):
         """
             Creates fuzzy VIKOR method object with mean area defuzzification function
 
@@ -18,12 +19,16 @@ class fVIKOR():
                 defuzzify: callable
                     Function used to defuzzify the TFN into crisp value
 
+                deduplicate: bool, default=False
+                    Assess only unique alternatives and assign their preferences to repeated ones
+
         """
 
         self.defuzzify = defuzzify
-        self.__descending = False
+        self.deduplicate = deduplicate
+        self._descending = False
 
-    def __call__(self, matrix, weights, types, v=0.5, *args, **kwargs):
+    def __call__(self, matrix, weights, types, v=0.5, *args, dtype=None, **kwargs):
         """
             Calculates the alternatives preferences
 
@@ -39,33 +44,21 @@ class fVIKOR():
                 types : ndarray
                     Types of criteria, 1 profit, -1 cost
 
-                v : float
+                v : float or ndarray
                     Weight of the strategy (see VIKOR algorithm explanation).
+                    Preferences are calculated for each value if array is given
+
+                dtype : dtype, default=None
+                    Floating point data type used in computations, configured data type if None
 
             Returns
             ----------
                 ndarray:
-                    Preference calculated for alternatives. Lower values are placed higher in ranking
+                    Preference calculated for alternatives. Lower values are placed higher in ranking.
+                    Preferences for values of weight of the strategy are in rows if array is given
         """
-        # validate data
-        Validator.fuzzy_validation(matrix, weights)
-
-        self.preferences = fuzzy(matrix, weights, types, self.defuzzify, v)
+        self.preferences = self._solve(matrix, weights, types, v, *args, dtype=dtype, **kwargs)
         return self.preferences
 
-    def rank(self):
-        """
-            Calculates the alternatives ranking based on the obtained preferences
-
-            Returns
-            ----------
-                ndarray:
-                    Rankings of alternatives for S, R, Q approaches
-        """
-        try:
-            return np.array([rank(pref, self.__descending) for pref in self.preferences])
-        except AttributeError:
-            raise AttributeError('Cannot calculate ranking before assessment')
-        except:
-            raise ValueError('Error occurred in ranking calculation')
-    
+    def _assess(self, matrix, weights, types, v=0.5, *args, trace=None, **kwargs):
+        return fuzzy(matrix, weights, types, self.defuzzify, v, trace=trace)
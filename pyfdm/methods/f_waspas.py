@@ -1,14 +1,12 @@
 # Copyright (c) 2023 Jakub Więckowski
 
-import numpy as np
 from .waspas.fuzzy import fuzzy
 from .utils.normalizations import waspas_normalization
 from .utils.defuzzifications import mean_defuzzification
-from ..helpers import rank
 
-from .validator import Validator
+from .result import EvaluationMixin
 
-class fWASPAS():
+class fWASPAS(EvaluationMixin):
     def __init__(self, normalization=waspas_normalization, defuzzify=mean_defuzzification):
         """
             Creates fuzzy WASPAS method object with WASPAS normalization and mean defuzzification function
@@ -22,9 +20,9 @@ class fWASPAS():
 
         self.normalization = normalization
         self.defuzzify = defuzzify
-        self.__descending = True
+        self._descending = True
 
-    def __call__(self, matrix, weights, types, *args, **kwargs):
+    def __call__(self, matrix, weights, types, *args, dtype=None, **kwargs):
         """
             Calculates the alternatives preferences
 
@@ -40,29 +38,16 @@ class fWASPAS():
                 types : ndarray
                     Types of criteria, 1 profit, -1 cost
 
+                dtype : dtype, default=None
+                    Floating point data type used in computations, configured data type if None
+
             Returns
             ----------
                 ndarray:
                     Preference calculated for alternatives. Lower values are placed higher in ranking
         """
-        # validate data
-        Validator.fuzzy_validation(matrix, weights)
-
-        self.preferences = fuzzy(matrix, weights, types, self.normalization, self.defuzzify)
+        self.preferences = self._solve(matrix, weights, types, *args, dtype=dtype, **kwargs)
         return self.preferences
 
-    def rank(self):
-        """
-            Calculates the alternatives ranking based on the obtained preferences
-
-            Returns
-            ----------
-                ndarray:
-                    Ranking of alternatives
-        """
-        try:
-            return rank(self.preferences, self.__descending)
-        except AttributeError:
-            raise AttributeError('Cannot calculate ranking before assessment')
-        except:
-            raise ValueError('Error occurred in ranking calculation')
\ No newline at end of file
+    def _assess(self, matrix, weights, types, *args, trace=None, **kwargs):
+        return fuzzy(matrix, weights, types, self.normalization, self.defuzzify, trace=trace)
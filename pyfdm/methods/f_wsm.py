@@ -1,14 +1,17 @@
 # Copyright (c) 2023 Jakub Więckowski
 
-import numpy as np
 from .wsm.fuzzy import fuzzy
 from .utils.defuzzifications import mean_defuzzification
-from ..helpers import rank
 
-from .validator import Validator
+from .result import EvaluationMixin
 
-class fWSM():
-    def __init__(self, normalization=None, defuzzify=mean_defuzzification):
+class fWSM(EvaluationMixin):
+    # intermediate results with alternatives in rows, scattered to repeated alternatives
+    _trace_rows = ('nmatrix', 'sum_w')
+    # encoded matrices are normalized with the lookup table of terms and given with the identity normalization
+    _normalized_codebook = True
+
+    def __init__(self, normalization=None, defuzzify=mean_defuzzification, deduplicate=False):
         """
             Creates fuzzy WSM method object with mean defuzzification
 
@@ -20,13 +23,17 @@ class fWSM():
                 defuzzify: callable
                     Function used to defuzzify the TFN into crisp value
 
+                deduplicate: bool, default=False
+                    Assess only unique alternatives and assign their preferences to repeated ones
+
         """
 
         self.normalization = normalization
         self.defuzzify = defuzzify
-        self.__descending = True
+        self.deduplicate = deduplicate
+        self._descending = True
 
-    def __call__(self, matrix, weights, *args, **kwargs):
+    def __call__(self, matrix, weights, *args, dtype=None, **kwargs):
         """
             Calculates the alternatives preferences
 
@@ -39,29 +46,16 @@ class fWSM():
                 weights : ndarray
                     Vector of criteria weights in a crisp form
 
+                dtype : dtype, default=None
+                    Floating point data type used in computations, configured data type if None
+
             Returns
             ----------
                 ndarray:
                     Preference calculated for alternatives. Lower values are placed higher in ranking
         """
-        # validate data
-        Validator.fuzzy_validation(matrix, weights)
-
-        self.preferences = fuzzy(matrix, weights, self.normalization, self.defuzzify)
+        self.preferences = self._solve(matrix, weights, *args, dtype=dtype, **kwargs)
         return self.preferences
 
-    def rank(self):
-        """
-            Calculates the alternatives ranking based on the obtained preferences
-
-            Returns
-            ----------
-                ndarray:
-                    Ranking of alternatives
-        """
-        try:
-            return rank(self.preferences, self.__descending)
-        except AttributeError:
-            raise AttributeError('Cannot calculate ranking before assessment')
-        except:
-            raise ValueError('Error occurred in ranking calculation')
\ No newline at end of file
+    def _assess(self, matrix, weights, *args, trace=None, normalization=None, **kwargs):
+        return fuzzy(matrix, weights, normalization or self.normalization, self.defuzzify, trace=trace)
@@ -0,0 +1,197 @@
+# Copyright (c) 2024 Jakub Więckowski
+
+import numpy as np
+from .utils import defuzzifications, distances
+from .utils.defuzzifications import tfn_defuzzify
+from .utils.distances import tfn_distances
+from ..helpers import normalize_weights
+
+__all__ = [
+    'weights_jacobian'
+]
+
+# gradients of linear defuzzifications with respect to TFN components
+LINEAR_DEFUZZIFICATIONS = {
+    defuzzifications.mean_defuzzification: (1/3, 1/3, 1/3),
+    defuzzifications.mean_area_defuzzification: (1/4, 1/2, 1/4),
+    defuzzifications.graded_mean_average_defuzzification: (1/6, 2/3, 1/6),
+    defuzzifications.weighted_mean_defuzzification: (1/4, 1/2, 1/4),
+    defuzzifications.bisector_defuzzification: (1/2, 0, 1/2),
+    defuzzifications.height_defuzzification: (0, 1, 0),
+}
+
+# step of central differences for defuzzifications and distances without closed form gradient
+_STEP = 1e-6
+
+
+def _defuzzify_gradient(defuzzify, values):
+    # gradient of defuzzified values with respect to TFN components, shape of values
+    if defuzzify in LINEAR_DEFUZZIFICATIONS:
+        return np.broadcast_to(np.asarray(LINEAR_DEFUZZIFICATIONS[defuzzify]), values.shape)
+    gradient = np.empty(values.shape)
+    for c in range(3):
+        h = _STEP * np.maximum(1, np.abs(values[..., c]))
+        plus, minus = values.copy(), values.copy()
+        plus[..., c] += h
+        minus[..., c] -= h
+        gradient[..., c] = (tfn_defuzzify(defuzzify, plus) - tfn_defuzzify(defuzzify, minus)) / (2 * h)
+    return gradient
+
+
+def _distance_gradient(distance, a, b):
+    # gradient of distance with respect to components of the first TFN, shape of a
+    a, b = np.broadcast_arrays(a, b)
+    diff = a - b
+    if distance in (distances.euclidean_distance, distances.vertex_distance, distances.weighted_euclidean_distance):
+        d = tfn_distances(distance, a, b)[..., None]
+        scale = {distances.euclidean_distance: np.ones(3),
+                 distances.vertex_distance: np.full(3, 1/3),
+                 distances.weighted_euclidean_distance: np.array([1/4, 1/2, 1/4])}[distance]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(d > 0, scale * diff / d, 0)
+    if distance is distances.hamming_distance:
+        return np.sign(diff)
+    if distance is distances.weighted_hamming_distance:
+        return np.array([1/4, 1/2, 1/4]) * np.sign(diff)
+
+    gradient = np.empty(a.shape)
+    for c in range(3):
+        h = _STEP * np.maximum(1, np.abs(a[..., c]))
+        plus, minus = a.copy(), a.copy()
+        plus[..., c] += h
+        minus[..., c] -= h
+        gradient[..., c] = (tfn_distances(distance, plus, b) - tfn_distances(distance, minus, b)) / (2 * h)
+    return gradient
+
+
+def _wsm(method, weights, types, t):
+    # preference = D(sum_j N_ij W_j)
+    g = _defuzzify_gradient(method.defuzzify, t['sum_w'])
+    return g[:, None, :] * t['nmatrix']
+
+
+def _wpm(method, weights, types, t):
+    # preference = D(prod_j N_ij ^ W_j)
+    g = _defuzzify_gradient(method.defuzzify, t['prod_w'])
+    with np.errstate(divide='ignore'):
+        return (g * t['prod_w'])[:, None, :] * np.log(t['nmatrix'])
+
+
+def _waspas(method, weights, types, t):
+    # K = d Q_def + (1 - d) P_def, d = sum P_def / (sum Q_def + sum P_def), WPM uses reversed components of weights
+    nmatrix, Q, P, d = t['nmatrix'], t['Q'], t['P'], t['d']
+    Q_def, P_def = tfn_defuzzify(method.defuzzify, Q), tfn_defuzzify(method.defuzzify, P)
+    dQ = _defuzzify_gradient(method.defuzzify, Q)[:, None, :] * nmatrix
+    with np.errstate(divide='ignore'):
+        dP = ((_defuzzify_gradient(method.defuzzify, P) * P)[:, None, :] * np.log(nmatrix))[..., ::-1]
+    SQ, SP = np.sum(Q_def), np.sum(P_def)
+    dd = (np.sum(dP, axis=0) * SQ - SP * np.sum(dQ, axis=0)) / (SQ + SP)**2
+    return dd[None] * (Q_def - P_def)[:, None, None] + d * dQ + (1 - d) * dP
+
+
+def _topsis(method, weights, types, t):
+    # preference = fnis / (fpis + fnis), distances of weighted matrix N W~ with W~ normalized weights
+    nmatrix, wmatrix, fpis, fnis = t['nmatrix'], t['wmatrix'], t['fpis'], t['fnis']
+    dfpis = _distance_gradient(method.distance, wmatrix, np.ones(3)) * nmatrix
+    dfnis = _distance_gradient(method.distance, wmatrix, np.zeros(3)) * nmatrix
+    jacobian = (dfnis * fpis[:, None, None] - fnis[:, None, None] * dfpis) / ((fpis + fnis)**2)[:, None, None]
+
+    # weights are divided by the greatest upper value if any of them is greater than 1
+    if np.any(weights > 1):
+        j = np.argmax(weights[:, 2])
+        scale = weights[j, 2]
+        nweights = normalize_weights(weights)
+        jacobian = jacobian / scale
+        jacobian[:, j, 2] -= np.sum(jacobian * nweights, axis=(1, 2))
+    return jacobian
+
+
+def _moora(method, weights, types, t):
+    # preference = sqrt(1/3 sum_c (Sp - Sm)^2)
+    diff = t['Sp'] - t['Sm']
+    S = np.sqrt(1/3 * np.sum(diff**2, axis=1))
+    sign = (types == 1).astype(float) - (types == -1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(S[:, None, None] > 0,
+                        diff[:, None, :] * sign[None, :, None] * t['nmatrix'] / (3 * S)[:, None, None], 0)
+
+
+def _aras(method, weights, types, t):
+    # preference = S_i / S_0, S = 1/3 sum_j sum_c N W, optimal alternative in row 0
+    S, dS = t['S'], t['nmatrix'] / 3
+    return (dS[1:] * S[0] - S[1:, None, None] * dS[0][None]) / S[0]**2
+
+
+def _copras(method, weights, types, t):
+    # Q = Tp + A / (Tm B) with A sum of Tm and B sum of 1 / Tm, q defuzzified Q, preference = q / max q
+    nmatrix, Tp, Tm = t['nmatrix'], t['Tp'], t['Tm']
+    profit, cost = (types == 1).astype(float), (types == -1).astype(float)
+    coefficients = np.array([2/3, -1/3, 2/3])
+
+    dq = coefficients * profit[None, :, None] * nmatrix
+    Q = Tp.copy()
+    if np.any(cost):
+        A, B = np.sum(Tm), np.sum(1 / Tm)
+        R = A / (Tm * B)
+        Q = Q + R
+        dA = np.sum(cost[None, :, None] * nmatrix, axis=0)
+        dB = -np.sum(cost[None, :, None] * nmatrix / Tm[:, None, :]**2, axis=0)
+        dq = dq - coefficients * (R / Tm)[:, None, :] * cost[None, :, None] * nmatrix
+        dq = dq + np.sum(coefficients * R, axis=1)[:, None, None] * (dA / A - dB / B)[None]
+
+    q = Q[:, 0] + ((Q[:, 2] - Q[:, 0]) - (Q[:, 1] - Q[:, 2])) / 3
+    best = np.argmax(q)
+    return (dq * q[best] - q[:, None, None] * dq[best][None]) / q[best]**2
+
+
+_JACOBIANS = {
+    'fARAS': _aras,
+    'fCOPRAS': _copras,
+    'fMOORA': _moora,
+    'fTOPSIS': _topsis,
+    'fWASPAS': _waspas,
+    'fWPM': _wpm,
+    'fWSM': _wsm,
+}
+
+
+def weights_jacobian(method, matrix, weights, types=None):
+    """
+        Calculates derivatives of the alternatives preferences with respect to criteria weights
+        from intermediate results of one assessment
+
+        Parameters
+        ----------
+            method : object
+                Configured fARAS, fCOPRAS, fMOORA, fTOPSIS, fWASPAS, fWPM or fWSM object
+
+            matrix : ndarray
+                Decision matrix / alternatives data.
+                Alternatives are in rows and Criteria are in columns.
+
+            weights : ndarray
+                Vector of criteria weights in a crisp form (n, ) or as a TFNs (n, 3)
+
+            types : ndarray, default=None
+                Types of criteria, 1 profit, -1 cost, not used by fWSM and fWPM
+
+        Returns
+        -------
+            ndarray
+                Jacobian of preferences, (m, n) for crisp weights or (m, n, 3) for TFN components of weights
+    """
+    name = type(method).__name__
+    if name not in _JACOBIANS:
+        raise ValueError(f'Jacobian can be calculated for {sorted(_JACOBIANS)}, not {name}')
+
+    matrix, weights = np.asarray(matrix, dtype=float), np.asarray(weights, dtype=float)
+    args = (matrix, weights) if types is None else (matrix, weights, types)
+    trace = method.evaluate(*args, dtype=np.float64, intermediates=True).intermediates
+    types = None if types is None else np.asarray(types)
+    fuzzy_weights = weights if weights.ndim == 2 else np.repeat(weights, 3).reshape((len(weights), 3))
+
+    jacobian = _JACOBIANS[name](method, fuzzy_weights, types, trace)
+    if weights.ndim == 1:
+        # crisp weight is used for all components
+        jacobian = np.sum(jacobian, axis=2)
+    return jacobian
@@ -0,0 +1,186 @@
+# Copyright (c) 2024 Jakub Więckowski
+
+import numpy as np
+from .chunked import _bind, _scorer
+from .f_moora import fMOORA
+from .f_topsis import fTOPSIS
+from .f_wsm import fWSM
+from .utils.defuzzifications import tfn_defuzzify
+from .utils.normalizations import NormalizationStatistics, apply_normalization, sum_normalization, \
+    vector_normalization, saw_normalization, sqrt_normalization, waspas_normalization
+from .validator import Validator
+from ..config import resolve_dtype, use_dtype
+from ..helpers import rank
+
+__all__ = [
+    'IncrementalEvaluator'
+]
+
+# normalizations multiplying values of criteria by factors depending only on statistics,
+# True if reciprocals of values of cost criteria are multiplied instead
+SCALING_NORMALIZATIONS = {
+    sum_normalization: True,
+    vector_normalization: False,
+    saw_normalization: False,
+    sqrt_normalization: False,
+    waspas_normalization: True,
+}
+
+
+class IncrementalEvaluator():
+    def __init__(self, method, weights, types=None, matrix=None, dtype=None):
+        """
+            Creates evaluator keeping the preferences of alternatives current when new alternatives are appended.
+            Only new alternatives are assessed if the statistics used by the normalization do not change.
+            Otherwise preferences of fWSM and fMOORA with normalizations from SCALING_NORMALIZATIONS are rescaled,
+            i.e. stored values of criteria are summed with factors of the new statistics without normalizing the matrix again,
+            and all stored alternatives are assessed again in one vectorized pass for other methods and normalizations
+
+            Parameters
+            ----------
+                method: fTOPSIS, fMOORA or fWSM
+                    Method object used to assess the alternatives
+
+                weights : ndarray
+                    Vector of criteria weights
+
+                types : ndarray, default=None
+                    Types of criteria, 1 profit, -1 cost
+
+                matrix : ndarray, default=None
+                    Initial decision matrix
+
+                dtype : dtype, default=None
+                    Floating point data type used in computations, configured data type if None
+
+        """
+        if not isinstance(method, (fTOPSIS, fMOORA, fWSM)):
+            raise ValueError(f'Incremental evaluation is available for fTOPSIS, fMOORA and fWSM methods, not {type(method).__name__}')
+        if isinstance(method, fMOORA) and types is None:
+            raise ValueError('fMOORA requires types of criteria')
+        Validator.validate_weights(np.asarray(weights))
+
+        self.method = method
+        self.dtype = resolve_dtype(dtype)
+        self.weights = np.asarray(weights, dtype=self.dtype)
+        self.types = None if types is None else np.asarray(types)
+        self.normalization = method.normalization
+        self.statistics = NormalizationStatistics(self.weights.shape[0], self.dtype, self.normalization)
+        self.full_updates = 0
+        self.partial_updates = 0
+        self.rescaled_updates = 0
+        self.rescaled = isinstance(method, (fMOORA, fWSM)) and self.normalization in SCALING_NORMALIZATIONS
+
+        normalization = None if self.normalization is None else _bind(self.normalization, self.statistics, self.dtype)
+        self.__score = _scorer(method, self.weights, self.types, normalization)
+        self.__matrix = np.empty((0, self.weights.shape[0], 3), dtype=self.dtype)
+        # values multiplied by factors of the scaling normalization
+        self.__values = self.__matrix
+        self.__preferences = np.empty(0, dtype=self.dtype)
+        self.__size = 0
+
+        if matrix is not None:
+            self.append(matrix)
+
+    def __len__(self):
+        return self.__size
+
+    @property
+    def matrix(self):
+        return self.__matrix[:self.__size]
+
+    @property
+    def preferences(self):
+        # copy, the buffer is changed in place and reallocated when alternatives are appended
+        return self.__preferences[:self.__size].copy()
+
+    def _reciprocal(self):
+        return self.rescaled and SCALING_NORMALIZATIONS[self.normalization] and self.types is not None
+
+    def _reserve(self, size):
+        # buffers grow geometrically so appending is amortized constant time per alternative
+        if size <= self.__matrix.shape[0]:
+            return
+        capacity = max(size, 2 * self.__matrix.shape[0], 16)
+        matrix = np.empty((capacity, ) + self.__matrix.shape[1:], dtype=self.dtype)
+        matrix[:self.__size] = self.matrix
+        preferences = np.empty(capacity, dtype=self.dtype)
+        preferences[:self.__size] = self.__preferences[:self.__size]
+        values = matrix
+        if self._reciprocal():
+            values = np.empty_like(matrix)
+            values[:self.__size] = self.__values[:self.__size]
+        self.__matrix, self.__values, self.__preferences = matrix, values, preferences
+
+    def _rescale(self):
+        # normalized values equal stored values multiplied by factors, obtained by normalizing TFNs (1, 1, 1)
+        factors = apply_normalization(self.normalization, self.statistics, np.ones((1, ) + self.__matrix.shape[1:]),
+                                      self.types, self.dtype)[0]
+        weights = self.weights if self.weights.ndim == 2 else np.repeat(self.weights, 3).reshape(-1, 3)
+        factors = factors * weights
+        if isinstance(self.method, fMOORA):
+            # difference of profit and cost overall ratings
+            factors = factors * self.types[:, None]
+        sums = np.einsum('ijk,jk->ik', self.__values[:self.__size], factors)
+        if isinstance(self.method, fMOORA):
+            return np.sqrt(1/3 * np.sum(sums**2, axis=1))
+        return tfn_defuzzify(self.method.defuzzify, sums)
+
+    def append(self, matrix):
+        """
+            Includes new alternatives and updates the preferences
+
+            Parameters
+            ----------
+                matrix : ndarray
+                    Decision matrix with new alternatives
+
+            Returns
+            ----------
+                ndarray:
+                    Preferences of all stored alternatives
+        """
+        matrix = np.asarray(matrix, dtype=self.dtype)
+        Validator.validate_tfn_matrix(matrix)
+        Validator.validate_input(matrix, self.weights, self.types)
+
+        start, end = self.__size, self.__size + matrix.shape[0]
+        self._reserve(end)
+        self.__matrix[start:end] = matrix
+        if self._reciprocal():
+            self.__values[start:end] = matrix
+            cost = self.types == -1
+            self.__values[start:end, cost] = 1 / matrix[:, cost]
+        self.__size = end
+
+        rescore = False
+        if self.normalization is not None:
+            previous = self.statistics.values(self.normalization)
+            self.statistics.update(matrix)
+            current = self.statistics.values(self.normalization)
+            rescore = start > 0 and not all(np.array_equal(p, c) for p, c in zip(previous, current))
+
+        with use_dtype(self.dtype):
+            if rescore and self.rescaled:
+                self.__preferences[:end] = self._rescale()
+                self.rescaled_updates += 1
+            elif rescore:
+                self.__preferences[:end] = self.__score(self.matrix)
+                self.full_updates += 1
+            else:
+                self.__preferences[start:end] = self.__score(matrix)
+                self.partial_updates += 1
+
+        self.method.preferences = self.preferences
+        return self.preferences
+
+    def rank(self):
+        """
+            Calculates the alternatives ranking based on the current preferences
+
+            Returns
+            ----------
+                ndarray:
+                    Ranking of alternatives
+        """
+        return rank(self.preferences, self.method._descending)
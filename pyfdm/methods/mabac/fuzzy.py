@@ -2,7 +2,7 @@
 
 import numpy as np
 
-def fuzzy(matrix, weights, types, normalization, defuzzify):
+def fuzzy(matrix, weights, types, normalization, defuzzify, trace=None):
     """
         Calculates the alternatives preferences based on Triangular Fuzzy Number extension
 
@@ -24,6 +24,9 @@ def fuzzy(matrix, weights, types, normalization, defuzzify):
             defuzzify: callable
                 Function used to defuzzify the TFN into crisp value
 
+            trace : dict, default=None
+                Dictionary filled with intermediate results if given
+
         Returns
         -------
             ndarray:
@@ -48,4 +51,8 @@ def fuzzy(matrix, weights, types, normalization, defuzzify):
     
     # preference value
     S = np.array([np.sum(q, axis=0) for q in Q])
+    # intermediate results
+    if trace is not None:
+        trace.update(nmatrix=nmatrix, G=G, Q=Q)
+
     return np.array([defuzzify(s) for s in S])
@@ -1,8 +1,9 @@
 # Copyright (c) 2022 Jakub Więckowski
 
 import numpy as np
+from ...config import resolve_dtype
 
-def fuzzy(matrix, weights, types, normalization, distance):
+def fuzzy(matrix, weights, types, normalization, distance, trace=None):
     """
         Calculates the alternatives preferences based on Triangular Fuzzy Number extension
 
@@ -25,6 +26,9 @@ def fuzzy(matrix, weights, types, normalization, distance):
             distance: callable
                 Function used to calculate distance between two Triangular Fuzzy Numbers
 
+            trace : dict, default=None
+                Dictionary filled with intermediate results if given
+
         Returns
         -------
             ndarray:
@@ -36,7 +40,7 @@ def fuzzy(matrix, weights, types, normalization, distance):
     P = 1 / matrix.shape[0]
 
     # Fuzzy theoretical evaluation matrix
-    tpa = np.ones((matrix.shape), dtype=object)
+    tpa = np.ones(matrix.shape, dtype=resolve_dtype())
     for j in range(matrix.shape[1]):
         tpa[:, j] = P * weights[j]
 
@@ -47,11 +51,15 @@ def fuzzy(matrix, weights, types, normalization, distance):
     tra = nmatrix * tpa
 
     # distance between Fuzzy Numbers
-    d = np.zeros((matrix.shape[0], matrix.shape[1], 1))
+    d = np.zeros((matrix.shape[0], matrix.shape[1], 1), dtype=resolve_dtype())
     for i in range(matrix.shape[0]):
         for j in range(matrix.shape[1]):
             d[i, j] = distance(tpa[i, j], tra[i, j])
 
     # preference value
     Q = np.sum(d, axis=1).flatten()
+    # intermediate results
+    if trace is not None:
+        trace.update(tpa=tpa, tra=tra, d=d)
+
     return Q
@@ -2,7 +2,7 @@
 
 import numpy as np
 
-def fuzzy(matrix, weights, types, normalization):
+def fuzzy(matrix, weights, types, normalization, trace=None):
     """
         Calculates the alternatives preferences based on Triangular Fuzzy Number extension
 
@@ -21,6 +21,9 @@ def fuzzy(matrix, weights, types, normalization):
             normalization: callable
                 Function used to normalize the decision matrix
 
+            trace : dict, default=None
+                Dictionary filled with intermediate results if given
+
         Returns
         -------
             ndarray:
@@ -42,6 +45,9 @@ def fuzzy(matrix, weights, types, normalization):
     Sm = np.sum(wmatrix[:, types == -1], axis=1)
 
     # preference value
-    S = np.array([np.sqrt(1/3 * ((sp[0]-sm[0])**2 + (sp[1]-sm[1])
-                                 ** 2 + (sp[2]-sm[2])**2)) for sp, sm in zip(Sp, Sm)])
+    S = np.sqrt(1/3 * np.sum((Sp - Sm)**2, axis=1))
+    # intermediate results
+    if trace is not None:
+        trace.update(nmatrix=nmatrix, Sp=Sp, Sm=Sm)
+
     return S
@@ -1,8 +1,9 @@
 # Copyright (c) 2022 Jakub Więckowski
 
 import numpy as np
+from ...config import resolve_dtype
 
-def fuzzy(matrix, weights, types, defuzzify):
+def fuzzy(matrix, weights, types, defuzzify, trace=None):
     """
         Calculates the alternatives preferences based on Triangular Fuzzy Number extension
 
@@ -21,6 +22,9 @@ def fuzzy(matrix, weights, types, defuzzify):
             defuzzify: callable
                 Function used to defuzzify the TFN into crisp value
 
+            trace : dict, default=None
+                Dictionary filled with intermediate results if given
+
         Returns
         -------
             ndarray:
@@ -29,7 +33,7 @@ def fuzzy(matrix, weights, types, defuzzify):
     """
 
     # cost fuzzy performance rating
-    Is = np.zeros((matrix.shape[0], matrix.shape[2]))
+    Is = np.zeros((matrix.shape[0], matrix.shape[2]), dtype=resolve_dtype())
     for i in range(matrix.shape[0]):
         Is[i] = np.sum([weights[j] * ((np.max(matrix[:, j], axis=0) - matrix[i, j][..., ::-1]) /
                        (np.min(matrix[:, j], axis=0))) for j in range(matrix.shape[1]) if types[j] == -1], axis=0)
@@ -38,7 +42,7 @@ def fuzzy(matrix, weights, types, defuzzify):
     Iss = Is - np.min(Is, axis=0)[..., ::-1]
 
     # profit fuzzy performance rating
-    Os = np.zeros((matrix.shape[0], matrix.shape[2]))
+    Os = np.zeros((matrix.shape[0], matrix.shape[2]), dtype=resolve_dtype())
     for i in range(matrix.shape[0]):
         Os[i] = np.sum([weights[j] * ((matrix[i, j] - np.min(matrix[:, j][..., ::-1], axis=0)) /
                        (np.min(matrix[:, j], axis=0))) for j in range(matrix.shape[1]) if types[j] == 1], axis=0)
@@ -49,4 +53,8 @@ def fuzzy(matrix, weights, types, defuzzify):
     # aggregate fuzzy performance rating
     P = Iss + Oss - np.min(Iss + Oss, axis=0)[..., ::-1]
 
+    # intermediate results
+    if trace is not None:
+        trace.update(Iss=Iss, Oss=Oss, P=P)
+
     return np.array([defuzzify(p) for p in P])
@@ -0,0 +1,182 @@
+# Copyright (c) 2024 Jakub Więckowski
+
+from collections import namedtuple
+from types import MappingProxyType
+
+import numpy as np
+from .validator import Validator
+from .dedup import deduplicate, scatter, scatter_rows
+from .utils.normalizations import _APPLY
+from ..codebook import TFNCodebook
+from ..config import resolve_dtype, use_dtype
+from ..helpers import rank, top_k
+
+__all__ = [
+    'MethodResult'
+]
+
+# preferences, ranking and intermediate results of one assessment
+MethodResult = namedtuple('MethodResult', ['preferences', 'ranking', 'intermediates'])
+
+
+def _freeze(value):
+    # arrays are copied to read-only ones, so the result cannot be changed by the caller or other threads
+    if isinstance(value, tuple):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, np.ndarray):
+        value = value.copy()
+        value.flags.writeable = False
+    return value
+
+
+def make_result(preferences, ranking, intermediates=None):
+    """
+        Creates immutable result of the assessment
+
+        Parameters
+        ----------
+            preferences : ndarray or tuple
+                Preferences calculated for alternatives
+
+            ranking : ndarray
+                Ranking of alternatives
+
+            intermediates : dict, default=None
+                Intermediate results of the method
+
+        Returns
+        -------
+            MethodResult
+                Result with read-only arrays, intermediate results are None if not given
+    """
+    if intermediates is not None:
+        intermediates = MappingProxyType({name: _freeze(value) for name, value in intermediates.items()})
+    return MethodResult(_freeze(preferences), _freeze(ranking), intermediates)
+
+
+def _ranking(preferences, descending):
+    # methods returning several preferences, e.g. S, R, Q of fVIKOR, are ranked separately
+    if isinstance(preferences, tuple):
+        return np.array([rank(pref, descending) for pref in preferences])
+    return rank(preferences, descending)
+
+
+def _normalized(matrix, *args):
+    # matrix normalized before the assessment
+    return matrix
+
+
+def _astype(preferences, dtype):
+    if isinstance(preferences, tuple):
+        return tuple(pref.astype(dtype) for pref in preferences)
+    return preferences.astype(dtype)
+
+
+class EvaluationMixin():
+    """
+        Assessment steps shared by method objects. Classes define the ranking direction in _descending,
+        the method core in _assess and, if the default validation does not fit, _validate.
+        Methods assessing unique alternatives list intermediate results with alternatives in rows in _trace_rows.
+        Methods reading the matrix only through the normalization set _normalized_codebook, their _assess
+        accepts the normalization replacing the configured one
+    """
+    _trace_rows = ()
+    _trace_offset = 0
+    _normalized_codebook = False
+
+    def evaluate(self, matrix, weights, *args, dtype=None, intermediates=False, **kwargs):
+        """
+            Calculates the alternatives preferences and ranking without changing the object.
+            The method can be called concurrently from many threads
+
+            Parameters
+            ----------
+                matrix : ndarray
+                    Decision matrix / alternatives data.
+                    Alternatives are in rows and Criteria are in columns.
+
+                weights : ndarray
+                    Vector of criteria weights
+
+                *args, **kwargs
+                    Parameters of the method as in the method call, e.g. types of criteria
+
+                dtype : dtype, default=None
+                    Floating point data type used in computations, configured data type if None
+
+                intermediates : bool, default=False
+                    Include intermediate results of the method
+
+            Returns
+            ----------
+                MethodResult:
+                    Read-only preferences, ranking and intermediate results
+        """
+        trace = {} if intermediates else None
+        preferences = self._solve(matrix, weights, *args, dtype=dtype, trace=trace, **kwargs)
+        return make_result(preferences, _ranking(preferences, self._descending), trace)
+
+    def _validate(self, matrix, weights, *args, **kwargs):
+        Validator.fuzzy_validation(matrix, weights)
+
+    def _solve(self, matrix, weights, *args, dtype=None, trace=None, **kwargs):
+        # validate data
+        self._validate(matrix, weights, *args, **kwargs)
+
+        dtype = resolve_dtype(dtype)
+        normalization = getattr(self, 'normalization', None)
+        if isinstance(matrix, TFNCodebook) and self._normalized_codebook and normalization in _APPLY:
+            # normalized lookup table of terms is gathered by codes, the encoded matrix is not decoded
+            matrix = matrix.normalize(normalization, args[0] if args else None, dtype)
+            kwargs = dict(kwargs, normalization=_normalized)
+        matrix, weights = np.asarray(matrix, dtype=dtype), np.asarray(weights, dtype=dtype)
+        dedup = getattr(self, 'deduplicate', False)
+        if dedup:
+            matrix, inverse = deduplicate(self, matrix)
+        with use_dtype(dtype):
+            preferences = _astype(self._assess(matrix, weights, *args, trace=trace, **kwargs), dtype)
+        if dedup:
+            preferences = scatter(preferences, inverse)
+            if trace is not None:
+                # intermediate results describe the same alternatives as the preferences
+                for name in self._trace_rows:
+                    trace[name] = scatter_rows(trace[name], inverse, self._trace_offset)
+        return preferences
+
+    def rank(self):
+        """
+            Calculates the alternatives ranking based on the obtained preferences
+
+            Returns
+            ----------
+                ndarray:
+                    Ranking of alternatives, rankings for S, R, Q approaches in rows for fVIKOR
+        """
+        try:
+            return _ranking(self.preferences, self._descending)
+        except AttributeError:
+            raise AttributeError('Cannot calculate ranking before assessment')
+        except:
+            raise ValueError('Error occurred in ranking calculation')
+
+    def top_k(self, k):
+        """
+            Selects the best alternatives based on the obtained preferences without calculating the whole ranking
+
+            Parameters
+            ----------
+                k : int
+                    Number of selected alternatives
+
+            Returns
+            ----------
+                ndarray:
+                    Indices of the best alternatives, from the best one. Q preferences are used for fVIKOR
+        """
+        try:
+            preferences = self.preferences
+        except AttributeError:
+            raise AttributeError('Cannot select alternatives before assessment')
+        # methods returning several preferences select alternatives with the last one, e.g. Q of fVIKOR
+        return top_k(preferences[-1] if isinstance(preferences, tuple) else preferences, k, self._descending)
+
@@ -0,0 +1,170 @@
+# Copyright (c) 2024 Jakub Więckowski
+
+import copy
+import threading
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
+
+import numpy as np
+from ..config import get_dtype
+from .cache import array_digest
+
+__all__ = [
+    'compare_methods'
+]
+
+
+class SharedStage():
+    def __init__(self, function, matrix):
+        """
+            Wraps the normalization function to compute its result for the given matrix only once
+
+            Parameters
+            ----------
+                function: callable
+                    Function used to normalize the decision matrix
+
+                matrix : ndarray
+                    Decision matrix for which the results are shared
+
+        """
+        self.function = function
+        self.matrix = matrix
+        self.results = {}
+        self.errors = {}
+        self.__lock = threading.Lock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_SharedStage__lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.__lock = threading.Lock()
+
+    def _is_source(self, matrix):
+        if matrix is self.matrix:
+            return True
+        return matrix.shape == self.matrix.shape and np.array_equal(matrix, self.matrix)
+
+    def _key(self, args, kwargs):
+        return (get_dtype(), tuple(array_digest(a) if isinstance(a, np.ndarray) else a for a in args),
+                tuple(sorted(kwargs.items())))
+
+    def prepare(self, *args, **kwargs):
+        """
+            Computes the result for the source matrix in advance.
+            Error is recorded and raised when the method calls the normalization with the same arguments
+
+            Parameters
+            ----------
+                args, kwargs
+                    Arguments of the normalization function given after the matrix
+        """
+        try:
+            self(self.matrix, *args, **kwargs)
+        except Exception as error:
+            with self.__lock:
+                self.errors[self._key(args, kwargs)] = error
+
+    def __call__(self, matrix, *args, **kwargs):
+        # other matrices (e.g. extended matrix in ARAS) are normalized directly
+        if not self._is_source(matrix):
+            return self.function(matrix, *args, **kwargs)
+
+        key = self._key(args, kwargs)
+        with self.__lock:
+            if key in self.errors:
+                raise self.errors[key]
+            if key not in self.results:
+                nmatrix = self.function(matrix, *args, **kwargs)
+                if np.shares_memory(nmatrix, matrix):
+                    nmatrix = nmatrix.copy()
+                nmatrix.flags.writeable = False
+                self.results[key] = nmatrix
+            return self.results[key]
+
+
+def _evaluate(method, matrix, weights, types, kwargs):
+    preferences = method(matrix, weights, types, **kwargs)
+    ranking = method.rank()
+    # methods with multiple preference vectors (VIKOR) are compared with the final one
+    if isinstance(preferences, tuple):
+        preferences, ranking = preferences[-1], ranking[-1]
+    return np.asarray(preferences, dtype=float), np.asarray(ranking, dtype=float)
+
+
+def compare_methods(methods, matrix, weights, types, parameters=None, executor='thread', max_workers=None):
+    """
+        Calculates preferences and rankings of alternatives with multiple methods.
+        Normalization shared by methods is calculated only once for the decision matrix
+
+        Parameters
+        ----------
+            methods : list
+                Configured method objects from pyfdm.methods
+
+            matrix : ndarray
+                Decision matrix / alternatives data.
+                Alternatives are in rows and Criteria are in columns.
+
+            weights : ndarray
+                Vector of criteria weights
+
+            types : ndarray
+                Types of criteria, 1 profit, -1 cost
+
+            parameters : list, default=None
+                Additional keyword arguments for each method, e.g. bounds for fSPOTIS or weights in other form
+
+            executor : str or Executor, default='thread'
+                Executor used to run methods, 'thread', 'process', None for sequential run or Executor instance
+
+            max_workers : int, default=None
+                Number of workers used by created executor
+
+        Returns
+        -------
+            ndarray
+                Preferences of alternatives, methods are in rows
+
+            ndarray
+                Rankings of alternatives, methods are in rows
+    """
+    if parameters is None:
+        parameters = [{}] * len(methods)
+    if len(parameters) != len(methods):
+        raise ValueError(f'Number of parameters should equal number of methods, not {len(parameters)}, {len(methods)}')
+
+    # shared stages are precomputed so results can be reused also in worker processes
+    stages = {}
+    for method in methods:
+        normalization = getattr(method, 'normalization', None)
+        if normalization is not None and normalization not in stages:
+            stage = SharedStage(normalization, matrix)
+            # methods calling the normalization without types compute it when they run
+            stage.prepare(types)
+            stages[normalization] = stage
+
+    tasks = []
+    for method, kwargs in zip(methods, parameters):
+        method = copy.copy(method)
+        if getattr(method, 'normalization', None) is not None:
+            method.normalization = stages[method.normalization]
+        kwargs = dict(kwargs)
+        tasks.append((method, matrix, kwargs.pop('weights', weights), types, kwargs))
+
+    if executor is None:
+        results = [_evaluate(*task) for task in tasks]
+    elif isinstance(executor, Executor):
+        results = [f.result() for f in [executor.submit(_evaluate, *task) for task in tasks]]
+    elif executor in ('thread', 'process'):
+        pool = ThreadPoolExecutor if executor == 'thread' else ProcessPoolExecutor
+        with pool(max_workers=max_workers) as ex:
+            results = [f.result() for f in [ex.submit(_evaluate, *task) for task in tasks]]
+    else:
+        raise ValueError(f'Executor should be thread, process, None or Executor instance, not {executor}')
+
+    preferences = np.array([r[0] for r in results])
+    rankings = np.array([r[1] for r in results])
+    return preferences, rankings
@@ -0,0 +1,198 @@
+# Copyright (c) 2024 Jakub Więckowski
+
+import asyncio
+import threading
+
+import numpy as np
+from ..config import resolve_dtype
+
+__all__ = [
+    'AsyncEvaluator',
+    'row_separable'
+]
+
+# methods assessing each alternative independently of the others when the decision matrix is not normalized
+SEPARABLE_METHODS = ('fSPOTIS', 'fWPM', 'fWSM')
+
+
+def row_separable(method):
+    """
+        Checks if the preferences of alternatives do not depend on other alternatives in the decision matrix,
+        so decision matrices of many requests can be assessed together
+
+        Parameters
+        ----------
+            method : object
+                Method object from pyfdm.methods
+
+        Returns
+        -------
+            bool
+                True if decision matrices can be concatenated
+    """
+    return type(method).__name__ in SEPARABLE_METHODS and getattr(method, 'normalization', None) is None
+
+
+def _key(value):
+    # hashable description of the argument, arrays are compared by their values
+    array = np.asarray(value)
+    if array.dtype != object:
+        return (array.shape, array.dtype.str, array.tobytes())
+    try:
+        hash(value)
+        return value
+    except TypeError:
+        return id(value)
+
+
+class AsyncEvaluator():
+    def __init__(self, method, window=0.002, max_batch=256, executor=None):
+        """
+            Creates asynchronous facade of the method evaluating requests in the executor.
+            Requests given within the time window are evaluated in one batch, requests with the same criteria,
+            weights and parameters are assessed with one call of the method if its preferences are row separable.
+            Only fSPOTIS, fWPM and fWSM without normalization are row separable (see SEPARABLE_METHODS),
+            requests to other methods are evaluated one by one in the batch
+
+            Parameters
+            ----------
+                method : object
+                    Configured method object from pyfdm.methods
+
+                window : float, default=0.002
+                    Time in seconds for which requests are collected before the batch is evaluated
+
+                max_batch : int, default=256
+                    Number of requests evaluated at once, batch is evaluated before the window ends when reached
+
+                executor : Executor, default=None
+                    Executor evaluating batches, default executor of the event loop if None
+
+        """
+        if window < 0:
+            raise ValueError(f'Window should not be negative, not {window}')
+        if max_batch < 1:
+            raise ValueError(f'Maximum batch size should be positive, not {max_batch}')
+
+        self.method = method
+        self.window = window
+        self.max_batch = max_batch
+        self.executor = executor
+        self.separable = row_separable(method)
+        self.batches = 0
+        self.calls = 0
+        self.__lock = threading.Lock()
+        self.__pending = []
+        self.__timer = None
+        self.__running = set()
+
+    async def evaluate(self, matrix, *args, **kwargs):
+        """
+            Calculates the alternatives preferences without blocking the event loop
+
+            Parameters
+            ----------
+                matrix : ndarray
+                    Decision matrix / alternatives data.
+                    Alternatives are in rows and Criteria are in columns.
+
+                args, kwargs
+                    Weights, types and other arguments of the method
+
+            Returns
+            ----------
+                ndarray:
+                    Read-only preferences calculated for alternatives
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self.__pending.append((matrix, args, kwargs, future))
+        if len(self.__pending) >= self.max_batch:
+            self._flush(loop)
+        elif self.__timer is None:
+            self.__timer = loop.call_later(self.window, self._flush, loop)
+        return await future
+
+    async def flush(self):
+        """
+            Evaluates collected requests without waiting for the end of the window and waits for all running batches
+        """
+        self._flush(asyncio.get_running_loop())
+        if self.__running:
+            await asyncio.gather(*self.__running, return_exceptions=True)
+
+    def _flush(self, loop):
+        if self.__timer is not None:
+            self.__timer.cancel()
+            self.__timer = None
+        pending, self.__pending = self.__pending, []
+        if not pending:
+            return
+
+        self.batches += 1
+        task = loop.run_in_executor(self.executor, self._run_batch, [request[:3] for request in pending])
+        self.__running.add(task)
+
+        def done(task):
+            self.__running.discard(task)
+            futures = [request[3] for request in pending]
+            if task.cancelled():
+                for future in futures:
+                    future.cancel()
+                return
+            if task.exception() is not None:
+                results = [(None, task.exception())] * len(futures)
+            else:
+                results = task.result()
+            for future, (result, exception) in zip(futures, results):
+                # requests cancelled by the caller are skipped
+                if future.done():
+                    continue
+                if exception is None:
+                    future.set_result(result)
+                else:
+                    future.set_exception(exception)
+
+        task.add_done_callback(done)
+
+    def _call(self, matrix, args, kwargs):
+        # batches of many loops may run in the executor at the same time
+        with self.__lock:
+            self.calls += 1
+        return self.method.evaluate(matrix, *args, **kwargs).preferences
+
+    def _single(self, request):
+        try:
+            return self._call(*request), None
+        except Exception as exception:
+            return None, exception
+
+    def _run_batch(self, requests):
+        results = [None] * len(requests)
+        groups = {}
+        for i, (matrix, args, kwargs) in enumerate(requests):
+            matrix = np.asarray(matrix, dtype=resolve_dtype(kwargs.get('dtype')))
+            if not self.separable or matrix.ndim != 3:
+                results[i] = self._single((matrix, args, kwargs))
+                continue
+            key = (matrix.shape[1:], tuple(_key(a) for a in args),
+                   tuple(sorted((name, _key(value)) for name, value in kwargs.items())))
+            groups.setdefault(key, []).append((i, matrix))
+
+        for members in groups.values():
+            args, kwargs = requests[members[0][0]][1:]
+            if len(members) == 1:
+                results[members[0][0]] = self._single((members[0][1], args, kwargs))
+                continue
+            try:
+                preferences = self._call(np.concatenate([matrix for _, matrix in members]), args, kwargs)
+            except Exception:
+                # invalid request is found by evaluating the requests separately
+                for i, matrix in members:
+                    results[i] = self._single((matrix, args, kwargs))
+                continue
+            splits = np.cumsum([matrix.shape[0] for _, matrix in members])[:-1]
+            for (i, _), part in zip(members, np.split(preferences, splits)):
+                results[i] = (part, None)
+
+        return results
@@ -0,0 +1,139 @@
+# Copyright (c) 2024 Jakub Więckowski
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+__all__ = [
+    'evaluate_shared'
+]
+
+# arrays attached by the worker process
+_worker = {}
+
+
+def _share(array, blocks):
+    # copies the array to the new shared memory block
+    array = np.ascontiguousarray(array)
+    block = shared_memory.SharedMemory(create=True, size=max(1, array.nbytes))
+    blocks.append(block)
+    view = np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)
+    view[...] = array
+    return (block.name, array.shape, array.dtype.str), view
+
+
+def _attach(spec, writeable=False):
+    name, shape, dtype = spec
+    block = shared_memory.SharedMemory(name=name)
+    view = np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf)
+    view.flags.writeable = writeable
+    return block, view
+
+
+def _init_worker(method, matrix, weights, types, out):
+    _worker.clear()
+    _worker['method'] = method
+    _worker['blocks'] = []
+    for name, spec, writeable in (('matrix', matrix, False), ('weights', weights, False),
+                                  ('types', types, False), ('out', out, True)):
+        if spec is None:
+            _worker[name] = None
+            continue
+        block, view = _attach(spec, writeable)
+        _worker['blocks'].append(block)
+        _worker[name] = view
+
+
+def _evaluate(method, matrix, weights, types, kwargs):
+    if types is None:
+        result = method(matrix, weights, **kwargs)
+    else:
+        result = method(matrix, weights, types, **kwargs)
+    return np.asarray(result)
+
+
+def _run(start, stop, parameters):
+    w = _worker
+    for i, kwargs in zip(range(start, stop), parameters):
+        w['out'][i] = _evaluate(w['method'], w['matrix'], w['weights'][i], w['types'], kwargs)
+    return stop - start
+
+
+def evaluate_shared(method, matrix, weights, types=None, parameters=None, max_workers=None, chunksize=None, mp_context=None):
+    """
+        Calculates the alternatives preferences for many samples of weights and parameters in worker processes.
+        Decision matrix, samples and results are placed in shared memory, workers use them without copying
+
+        Parameters
+        ----------
+            method : object
+                Configured method object from pyfdm.methods
+
+            matrix : ndarray
+                Decision matrix / alternatives data.
+                Alternatives are in rows and Criteria are in columns.
+
+            weights : ndarray
+                Samples of criteria weights, crisp (s, n) or fuzzy (s, n, 3)
+
+            types : ndarray, default=None
+                Types of criteria, 1 profit, -1 cost
+
+            parameters : list, default=None
+                Additional keyword arguments of the method for each sample, e.g. bounds for fSPOTIS or v for fVIKOR
+
+            max_workers : int, default=None
+                Number of worker processes, number of processors if None
+
+            chunksize : int, default=None
+                Number of samples evaluated in one task, chosen to give few tasks per worker if None
+
+            mp_context : multiprocessing context, default=None
+                Context used to start worker processes
+
+        Returns
+        -------
+            ndarray
+                Results of the method for each sample, samples are in rows
+    """
+    matrix = np.asarray(matrix, dtype=float)
+    weights = np.asarray(weights, dtype=float)
+    samples = weights.shape[0]
+    if samples == 0:
+        raise ValueError('At least one sample of weights should be given')
+    if parameters is None:
+        parameters = [{}] * samples
+    if len(parameters) != samples:
+        raise ValueError(f'Number of parameters should equal number of samples, not {len(parameters)}, {samples}')
+
+    # shape of results is taken from the first sample evaluated in the parent process
+    first = _evaluate(method, matrix, weights[0], types, parameters[0])
+
+    max_workers = max_workers or os.cpu_count() or 1
+    if chunksize is None:
+        chunksize = max(1, -(-(samples - 1) // (4 * max_workers)))
+
+    blocks, out = [], None
+    try:
+        out_spec, out = _share(np.zeros((samples, ) + first.shape, dtype=first.dtype), blocks)
+        specs = (_share(matrix, blocks)[0], _share(weights, blocks)[0],
+                 None if types is None else _share(np.asarray(types), blocks)[0], out_spec)
+        out[0] = first
+
+        if samples > 1:
+            with ProcessPoolExecutor(max_workers=max_workers, mp_context=mp_context,
+                                     initializer=_init_worker, initargs=(method, ) + specs) as executor:
+                futures = [executor.submit(_run, start, min(start + chunksize, samples), parameters[start:start + chunksize])
+                           for start in range(1, samples, chunksize)]
+                for future in futures:
+                    future.result()
+
+        return out.copy()
+    finally:
+        # views are released before shared memory is closed
+        out = None
+        for block in blocks:
+            block.close()
+            block.unlink()
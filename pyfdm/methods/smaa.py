@@ -0,0 +1,224 @@
+# Copyright (c) 2024 Jakub Więckowski
+
+from collections import namedtuple
+
+import numpy as np
+from scipy.stats import rankdata
+from .utils import normalizations
+from .utils.defuzzifications import tfn_defuzzify
+from .utils.distances import tfn_distances
+
+__all__ = [
+    'SMAAResult',
+    'triangular_samples',
+    'smaa'
+]
+
+# rank acceptability indices (m, m) and central weights (m, n) of alternatives
+SMAAResult = namedtuple('SMAAResult', ['acceptability', 'central_weights'])
+
+# methods expecting fuzzy weights, crisp weights are given as TFNs with equal components
+_FUZZY_WEIGHTS = ('fTOPSIS', )
+
+# normalizations calculated separately for each criterion, sum_normalization reverses the order of criteria statistics
+_COLUMN_NORMALIZATIONS = (normalizations.max_normalization, normalizations.linear_normalization,
+                          normalizations.minmax_normalization, normalizations.vector_normalization,
+                          normalizations.saw_normalization, normalizations.sqrt_normalization,
+                          normalizations.waspas_normalization, normalizations.cocoso_normalization)
+
+
+def triangular_samples(matrix, samples, rng=None):
+    """
+        Draws crisp decision matrices treating each Triangular Fuzzy Number as a triangular distribution.
+        Values are obtained with the inverse of cumulative distribution function
+
+        Parameters
+        ----------
+            matrix : ndarray
+                Decision matrix / alternatives data.
+                Alternatives are in rows and Criteria are in columns.
+
+            samples : int
+                Number of drawn matrices
+
+            rng : Generator or int, default=None
+                Random numbers generator or seed
+
+        Returns
+        -------
+            ndarray
+                Crisp decision matrices, shape (samples, m, n)
+    """
+    matrix = np.asarray(matrix, dtype=float)
+    rng = np.random.default_rng(rng)
+    a, b, c = matrix[..., 0], matrix[..., 1], matrix[..., 2]
+    u = rng.random((samples, ) + a.shape)
+
+    width = c - a
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # probability of values lower than the middle value, degenerated TFNs have all values equal
+        split = np.where(width > 0, (b - a) / width, 0)
+    left = a + np.sqrt(u * width * (b - a))
+    right = c - np.sqrt((1 - u) * width * (c - b))
+    return np.where(u < split, left, right)
+
+
+def _weights(weights, size, n, rng):
+    if weights is None:
+        # uniform distribution over weights summing to 1
+        return rng.dirichlet(np.ones(n), size)
+    weights = np.asarray(weights, dtype=float)
+    if weights.shape != (n, ):
+        raise ValueError(f'Weights should be given as crisp vector of length {n}, not array with shape {weights.shape}')
+    return np.broadcast_to(weights, (size, n))
+
+
+def _wsm(method, nmatrix, weights, types):
+    return tfn_defuzzify(method.defuzzify, np.sum(nmatrix * weights[:, None, :, None], axis=2))
+
+
+def _wpm(method, nmatrix, weights, types):
+    return tfn_defuzzify(method.defuzzify, np.prod(nmatrix ** weights[:, None, :, None], axis=2))
+
+
+def _topsis(method, nmatrix, weights, types):
+    # weights greater than 1 are divided by the greatest weight as in normalize_weights
+    scale = np.where(np.any(weights > 1, axis=1), np.max(weights, axis=1), 1)
+    wmatrix = nmatrix * (weights / scale[:, None])[:, None, :, None]
+    fpis = np.sum(tfn_distances(method.distance, wmatrix, np.ones(3)), axis=2)
+    fnis = np.sum(tfn_distances(method.distance, wmatrix, np.zeros(3)), axis=2)
+    return fnis / (fpis + fnis)
+
+
+def _moora(method, nmatrix, weights, types):
+    wmatrix = nmatrix * weights[:, None, :, None]
+    Sp = np.sum(wmatrix[:, :, types == 1], axis=2)
+    Sm = np.sum(wmatrix[:, :, types == -1], axis=2)
+    return np.sqrt(1/3 * np.sum((Sp - Sm)**2, axis=2))
+
+
+# methods assessing the whole batch at once and whether their normalization requires types of criteria
+_BATCHED = {
+    'fWSM': (_wsm, False),
+    'fWPM': (_wpm, False),
+    'fTOPSIS': (_topsis, True),
+    'fMOORA': (_moora, True),
+}
+
+
+def _batched(method, args):
+    # subclasses are evaluated sample by sample, they may change the assessment
+    try:
+        assess, typed = _BATCHED[type(method).__name__]
+    except KeyError:
+        return None
+    if typed and not args:
+        return None
+    normalization = method.normalization
+    if normalization in _COLUMN_NORMALIZATIONS or (normalization is None and not typed):
+        return assess, typed
+    return None
+
+
+def _normalize(normalization, matrices, types):
+    # samples are placed side by side as criteria of one TFN matrix with equal components (m, s * n, 3)
+    s, m, n = matrices.shape
+    matrix = np.repeat(np.moveaxis(matrices, 0, 1).reshape(m, s * n, 1), 3, axis=2)
+    if normalization is not None:
+        matrix = normalization(matrix) if types is None else normalization(matrix, np.tile(types, s))
+    return np.moveaxis(matrix.reshape(m, s, n, 3), 1, 0)
+
+
+def _sample(method, matrices, weights, s):
+    # crisp sample given as TFN matrix with equal components
+    fuzzy_weights = any(cls.__name__ in _FUZZY_WEIGHTS for cls in type(method).__mro__)
+    w = np.repeat(weights[s], 3).reshape(-1, 3) if fuzzy_weights else weights[s]
+    return np.repeat(matrices[s][..., None], 3, axis=2), w
+
+
+def _ranks(method, matrices, weights, args):
+    batched = _batched(method, args)
+    if batched is not None:
+        assess, typed = batched
+        # arguments are validated as in the assessment of a single sample
+        method._validate(*_sample(method, matrices, weights, 0), *args)
+        types = np.asarray(args[0]) if typed else None
+        nmatrix = _normalize(method.normalization, matrices, types)
+        preferences = assess(method, nmatrix, weights, types)
+        # rows sorted separately, tied alternatives share the better rank
+        return rankdata(-preferences if method._descending else preferences, method='min', axis=1).astype(int)
+
+    ranks = np.empty(matrices.shape[:2], dtype=int)
+    for s in range(matrices.shape[0]):
+        ranking = np.asarray(method.evaluate(*_sample(method, matrices, weights, s), *args).ranking)
+        # rankings of fVIKOR are taken from Q approach
+        ranks[s] = rankdata(ranking[-1] if ranking.ndim == 2 else ranking, method='min')
+    return ranks
+
+
+def smaa(method, matrix, *args, weights=None, samples=10000, batch_size=1024, rng=None):
+    """
+        Calculates rank acceptability indices and central weights of alternatives with Stochastic Multicriteria
+        Acceptability Analysis. Crisp decision matrices are drawn from triangular distributions given by TFNs
+        in batches, so the memory usage grows with batch_size and the size of the decision matrix, not with the number of samples.
+        fWSM, fWPM, fTOPSIS and fMOORA with normalizations calculated separately for each criterion assess the whole batch
+        at once, other methods and configurations are evaluated sample by sample
+
+        Parameters
+        ----------
+            method : object
+                Configured method object from pyfdm.methods
+
+            matrix : ndarray
+                Decision matrix / alternatives data.
+                Alternatives are in rows and Criteria are in columns.
+
+            args
+                Types of criteria and other arguments of the method
+
+            weights : ndarray, default=None
+                Crisp criteria weights, weights drawn uniformly from weights summing to 1 if None
+
+            samples : int, default=10000
+                Number of drawn decision matrices
+
+            batch_size : int, default=1024
+                Number of decision matrices drawn and assessed at once
+
+            rng : Generator or int, default=None
+                Random numbers generator or seed
+
+        Returns
+        -------
+            SMAAResult
+                Share of samples in which the alternative (rows) obtained the rank (columns),
+                mean weights for which the alternative was the best one, NaN if it was never the best one
+    """
+    matrix = np.asarray(matrix, dtype=float)
+    if matrix.ndim != 3 or matrix.shape[2] != 3:
+        raise ValueError('TFN matrix elements should all have length of 3')
+    if samples < 1:
+        raise ValueError(f'Number of samples should be positive, not {samples}')
+
+    rng = np.random.default_rng(rng)
+    # separate streams for matrices and weights, so drawn samples do not depend on the batch size
+    matrix_rng, weights_rng = (np.random.default_rng(seed) for seed in rng.integers(2**63, size=2))
+    m, n = matrix.shape[:2]
+    counts = np.zeros((m, m))
+    best = np.zeros(m)
+    weights_sum = np.zeros((m, n))
+
+    for start in range(0, samples, batch_size):
+        size = min(batch_size, samples - start)
+        matrices = triangular_samples(matrix, size, matrix_rng)
+        w = _weights(weights, size, n, weights_rng)
+        ranks = _ranks(method, matrices, w, args)
+
+        np.add.at(counts, (np.broadcast_to(np.arange(m), ranks.shape), ranks - 1), 1)
+        first = ranks == 1
+        best += np.sum(first, axis=0)
+        weights_sum += first.T.astype(float) @ w
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        central_weights = weights_sum / best[:, None]
+    return SMAAResult(counts / samples, central_weights)
@@ -1,10 +1,12 @@
-# Copyright (c) 2023 Jakub Więckowski, Andrii Shekhovtsov
+# Copyright (c) 2023-2024 Jakub Więckowski, Andrii Shekhovtsov
 
 import numpy as np
 from functools import reduce
 from pyfdm.TFN import TFN
+from ..utils.jit import spotis_aggregation
+from ...config import resolve_dtype
 
-def fuzzy(matrix, weights, normalization, bounds, isp):
+def fuzzy(matrix, weights, normalization, bounds, isp, trace=None, backend='numpy'):
     """
         Calculates the alternatives preferences based on Triangular Fuzzy Number extension
 
@@ -26,6 +28,12 @@ def fuzzy(matrix, weights, normalization, bounds, isp):
             isp : ndarray
                 Vector of Ideal Solution Point
                 
+            trace : dict, default=None
+                Dictionary filled with intermediate results if given
+
+            backend : str, default='numpy'
+                'numba' for compiled kernels, 'numpy' for NumPy implementation
+
         Returns
         -------
             ndarray:
@@ -47,7 +55,21 @@ def fuzzy(matrix, weights, normalization, bounds, isp):
     if normalization is not None:
         nmatrix = normalization(matrix)
     else:
-        nmatrix = matrix.copy()
+        # matrix is not modified, strided views are used without copying
+        nmatrix = matrix
+
+    if backend == 'numba':
+        # TFN arithmetic on arrays of components, abs reverses components with greater lower value
+        d = np.abs((nmatrix - isp[None, :, None]) / (bounds[:, 1] - bounds[:, 0])[None, :, None])
+        d = np.where((d[..., 0] > d[..., 2])[..., None], d[..., ::-1], d)
+        res = spotis_aggregation(np.ascontiguousarray(d, dtype=resolve_dtype()),
+                                 np.asarray(weights, dtype=resolve_dtype()))
+
+        # intermediate results
+        if trace is not None:
+            trace.update(nmatrix=nmatrix, d=d)
+
+        return res
 
     tfn_matrix = np.array([[TFN(*m) for m in row] for row in nmatrix])
 
@@ -59,4 +81,8 @@ def fuzzy(matrix, weights, normalization, bounds, isp):
     for alt in d:
         res.append(aggregation(alt, weights))
 
+    # intermediate results
+    if trace is not None:
+        trace.update(nmatrix=nmatrix, d=d)
+
     return np.array(res)
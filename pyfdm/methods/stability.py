@@ -0,0 +1,173 @@
+# Copyright (c) 2024 Jakub Więckowski
+
+import numpy as np
+from .gradients import LINEAR_DEFUZZIFICATIONS
+
+__all__ = [
+    'weight_stability'
+]
+
+TARGETS = ('ranking', 'top')
+
+
+def _weights_at(weights, j, x):
+    # crisp weight of criterion set to x and other weights rescaled to keep their sum, fuzzy weight multiplied by x
+    if weights.ndim == 1:
+        w = weights * ((1 - x) / (1 - weights[j]))
+        w[j] = x
+        return w
+    w = weights.copy()
+    w[j] = w[j] * x
+    return w
+
+
+def _linear_scores(method, matrix, weights, args):
+    # scores ordered as preferences and their changes with the position of each weight
+    trace = method.evaluate(matrix, weights, *args, dtype=np.float64, intermediates=True).intermediates
+    if type(method).__name__ == 'fARAS':
+        # ranking follows S of alternatives, S of optimal alternative in row 0 is common to all of them
+        scores, unit = trace['S'][1:], trace['nmatrix'][1:] / 3
+    else:
+        coefficients = np.asarray(LINEAR_DEFUZZIFICATIONS[method.defuzzify])
+        scores, unit = np.sum(trace['sum_w'] * coefficients, axis=1), trace['nmatrix'] * coefficients
+
+    if weights.ndim == 2:
+        # contribution of the criterion is proportional to the factor of its weight
+        return scores, np.sum(unit * weights, axis=2)
+    # score with weight x of the criterion is x c_j + (1 - x) (score - c_j w_j) / (1 - w_j)
+    unit = np.sum(unit, axis=2)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rest = (scores[:, None] - unit * weights) / (1 - weights)
+    return scores, unit - rest
+
+
+def _is_linear(method):
+    name = type(method).__name__
+    if name == 'fARAS':
+        return True
+    return name == 'fWSM' and getattr(method, 'defuzzify', None) in LINEAR_DEFUZZIFICATIONS
+
+
+def _closed_form(method, matrix, weights, args, target, position, domain):
+    scores, slopes = _linear_scores(method, matrix, weights, args)
+    order = np.argsort(-scores, kind='stable')
+    if target == 'ranking':
+        # first change of order of lines is always between neighbouring alternatives
+        better, worse = order[:-1], order[1:]
+    else:
+        better, worse = np.full(order.shape[0] - 1, order[0]), order[1:]
+
+    diff = (scores[better] - scores[worse])[:, None]
+    dc = slopes[better] - slopes[worse]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        crossing = position - diff / dc
+        upper = np.min(np.where(dc < 0, crossing, np.inf), axis=0, initial=np.inf)
+        lower = np.max(np.where(dc > 0, crossing, -np.inf), axis=0, initial=-np.inf)
+    # tied alternatives are separated by any change of weight with different slopes
+    tied = np.any((diff == 0) & (dc != 0), axis=0)
+    upper[tied], lower[tied] = position[tied], position[tied]
+    return np.maximum(lower, domain[0]), np.minimum(upper, domain[1])
+
+
+def _ranking(method, matrix, weights, args):
+    ranking = np.asarray(method.evaluate(matrix, weights, *args).ranking)
+    # rankings of fVIKOR are compared with Q approach
+    return ranking[-1] if ranking.ndim == 2 else ranking
+
+
+def _same(ranking, reference, target):
+    if target == 'ranking':
+        return np.array_equal(ranking, reference)
+    return np.array_equal(ranking == np.min(ranking), reference == np.min(reference))
+
+
+def _bracket(changed, limit, step, tol):
+    # exponential search for the distance from the current weight changing the ranking, refined with bisection
+    if limit <= 0:
+        return 0.0
+    stable, t = 0.0, min(step, limit)
+    while not changed(t):
+        stable = t
+        if t >= limit:
+            return None
+        t = min(2 * t, limit)
+    unstable = t
+    while unstable - stable > tol:
+        middle = (stable + unstable) / 2
+        if changed(middle):
+            unstable = middle
+        else:
+            stable = middle
+    return (stable + unstable) / 2
+
+
+def weight_stability(method, matrix, weights, *args, target='ranking', tol=1e-6, max_factor=10.0):
+    """
+        Calculates for each criterion the interval of its weight for which the ranking of alternatives
+        (or the best alternative) remains the same. Crisp weight of the criterion is changed with other weights rescaled
+        to keep their sum equal 1, fuzzy weight of the criterion is multiplied by the factor with other weights unchanged.
+        Intervals are solved in closed form from pairs of neighbouring alternatives for fWSM with linear defuzzification
+        and fARAS, for other methods the bounds are bracketed with exponential search and bisection.
+        Crisp weight equal to 1 is rejected, other weights are then all 0 and cannot be rescaled
+
+        Parameters
+        ----------
+            method : object
+                Configured method object from pyfdm.methods
+
+            matrix : ndarray
+                Decision matrix / alternatives data.
+                Alternatives are in rows and Criteria are in columns.
+
+            weights : ndarray
+                Vector of criteria weights in a crisp form (n, ) or as a TFNs (n, 3)
+
+            args
+                Types of criteria and other arguments of the method
+
+            target : str, default='ranking'
+                'ranking' for the whole ranking, 'top' for the best alternatives
+
+            tol : float, default=1e-6
+                Accuracy of bounds found with bisection
+
+            max_factor : float, default=10.0
+                Greatest factor of fuzzy weight searched for methods without closed form
+
+        Returns
+        -------
+            ndarray
+                Lower and upper bound for each criterion, criteria are in rows.
+                Bounds of weight in [0, 1] for crisp weights, bounds of factor of weight for fuzzy weights,
+                upper bound of factor is infinite if no change of ranking was found
+    """
+    if target not in TARGETS:
+        raise ValueError(f'Target should be one of {list(TARGETS)}, not {target}')
+
+    matrix, weights = np.asarray(matrix, dtype=float), np.asarray(weights, dtype=float)
+    n = matrix.shape[1]
+    if weights.ndim == 1 and np.any(weights == 1):
+        raise ValueError(f'Crisp weights should be lower than 1 to rescale other weights, criterion {int(np.argmax(weights == 1))} has weight 1')
+    if weights.ndim == 1:
+        position, domain = weights, (0, 1)
+    else:
+        position, domain = np.ones(n), (0, np.inf)
+
+    if _is_linear(method):
+        return np.stack(_closed_form(method, matrix, weights, args, target, position, domain), axis=1)
+
+    reference = _ranking(method, matrix, weights, args)
+    step = max(tol, 0.01 * float(np.mean(position)))
+
+    intervals = np.zeros((n, 2))
+    for j in range(n):
+        def changed(t, sign=1):
+            w = _weights_at(weights, j, position[j] + sign * t)
+            return not _same(_ranking(method, matrix, w, args), reference, target)
+
+        upper_limit = (domain[1] if weights.ndim == 1 else max_factor) - position[j]
+        lower = _bracket(lambda t: changed(t, -1), position[j] - domain[0], step, tol)
+        upper = _bracket(changed, upper_limit, step, tol)
+        intervals[j] = (domain[0] if lower is None else position[j] - lower,
+                        domain[1] if upper is None else position[j] + upper)
+    return intervals
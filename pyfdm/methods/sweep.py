@@ -0,0 +1,129 @@
+# Copyright (c) 2024 Jakub Więckowski
+
+import itertools
+from collections import namedtuple
+
+import numpy as np
+from .cache import ResultCache, _key_part
+from .utils.distances import tfn_distances
+
+__all__ = [
+    'SweepResult',
+    'CachedStage',
+    'sweep'
+]
+
+# configurations (structured array of names), preferences and rankings of configurations, cache statistics of stages
+SweepResult = namedtuple('SweepResult', ['configurations', 'preferences', 'rankings', 'stages'])
+
+
+class CachedStage():
+    def __init__(self, function, cache, distance=False):
+        """
+            Wraps the normalization or distance function to reuse results for identical input data
+
+            Parameters
+            ----------
+                function: callable
+                    Normalization or distance function
+
+                cache: ResultCache
+                    Cache of results shared between stages of the same kind
+
+                distance: bool, default=False
+                    Whether the function is a distance between Triangular Fuzzy Numbers
+
+        """
+        self.function = function
+        self.cache = cache
+        self.distance = distance
+        self.__name__ = function.__name__
+
+    def __call__(self, *args, **kwargs):
+        if self.distance and any(np.ndim(a) <= 1 for a in args):
+            # distance of single TFNs is cheaper than the lookup
+            return self.function(*args, **kwargs)
+        key = (self.function, _key_part(args), _key_part(kwargs))
+        result = self.cache.get(key)
+        if result is None:
+            if self.distance:
+                # arrays of TFN components, distances of pairs are calculated once if the function is not vectorized
+                a, b = (np.moveaxis(np.asarray(x), 0, -1) for x in args)
+                result = tfn_distances(self.function, a, b)
+            else:
+                result = self.function(*args, **kwargs)
+            self.cache.put(key, result)
+        return result
+
+
+def _stage(name):
+    # constructor parameters of methods computed as separate stages
+    if name == 'normalization':
+        return 'normalization'
+    if name.startswith('distance'):
+        return 'distance'
+    return None
+
+
+def _name(value):
+    return getattr(value, '__name__', repr(value))
+
+
+def sweep(method, grid, matrix, *args, max_bytes=None, **kwargs):
+    """
+        Assesses alternatives with every combination of the method parameters.
+        Normalized matrices and distances are computed once for each distinct input and reused by configurations
+
+        Parameters
+        ----------
+            method : type
+                Method class from pyfdm.methods, e.g. fTOPSIS
+
+            grid : dict
+                Lists of values of constructor parameters, e.g. {'normalization': [...], 'distance': [...]}
+
+            matrix : ndarray
+                Decision matrix / alternatives data.
+                Alternatives are in rows and Criteria are in columns.
+
+            args, kwargs
+                Weights, types and other arguments of the method
+
+            max_bytes : int, default=None
+                Maximum number of bytes of stored results of each stage, no limit if None
+
+        Returns
+        -------
+            SweepResult
+                Configurations as structured array of parameters names, preferences and rankings of configurations
+                in rows, statistics of caches of stages
+    """
+    names = list(grid)
+    if not names:
+        raise ValueError('At least one parameter should be given in the grid')
+    for name in names:
+        if len(grid[name]) == 0:
+            raise ValueError(f'At least one value of parameter {name} should be given')
+
+    caches = {'normalization': ResultCache(None, max_bytes), 'distance': ResultCache(None, max_bytes)}
+    # one wrapper for each function, so configurations share cached results
+    values = {}
+    for name in names:
+        kind = _stage(name)
+        # inputs of distances depend on the normalization, results of stage are reused by combinations of other parameters
+        others = [o for o in names if o != name and not (kind == 'distance' and o == 'normalization')]
+        reused = kind is not None and np.prod([len(grid[o]) for o in others]) > 1
+        values[name] = [CachedStage(v, caches[kind], kind == 'distance') if reused and callable(v) else v for v in grid[name]]
+
+    configurations, preferences, rankings = [], [], []
+    for combination in itertools.product(*(range(len(grid[name])) for name in names)):
+        parameters = {name: values[name][i] for name, i in zip(names, combination)}
+        result = method(**parameters).evaluate(matrix, *args, **kwargs)
+        configurations.append(tuple(_name(grid[name][i]) for name, i in zip(names, combination)))
+        preferences.append(np.asarray(result.preferences))
+        rankings.append(np.asarray(result.ranking))
+
+    table = np.array(configurations, dtype=[(name, f'U{max(len(c[i]) for c in configurations)}')
+                                            for i, name in enumerate(names)])
+    return SweepResult(table, np.array(preferences), np.array(rankings),
+                       {kind: cache.info() for kind, cache in caches.items()})
@@ -1,8 +1,10 @@
 # Copyright (c) 2022 Jakub Więckowski
 
 import numpy as np
+from ...config import resolve_dtype
+from ..utils.distances import tfn_distances
 
-def fuzzy(matrix, weights, types, normalization, distance):
+def fuzzy(matrix, weights, types, normalization, distance, trace=None):
     """
         Calculates the alternatives preferences based on Triangular Fuzzy Number extension
 
@@ -24,6 +26,9 @@ def fuzzy(matrix, weights, types, normalization, distance):
             distance: callable
                 Function used to calculate distance from fuzzy negative solution
 
+            trace : dict, default=None
+                Dictionary filled with intermediate results if given
+
         Returns
         -------
             ndarray:
@@ -41,17 +46,16 @@ def fuzzy(matrix, weights, types, normalization, distance):
     wmatrix = nmatrix * weights
 
     # Fuzzy positive ideal solution and fuzzy negative ideal solution
-    ideal = np.ones((matrix.shape[1], matrix.shape[2]))
-    nideal = np.zeros((matrix.shape[1], matrix.shape[2]))
+    ideal = np.ones((matrix.shape[1], matrix.shape[2]), dtype=resolve_dtype())
+    nideal = np.zeros((matrix.shape[1], matrix.shape[2]), dtype=resolve_dtype())
 
     # Distance to FPIS and FNIS
-    fpis, fnis = np.zeros((matrix.shape[0], ), dtype=object), np.zeros(
-        (matrix.shape[0], ), dtype=object)
-    for i in range(matrix.shape[0]):
-        fpis[i] = np.sum([distance(wmatrix[i, j], ideal[j])
-                          for j in range(matrix.shape[1])])
-        fnis[i] = np.sum([distance(wmatrix[i, j], nideal[j])
-                          for j in range(matrix.shape[1])])
+    fpis = np.sum(tfn_distances(distance, wmatrix, ideal), axis=1)
+    fnis = np.sum(tfn_distances(distance, wmatrix, nideal), axis=1)
+
+    # intermediate results
+    if trace is not None:
+        trace.update(nmatrix=nmatrix, wmatrix=wmatrix, fpis=fpis, fnis=fnis)
 
     return fnis / (fpis + fnis)
 
@@ -1,3 +1,4 @@
 from . import defuzzifications
 from . import distances
 from . import normalizations
+from . import jit
@@ -1,4 +1,6 @@
-# Copyright (c) 2022-2023 Jakub Więckowski
+# Copyright (c) 2022-2024 Jakub Więckowski
+
+import numpy as np
 
 __all__ = [
     'mean_defuzzification',
@@ -154,3 +156,32 @@ def som_defuzzification(a):
                 Crisp value
     """
     return min(a)
+
+def tfn_defuzzify(defuzzify, a):
+    """
+        Defuzzify Triangular Fuzzy Numbers stored in array into crisp values.
+        Defuzzification function is evaluated once on arrays of TFN components if it supports it, otherwise for each TFN
+
+        Parameters
+        ----------
+            defuzzify : callable
+                Function used to defuzzify the TFN into crisp value
+
+            a : ndarray
+                Array of Triangular Fuzzy Numbers, last dimension of length 3
+
+        Returns
+        -------
+            ndarray
+                Crisp values, shape of a without last dimension
+    """
+    a = np.asarray(a)
+    try:
+        with np.errstate(all='ignore'):
+            d = np.asarray(defuzzify(np.moveaxis(a, -1, 0)))
+        if d.shape == a.shape[:-1]:
+            return d
+    except (TypeError, ValueError, IndexError):
+        pass
+
+    return np.array([defuzzify(x) for x in a.reshape(-1, 3)]).reshape(a.shape[:-1])
@@ -1,4 +1,4 @@
-# Copyright (c) 2022-2023 Jakub Więckowski
+# Copyright (c) 2022-2024 Jakub Więckowski
 
 import numpy as np
 
@@ -172,7 +172,7 @@ def mahdavi_distance(a, b):
             float
                 Crisp value representing distance
     """
-    return np.sqrt(1/6 * ( np.sum([ (b[i] - a[i])**2 for i in range(3)]) + (b[1] - a[1])**2 + np.sum([(b[i] - a[i]) * (b[i+1] - a[i+1]) for i in range(2)]) ))
+    return np.sqrt(1/6 * ( np.sum([ (b[i] - a[i])**2 for i in range(3)], axis=0) + (b[1] - a[1])**2 + np.sum([(b[i] - a[i]) * (b[i+1] - a[i+1]) for i in range(2)], axis=0) ))
 
 def chebyshev_distance(a, b):
     """
@@ -191,9 +191,9 @@ def chebyshev_distance(a, b):
         float
             Crisp value representing distance
     """
-    distances = [abs(a[0] - b[0]), abs(a[1] - b[1]), abs(a[2] - b[2])]
+    distances = [np.abs(a[0] - b[0]), np.abs(a[1] - b[1]), np.abs(a[2] - b[2])]
     
-    return max(distances)
+    return np.max(distances, axis=0)
 
 def canberra_distance(a, b):
     """
@@ -213,4 +213,38 @@ def canberra_distance(a, b):
             Crisp value representing distance
     """
 
-    return np.sum([np.abs(a[i] - b[i]) / (np.abs(a[i]) + np.abs(b[i])) for i in range(len(a))])
+    return np.sum([np.abs(a[i] - b[i]) / (np.abs(a[i]) + np.abs(b[i])) for i in range(3)], axis=0)
+
+
+def tfn_distances(distance, a, b):
+    """
+        Calculates distances between Triangular Fuzzy Numbers stored in arrays.
+        Distance function is evaluated once on arrays of TFN components if it supports it, otherwise for each pair of TFNs
+
+        Parameters
+        ----------
+            distance : callable
+                Function used to calculate the distance between two Triangular Fuzzy Numbers
+
+            a : ndarray
+                Array of Triangular Fuzzy Numbers, last dimension of length 3
+
+            b : ndarray
+                Array of Triangular Fuzzy Numbers broadcastable with a
+
+        Returns
+        -------
+            ndarray
+                Crisp distances, shape of a without last dimension
+    """
+    a, b = np.broadcast_arrays(a, b)
+    try:
+        with np.errstate(all='ignore'):
+            d = np.asarray(distance(np.moveaxis(a, -1, 0), np.moveaxis(b, -1, 0)))
+        if d.shape == a.shape[:-1]:
+            return d
+    except (TypeError, ValueError, IndexError):
+        pass
+
+    flat_a, flat_b = a.reshape(-1, 3), b.reshape(-1, 3)
+    return np.array([distance(x, y) for x, y in zip(flat_a, flat_b)]).reshape(a.shape[:-1])
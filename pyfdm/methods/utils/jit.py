@@ -0,0 +1,289 @@
+# Copyright (c) 2024 Jakub Więckowski
+
+import warnings
+
+import numpy as np
+from . import defuzzifications as _defuzzifications
+from . import distances as _distances
+from ...config import resolve_dtype
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+__all__ = [
+    'NUMBA_AVAILABLE',
+    'resolve_backend',
+    'jit_distances'
+]
+
+NUMBA_AVAILABLE = numba is not None
+
+BACKENDS = ('auto', 'numpy', 'numba')
+
+# functions with compiled counterparts, identified by the index used in kernels
+JIT_DEFUZZIFICATIONS = {
+    _defuzzifications.mean_defuzzification: 0,
+    _defuzzifications.mean_area_defuzzification: 1,
+    _defuzzifications.graded_mean_average_defuzzification: 2,
+    _defuzzifications.weighted_mean_defuzzification: 3,
+    _defuzzifications.bisector_defuzzification: 4,
+    _defuzzifications.height_defuzzification: 5,
+    _defuzzifications.lom_defuzzification: 6,
+    _defuzzifications.som_defuzzification: 7,
+}
+
+JIT_DISTANCES = {
+    _distances.euclidean_distance: 0,
+    _distances.weighted_euclidean_distance: 1,
+    _distances.hamming_distance: 2,
+    _distances.weighted_hamming_distance: 3,
+    _distances.vertex_distance: 4,
+    _distances.tran_duckstein_distance: 5,
+    _distances.lr_distance: 6,
+    _distances.mahdavi_distance: 7,
+    _distances.chebyshev_distance: 8,
+    _distances.canberra_distance: 9,
+}
+
+
+def njit(function):
+    # compiled with numba if installed, otherwise the function runs as plain Python
+    if numba is None:
+        return function
+    # numpy error model, e.g. division by zero gives inf or nan as in NumPy implementation instead of raising
+    return numba.njit(cache=True, error_model='numpy')(function)
+
+
+def resolve_backend(backend='auto'):
+    """
+        Returns the backend used in computations of methods cores
+
+        Parameters
+        ----------
+            backend : str, default='auto'
+                'numba' for compiled kernels, 'numpy' for NumPy implementation,
+                'auto' for compiled kernels if numba is installed
+
+        Returns
+        -------
+            str
+                'numba' or 'numpy', NumPy is used with a warning if numba was requested but it is not installed
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f'Backend should be one of {list(BACKENDS)}, not {backend}')
+    if backend == 'auto':
+        return 'numba' if NUMBA_AVAILABLE else 'numpy'
+    if backend == 'numba' and not NUMBA_AVAILABLE:
+        warnings.warn('numba is not installed, NumPy backend is used', RuntimeWarning)
+        return 'numpy'
+    return backend
+
+
+@njit
+def _defuzzify(a0, a1, a2, kind):
+    # expressions follow pyfdm.methods.utils.defuzzifications, so results are the same
+    if kind == 0:
+        return 1/3 * (a0 + a1 + a2)
+    if kind == 1:
+        return 1/4 * (a0 + 2 * a1 + a2)
+    if kind == 2:
+        return 1/6 * (a0 + 4 * a1 + a2)
+    if kind == 3:
+        return a1 + ((a2 - a1) - (a1 - a0)) / (2 + 2)
+    if kind == 4:
+        return (a0 + a2) / 2
+    if kind == 5:
+        return a1
+    if kind == 6:
+        return max(a0, a1, a2)
+    return min(a0, a1, a2)
+
+
+@njit
+def _distance(a0, a1, a2, b0, b1, b2, kind):
+    # expressions follow pyfdm.methods.utils.distances, so results are the same
+    if kind == 0:
+        return np.sqrt(((a0 - b0)**2 + (a1 - b1)**2 + (a2 - b2)**2))
+    if kind == 1:
+        return np.sqrt(((a0 - b0)**2 + 2*(a1 - b1)**2 + (a2 - b2)**2) / 4)
+    if kind == 2:
+        return np.abs(a0 - b0) + np.abs(a1 - b1) + np.abs(a2 - b2)
+    if kind == 3:
+        return (np.abs(a0 - b0) + 2*np.abs(a1 - b1) + np.abs(a2 - b2)) / 4
+    if kind == 4:
+        return np.sqrt(((a0 - b0)**2 + (a1 - b1)**2 + (a2 - b2)**2) / 3)
+    if kind == 5:
+        return (a1 - b1)**2 + 0.5 * (a1 - b1) * ((a2 - b0) - (b2 - b0)) \
+            + 1/9 * ((a2-a1)**2 + (a1-a0)**2 + (b2-b1)**2 + (b1-b0)**2) \
+            - 1/9 * ((a1-a0) * (a2-a1) + (b1-b0) * (b2-b1)) \
+            + 1/6 * (2 * a1 - a0 - a2) * (2 * b1 - b0 - b2)
+    if kind == 6:
+        r = 0.5
+        return (a1 - b1)**2 + ((a1 - r * a0) - (b1 - r * b0))**2 + ((a1 + r * a2) - (b1 + r * b2))**2
+    if kind == 7:
+        return np.sqrt(1/6 * (((b0 - a0)**2 + (b1 - a1)**2 + (b2 - a2)**2) + (b1 - a1)**2
+                              + ((b0 - a0) * (b1 - a1) + (b1 - a1) * (b2 - a2))))
+    if kind == 8:
+        return max(np.abs(a0 - b0), np.abs(a1 - b1), np.abs(a2 - b2))
+    return np.abs(a0 - b0) / (np.abs(a0) + np.abs(b0)) + np.abs(a1 - b1) / (np.abs(a1) + np.abs(b1)) \
+        + np.abs(a2 - b2) / (np.abs(a2) + np.abs(b2))
+
+
+@njit
+def _distances_kernel(a, b, kind):
+    res = np.empty(a.shape[0], dtype=a.dtype)
+    for i in range(a.shape[0]):
+        res[i] = _distance(a[i, 0], a[i, 1], a[i, 2], b[i, 0], b[i, 1], b[i, 2], kind)
+    return res
+
+
+def jit_distances(distance, a, b):
+    """
+        Calculates distances between Triangular Fuzzy Numbers stored in arrays with the compiled kernel.
+        Distances without compiled counterpart are calculated with tfn_distances
+
+        Parameters
+        ----------
+            distance : callable
+                Function used to calculate the distance between two Triangular Fuzzy Numbers
+
+            a : ndarray
+                Array of Triangular Fuzzy Numbers, last dimension of length 3
+
+            b : ndarray
+                Array of Triangular Fuzzy Numbers broadcastable with a
+
+        Returns
+        -------
+            ndarray
+                Crisp distances, shape of a without last dimension
+    """
+    if not NUMBA_AVAILABLE or distance not in JIT_DISTANCES:
+        return _distances.tfn_distances(distance, a, b)
+    a, b = np.asarray(a), np.asarray(b)
+    # floating inputs keep their data type, other inputs are converted to the configured one
+    dtype = np.result_type(a, b)
+    if not np.issubdtype(dtype, np.floating):
+        dtype = resolve_dtype()
+    a, b = np.broadcast_arrays(a.astype(dtype, copy=False), b.astype(dtype, copy=False))
+    res = _distances_kernel(np.ascontiguousarray(a.reshape(-1, 3)), np.ascontiguousarray(b.reshape(-1, 3)),
+                            JIT_DISTANCES[distance])
+    return res.reshape(a.shape[:-1])
+
+
+@njit
+def spotis_aggregation(d, weights, n=512):
+    """
+        Aggregates distances of alternatives from the ideal solution with the algebraic sum of weighted
+        membership functions and calculates their centers of gravity
+
+        Parameters
+        ----------
+            d : ndarray
+                Distances of alternatives from the ideal solution as Triangular Fuzzy Numbers
+
+            weights : ndarray
+                Vector of criteria weights in a crisp form
+
+            n : int, default=512
+                Number of points of membership functions
+
+        Returns
+        -------
+            ndarray
+                Crisp preferences of alternatives
+    """
+    res = np.empty(d.shape[0], dtype=d.dtype)
+    for i in range(d.shape[0]):
+        x = np.linspace(np.min(d[i, :, 0]), np.max(d[i, :, 2]), n)
+        summed = np.zeros(n, dtype=d.dtype)
+        for j in range(d.shape[1]):
+            a, b, c = d[i, j, 0], d[i, j, 1], d[i, j, 2]
+            for k in range(n):
+                mu = 0.0
+                if x[k] == b:
+                    mu = 1.0
+                elif a < x[k] < b:
+                    mu = (x[k] - a) / (b - a)
+                elif b < x[k] < c:
+                    mu = (c - x[k]) / (c - b)
+                mu = weights[j] * mu
+                summed[k] = mu if j == 0 else (summed[k] + mu) - summed[k] * mu
+        res[i] = np.sum(x * summed) / np.sum(summed)
+    return res
+
+
+@njit
+def codas_assessment(D1, D2, tau):
+    """
+        Calculates assessment scores of alternatives from the relative assessment of each pair of alternatives
+
+        Parameters
+        ----------
+            D1 : ndarray
+                Distances from fuzzy negative solution
+
+            D2 : ndarray
+                Distances from fuzzy negative solution
+
+            tau: float
+                Threshold parameter
+
+        Returns
+        -------
+            ndarray
+                Assessment scores of alternatives
+    """
+    res = np.zeros(D1.shape[0], dtype=D1.dtype)
+    for i in range(D1.shape[0]):
+        for k in range(D1.shape[0]):
+            diff = D1[i] - D1[k]
+            res[i] += diff + (1.0 if np.abs(diff) >= tau else 0.0) * (D2[i] - D2[k])
+    return res
+
+
+@njit
+def edas_distances(matrix, av_matrix, k, types, kind, pda, nda):
+    """
+        Calculates positive and negative distances of alternatives from the average solution,
+        differences with not positive defuzzified value are replaced with zeros
+
+        Parameters
+        ----------
+            matrix : ndarray
+                Decision matrix / alternatives data.
+                Alternatives are in rows and Criteria are in columns.
+
+            av_matrix : ndarray
+                Fuzzy average solution
+
+            k : ndarray
+                Defuzzified average solution
+
+            types : ndarray
+                Types of criteria, 1 profit, -1 cost
+
+            kind : int
+                Index of defuzzification function in JIT_DEFUZZIFICATIONS
+
+            pda : ndarray
+                Array filled with positive distances
+
+            nda : ndarray
+                Array filled with negative distances
+    """
+    dp, dn = np.empty(3, dtype=matrix.dtype), np.empty(3, dtype=matrix.dtype)
+    for i in range(matrix.shape[0]):
+        for j in range(matrix.shape[1]):
+            for c in range(3):
+                dp[c] = matrix[i, j, c] - av_matrix[j, 2 - c]
+                dn[c] = av_matrix[j, c] - matrix[i, j, 2 - c]
+            if types[j] != 1:
+                dp, dn = dn, dp
+            keep_p = _defuzzify(dp[0], dp[1], dp[2], kind) > 0
+            keep_n = _defuzzify(dn[0], dn[1], dn[2], kind) > 0
+            for c in range(3):
+                pda[i, j, c] = (dp[c] if keep_p else 0.0) / k[j]
+                nda[i, j, c] = (dn[c] if keep_n else 0.0) / k[j]
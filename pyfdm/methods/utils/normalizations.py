@@ -1,6 +1,7 @@
-# Copyright (c) 2022-2023 Jakub Więckowski
+# Copyright (c) 2022-2024 Jakub Więckowski
 
 import numpy as np
+from ...config import resolve_dtype
 
 __all__ = [
     'cocoso_normalization',
@@ -15,41 +16,263 @@ __all__ = [
 ]
 
 
-def sum_normalization(matrix, types):
+class NormalizationStatistics():
+    def __init__(self, n, dtype=None, normalization=None):
+        """
+            Creates empty statistics of criteria used by normalizations.
+            Statistics can be gathered from chunks of the decision matrix and merged from partial results
+
+            Parameters
+            ----------
+                n : int
+                    Number of criteria
+
+                dtype : dtype, default=None
+                    Floating point data type of the statistics, configured data type if None
+
+                normalization : callable, default=None
+                    Normalization function, only statistics read by it are gathered. All statistics are gathered if None
+
+        """
+        self.n = n
+        self.dtype = resolve_dtype(dtype)
+        self.count = 0
+        self._track(STATISTICS if normalization is None else _fields(normalization))
+
+    def _track(self, fields):
+        # statistics which are not gathered are None
+        self.fields = tuple(fields)
+        initial = {'min': np.inf, 'max': -np.inf, 'sum': 0, 'sum_reciprocal': 0, 'sum_squares': 0}
+        for field in STATISTICS:
+            value = np.full((self.n, 3), initial[field], dtype=self.dtype) if field in self.fields else None
+            setattr(self, field, value)
+
+    @classmethod
+    def fit(cls, matrix, dtype=None, normalization=None):
+        """
+            Calculates the statistics of criteria for the matrix
+
+            Parameters
+            ----------
+                matrix : ndarray
+                    Matrix with Triangular Fuzzy Numbers
+
+                dtype : dtype, default=None
+                    Floating point data type of the statistics, configured data type if None
+
+                normalization : callable, default=None
+                    Normalization function, only statistics read by it are gathered. All statistics are gathered if None
+
+            Returns
+            -------
+                NormalizationStatistics
+                    Statistics of criteria
+        """
+        return cls(np.shape(matrix)[1], dtype, normalization).update(matrix)
+
+    @classmethod
+    def combine(cls, statistics):
+        """
+            Merges partial statistics calculated for shards of the decision matrix
+
+            Parameters
+            ----------
+                statistics : iterable
+                    Partial statistics calculated for the same criteria
+
+            Returns
+            -------
+                NormalizationStatistics
+                    Statistics of the whole decision matrix, statistics gathered for all shards
+        """
+        statistics = list(statistics)
+        if not statistics:
+            raise ValueError('At least one statistics object should be given')
+        result = cls(statistics[0].n, statistics[0].dtype)
+        result._track(f for f in STATISTICS if all(f in s.fields for s in statistics))
+        for s in statistics:
+            result.merge(s)
+        return result
+
+    def values(self, normalization):
+        """
+            Returns copies of the statistics used by the given normalization
+
+            Parameters
+            ----------
+                normalization : callable
+                    One of the normalization functions from this module
+
+            Returns
+            -------
+                tuple
+                    Arrays of statistics read by the normalization
+        """
+        fields = _fields(normalization)
+        missing = [field for field in fields if field not in self.fields]
+        if missing:
+            raise ValueError(f'Statistics {missing} required by {normalization.__name__} were not gathered')
+        return tuple(getattr(self, field).copy() for field in fields)
+
+    def update(self, matrix):
+        """
+            Includes the chunk of alternatives in the statistics
+
+            Parameters
+            ----------
+                matrix : ndarray
+                    Matrix with Triangular Fuzzy Numbers
+
+            Returns
+            -------
+                NormalizationStatistics
+                    Updated statistics
+        """
+        matrix = np.asarray(matrix, dtype=self.dtype)
+        if matrix.ndim != 3 or matrix.shape[1:] != (self.n, 3):
+            raise ValueError(f'Matrix should have shape (m, {self.n}, 3), not {matrix.shape}')
+        if matrix.shape[0] == 0:
+            return self
+
+        self.count += matrix.shape[0]
+        # only statistics read by the normalization are calculated
+        if self.min is not None:
+            self.min = np.minimum(self.min, np.min(matrix, axis=0))
+        if self.max is not None:
+            self.max = np.maximum(self.max, np.max(matrix, axis=0))
+        if self.sum is not None:
+            self.sum += np.sum(matrix, axis=0)
+        if self.sum_reciprocal is not None:
+            with np.errstate(divide='ignore'):
+                self.sum_reciprocal += np.sum(1/matrix, axis=0)
+        if self.sum_squares is not None:
+            self.sum_squares += np.sum(matrix**2, axis=0)
+        return self
+
+    def merge(self, other):
+        """
+            Includes partial statistics calculated for other chunk of alternatives
+
+            Parameters
+            ----------
+                other : NormalizationStatistics
+                    Statistics calculated for the same criteria
+
+            Returns
+            -------
+                NormalizationStatistics
+                    Updated statistics
+        """
+        if other.n != self.n:
+            raise ValueError(f'Statistics should describe the same number of criteria, not {self.n}, {other.n}')
+        missing = [field for field in self.fields if field not in other.fields]
+        if missing:
+            raise ValueError(f'Statistics {missing} were not gathered for merged statistics')
+
+        self.count += other.count
+        if self.min is not None:
+            self.min = np.minimum(self.min, other.min)
+        if self.max is not None:
+            self.max = np.maximum(self.max, other.max)
+        if self.sum is not None:
+            self.sum += other.sum
+        if self.sum_reciprocal is not None:
+            self.sum_reciprocal += other.sum_reciprocal
+        if self.sum_squares is not None:
+            self.sum_squares += other.sum_squares
+        return self
+
+
+def apply_normalization(normalization, statistics, matrix, types=None, dtype=None):
     """
-        Calculates the normalized value of Triangular Fuzzy matrix using sum normalization
+        Normalizes the matrix with statistics of criteria calculated for the whole decision matrix
 
         Parameters
         ----------
+            normalization : callable
+                One of the normalization functions from this module
+
+            statistics : NormalizationStatistics
+                Statistics of criteria
+
             matrix : ndarray
-                Matrix with Triangular Fuzzy Numbers
+                Matrix with Triangular Fuzzy Numbers, e.g. chunk of the decision matrix
 
-            types : ndarray
-                Types of criteria, 1 profit, -1 cost
+            types : ndarray, default=None
+                Types of criteria, 1 profit, -1 cost. Required for normalizations depending on criteria types
+
+            dtype : dtype, default=None
+                Floating point data type of the result, configured data type if None
 
         Returns
         -------
             ndarray
                 Normalized Triangular Fuzzy matrix
     """
-    nmatrix = np.zeros(matrix.shape, dtype=object)
+    try:
+        apply, typed = _APPLY[normalization]
+    except (KeyError, TypeError):
+        raise ValueError(f'Normalization {getattr(normalization, "__name__", normalization)} cannot be calculated from statistics')
+    if typed and types is None:
+        raise TypeError(f'{normalization.__name__} requires types of criteria')
+
+    dtype = resolve_dtype(dtype)
+    matrix = np.asarray(matrix, dtype=dtype)
+    nmatrix = np.zeros(matrix.shape, dtype=dtype)
+    apply(statistics, matrix, None if types is None else np.asarray(types), nmatrix)
+    return nmatrix
+
+
+def _sum(stats, matrix, types, nmatrix):
+    nmatrix[:, types == 1] = matrix[:, types == 1] / np.flip(stats.sum[types == 1])
+    nmatrix[:, types == -1] = (1/matrix[:, types == -1]) / np.flip(stats.sum_reciprocal[types == -1])
+
+
+def _max(stats, matrix, types, nmatrix):
+    nmatrix[:, types == 1] = matrix[:, types == 1] / stats.max[types == 1]
+    nmatrix[:, types == -1] = 1 - (matrix[:, types == -1] / stats.max[types == -1])
+
+
+def _linear(stats, matrix, types, nmatrix):
+    nmatrix[:, types == 1] = matrix[:, types == 1] / np.max(stats.max[types == 1], axis=1)[..., None]
+    nmatrix[:, types == -1] = np.min(stats.min[types == -1], axis=1)[..., None] / matrix[:, types == -1][..., ::-1]
+
+
+def _minmax(stats, matrix, types, nmatrix):
+    low, high = stats.min[:, 0], stats.max[:, 2]
+    p, c = types == 1, types == -1
+    nmatrix[:, p] = (matrix[:, p] - low[p][..., None]) / (high[p] - low[p])[..., None]
+    nmatrix[:, c] = ((matrix[:, c] - high[c][..., None]) / (low[c] - high[c])[..., None])[..., ::-1]
+
+
+def _vector(stats, matrix, types, nmatrix):
+    nmatrix[:] = matrix / np.sqrt(np.sum(stats.sum_squares, axis=1))[..., None]
 
-    # profit criteria
-    if 1 in types:
-        nmatrix[:, types == 1] = matrix[:, types == 1] / \
-            np.flip(np.sum(matrix[:, types == 1], axis=0))
 
-    # cost criteria
-    if -1 in types:
-        nmatrix[:, types == -1] = (1/matrix[:, types == -1]) / \
-            np.flip(np.sum(1/matrix[:, types == -1], axis=0))
+def _saw(stats, matrix, types, nmatrix):
+    nmatrix[:] = matrix / np.max(stats.max, axis=1)[..., None]
 
-    return nmatrix.astype(float)
 
+def _sqrt(stats, matrix, types, nmatrix):
+    nmatrix[:] = matrix / np.sqrt(1/3 * np.sum(stats.sum_squares, axis=1))[..., None]
 
-def max_normalization(matrix, types):
+
+def _waspas(stats, matrix, types, nmatrix):
+    nmatrix[:, types == 1] = matrix[:, types == 1] / stats.max[types == 1, 2][..., None]
+    nmatrix[:, types == -1] = stats.min[types == -1, 0][..., None] / matrix[:, types == -1]
+
+
+def _cocoso(stats, matrix, types, nmatrix):
+    low, high = stats.min[:, 0], stats.max[:, 2]
+    p, c = types == 1, types == -1
+    nmatrix[:, p] = (matrix[:, p] - low[p][..., None]) / (high[p] - low[p])[..., None]
+    nmatrix[:, c] = (high[c][..., None] - matrix[:, c][..., ::-1]) / (high[c] - low[c])[..., None]
+
+
+
+def sum_normalization(matrix, types, dtype=None):
     """
-        Calculates the normalized value of Triangular Fuzzy matrix using max normalization
+        Calculates the normalized value of Triangular Fuzzy matrix using sum normalization
 
         Parameters
         ----------
@@ -59,27 +282,41 @@ def max_normalization(matrix, types):
             types : ndarray
                 Types of criteria, 1 profit, -1 cost
 
+            dtype : dtype, default=None
+                Floating point data type of the result, configured data type if None
+
         Returns
         -------
             ndarray
                 Normalized Triangular Fuzzy matrix
     """
-    nmatrix = np.zeros(matrix.shape, dtype=object)
+    return apply_normalization(sum_normalization, NormalizationStatistics.fit(matrix, dtype, sum_normalization), matrix, types, dtype)
+
+
+def max_normalization(matrix, types, dtype=None):
+    """
+        Calculates the normalized value of Triangular Fuzzy matrix using max normalization
+
+        Parameters
+        ----------
+            matrix : ndarray
+                Matrix with Triangular Fuzzy Numbers
 
-    # profit criteria
-    if 1 in types:
-        nmatrix[:, types == 1] = matrix[:, types == 1] / \
-            np.max(matrix[:, types == 1], axis=0)
+            types : ndarray
+                Types of criteria, 1 profit, -1 cost
 
-    # cost criteria
-    if -1 in types:
-        nmatrix[:, types == -1] = 1 - \
-            (matrix[:, types == -1] / np.max(matrix[:, types == -1], axis=0))
+            dtype : dtype, default=None
+                Floating point data type of the result, configured data type if None
 
-    return nmatrix.astype(float)
+        Returns
+        -------
+            ndarray
+                Normalized Triangular Fuzzy matrix
+    """
+    return apply_normalization(max_normalization, NormalizationStatistics.fit(matrix, dtype, max_normalization), matrix, types, dtype)
 
 
-def linear_normalization(matrix, types):
+def linear_normalization(matrix, types, dtype=None):
     """
         Calculates the normalized value of Triangular Fuzzy matrix using linear normalization
 
@@ -91,27 +328,18 @@ def linear_normalization(matrix, types):
             types : ndarray
                 Types of criteria, 1 profit, -1 cost
 
+            dtype : dtype, default=None
+                Floating point data type of the result, configured data type if None
+
         Returns
         -------
             ndarray
                 Normalized Triangular Fuzzy matrix
     """
-    nmatrix = np.zeros(matrix.shape, dtype=object)
+    return apply_normalization(linear_normalization, NormalizationStatistics.fit(matrix, dtype, linear_normalization), matrix, types, dtype)
 
-    # profit criteria
-    if 1 in types:
-        nmatrix[:, types == 1] = matrix[:, types == 1] / \
-            np.max(np.max(matrix[:, types == 1], axis=0), axis=1)[...,None]
 
-    # cost criteria
-    if -1 in types:
-        nmatrix[:, types == -1] = np.min(np.min(matrix[:, types == -1], axis=0), axis=1)[...,None] / \
-            matrix[:, types == -1][..., ::-1]
-
-    return nmatrix.astype(float)
-
-
-def minmax_normalization(matrix, types):
+def minmax_normalization(matrix, types, dtype=None):
     """
         Calculates the normalized value of Triangular Fuzzy matrix using Min-Max normalization
 
@@ -123,27 +351,17 @@ def minmax_normalization(matrix, types):
             types : ndarray
                 Types of criteria, 1 profit, -1 cost
 
+            dtype : dtype, default=None
+                Floating point data type of the result, configured data type if None
+
         Returns
         -------
             ndarray
                 Normalized Triangular Fuzzy matrix
     """
-    nmatrix = np.zeros(matrix.shape, dtype=object)
-
-    # profit criteria
-    if 1 in types:
-        nmatrix[:, types == 1] = (matrix[:, types == 1] - np.min(matrix[:, types == 1, 0], axis=0)[..., None]) / \
-            (np.max(matrix[:, types == 1, 2], axis=0) -
-                np.min(matrix[:, types == 1, 0], axis=0))[...,None]
+    return apply_normalization(minmax_normalization, NormalizationStatistics.fit(matrix, dtype, minmax_normalization), matrix, types, dtype)
 
-    # cost criteria
-    if -1 in types:
-        nmatrix[:, types == -1] = ((matrix[:, types == -1] - np.max(matrix[:, types == -1, 2], axis=0)[...,None]) / (
-            np.min(matrix[:, types == -1, 0], axis=0) - np.max(matrix[:, types == -1, 2], axis=0))[...,None])[..., ::-1]
-
-    return nmatrix.astype(float)
-
-def vector_normalization(matrix, *args):
+def vector_normalization(matrix, *args, dtype=None):
     """
         Calculates the normalized value of Triangular Fuzzy matrix using vector normalization
 
@@ -153,20 +371,18 @@ def vector_normalization(matrix, *args):
                 Matrix with Triangular Fuzzy Numbers
 
             *args is necessary for methods which reqiure some additional data
+
+            dtype : dtype, default=None
+                Floating point data type of the result, configured data type if None
+
         Returns
         -------
             ndarray
                 Normalized Triangular Fuzzy matrix
     """
-    nmatrix = np.zeros(matrix.shape, dtype=object)
+    return apply_normalization(vector_normalization, NormalizationStatistics.fit(matrix, dtype, vector_normalization), matrix, None, dtype)
 
-    # for each column
-    for j in range(nmatrix.shape[1]):
-        nmatrix[:, j] = matrix[:, j] / np.sqrt(np.sum(matrix[:, j]**2))
-
-    return nmatrix.astype(float)
-
-def saw_normalization(matrix, *args):
+def saw_normalization(matrix, *args, dtype=None):
     """
         Calculates the normalized value of Triangular Fuzzy matrix using simple addictive weight normalization
 
@@ -176,20 +392,18 @@ def saw_normalization(matrix, *args):
                 Matrix with Triangular Fuzzy Numbers
 
             *args is necessary for methods which reqiure some additional data
+
+            dtype : dtype, default=None
+                Floating point data type of the result, configured data type if None
+
         Returns
         -------
             ndarray
                 Normalized Triangular Fuzzy matrix
     """
-    nmatrix = np.zeros(matrix.shape, dtype=object)
-
-    # for each column
-    for j in range(nmatrix.shape[1]):
-        nmatrix[:, j] = matrix[:, j] / np.max(matrix[:, j])
+    return apply_normalization(saw_normalization, NormalizationStatistics.fit(matrix, dtype, saw_normalization), matrix, None, dtype)
 
-    return nmatrix.astype(float)
-
-def sqrt_normalization(matrix, *args):
+def sqrt_normalization(matrix, *args, dtype=None):
     """
         Calculates the normalized value of Triangular Fuzzy matrix using sqrt normalization
 
@@ -199,20 +413,18 @@ def sqrt_normalization(matrix, *args):
                 Matrix with Triangular Fuzzy Numbers
 
             *args is necessary for methods which reqiure some additional data
+
+            dtype : dtype, default=None
+                Floating point data type of the result, configured data type if None
+
         Returns
         -------
             ndarray
                 Normalized Triangular Fuzzy matrix
     """
-    nmatrix = np.zeros(matrix.shape, dtype=object)
-
-    # for each column
-    for j in range(nmatrix.shape[1]):
-        nmatrix[:, j] = matrix[:, j] / np.sqrt(1/3 * np.sum(matrix[:, j]**2))
+    return apply_normalization(sqrt_normalization, NormalizationStatistics.fit(matrix, dtype, sqrt_normalization), matrix, None, dtype)
 
-    return nmatrix.astype(float)
-
-def waspas_normalization(matrix, types):
+def waspas_normalization(matrix, types, dtype=None):
     """
         Calculates the normalized value of Triangular Fuzzy matrix using WASPAS normalization
 
@@ -224,24 +436,17 @@ def waspas_normalization(matrix, types):
             types : ndarray
                 Types of criteria, 1 profit, -1 cost
 
+            dtype : dtype, default=None
+                Floating point data type of the result, configured data type if None
+
         Returns
         -------
             ndarray
                 Normalized Triangular Fuzzy matrix
     """
-    nmatrix = np.zeros(matrix.shape, dtype=object)
-
-    # profit criteria
-    if 1 in types:
-        nmatrix[:, types == 1] = matrix[:, types == 1] / np.max(matrix[:, types == 1, 2], axis=0)[...,None]
-
-    # cost criteria
-    if -1 in types:
-        nmatrix[:, types == -1] = np.min(matrix[:, types == -1, 0], axis=0)[...,None] / matrix[:, types == -1]
-        
-    return nmatrix.astype(float)
+    return apply_normalization(waspas_normalization, NormalizationStatistics.fit(matrix, dtype, waspas_normalization), matrix, types, dtype)
 
-def cocoso_normalization(matrix, types):
+def cocoso_normalization(matrix, types, dtype=None):
     """
         Calculates the normalized value of Triangular Fuzzy matrix using COCOSO normalization
 
@@ -253,21 +458,48 @@ def cocoso_normalization(matrix, types):
             types : ndarray
                 Types of criteria, 1 profit, -1 cost
 
+            dtype : dtype, default=None
+                Floating point data type of the result, configured data type if None
+
         Returns
         -------
             ndarray
                 Normalized Triangular Fuzzy matrix
     """
-    nmatrix = np.zeros(matrix.shape, dtype=object)
-
-    # profit criteria
-    if 1 in types:
-        nmatrix[:, types == 1] = (matrix[:, types == 1] - np.min(matrix[:, types == 1, 0], axis=0)[...,None]) / (np.max(matrix[:, types == 1, 2], axis=0) -
-                np.min(matrix[:, types == 1, 0], axis=0))[...,None]
-
-    # cost criteria
-    if -1 in types:
-        nmatrix[:, types == -1] = (np.max(matrix[:, types == -1, 2], axis=0)[...,None] - matrix[:, types == -1][..., ::-1]) / (np.max(matrix[:, types == -1, 2], axis=0) -
-                np.min(matrix[:, types == -1, 0], axis=0))[...,None]
-
-    return nmatrix.astype(float)
+    return apply_normalization(cocoso_normalization, NormalizationStatistics.fit(matrix, dtype, cocoso_normalization), matrix, types, dtype)
+
+
+_APPLY = {
+    sum_normalization: (_sum, True),
+    max_normalization: (_max, True),
+    linear_normalization: (_linear, True),
+    minmax_normalization: (_minmax, True),
+    vector_normalization: (_vector, False),
+    saw_normalization: (_saw, False),
+    sqrt_normalization: (_sqrt, False),
+    waspas_normalization: (_waspas, True),
+    cocoso_normalization: (_cocoso, True),
+}
+
+# statistics gathered by NormalizationStatistics
+STATISTICS = ('min', 'max', 'sum', 'sum_reciprocal', 'sum_squares')
+
+# statistics read by each normalization
+_FIELDS = {
+    sum_normalization: ('sum', 'sum_reciprocal'),
+    max_normalization: ('max', ),
+    linear_normalization: ('min', 'max'),
+    minmax_normalization: ('min', 'max'),
+    vector_normalization: ('sum_squares', ),
+    saw_normalization: ('max', ),
+    sqrt_normalization: ('sum_squares', ),
+    waspas_normalization: ('min', 'max'),
+    cocoso_normalization: ('min', 'max'),
+}
+
+
+def _fields(normalization):
+    try:
+        return _FIELDS[normalization]
+    except (KeyError, TypeError):
+        raise ValueError(f'Normalization {getattr(normalization, "__name__", normalization)} cannot be calculated from statistics')
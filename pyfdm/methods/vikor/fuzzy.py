@@ -1,8 +1,10 @@
-# Copyright (c) 2022 Jakub Więckowski
+# Copyright (c) 2022-2024 Jakub Więckowski
 
 import numpy as np
+from ...config import resolve_dtype
+from ..utils.defuzzifications import tfn_defuzzify
 
-def fuzzy(matrix, weights, types, defuzzify, v):
+def fuzzy(matrix, weights, types, defuzzify, v, trace=None):
     """
         Calculates the alternatives preferences based on Triangular Fuzzy Number extension
 
@@ -21,19 +23,23 @@ def fuzzy(matrix, weights, types, defuzzify, v):
             defuzzify: callable
                 Function used to defuzzify the TFN into crisp value
 
-            v : float
+            v : float or ndarray
                 Weight of the strategy (see VIKOR algorithm explanation).
+                Preferences are calculated for each value if array is given
+
+            trace : dict, default=None
+                Dictionary filled with intermediate results if given
 
         Returns
         -------
-            ndarray:
-                Crisp preferences of alternatives
+            tuple:
+                Crisp preferences of alternatives for S, R, Q approaches, each (len(v), m) if array of weights is given
 
     """
 
     # ideal and nadir values
-    ideal, nadir = np.zeros((matrix.shape[1], 3)), np.zeros(
-        (matrix.shape[1], 3))
+    ideal, nadir = np.zeros((matrix.shape[1], 3), dtype=resolve_dtype()), np.zeros(
+        (matrix.shape[1], 3), dtype=resolve_dtype())
     for j in range(matrix.shape[1]):
         if types[j] == 1:
             ideal[j] = np.max(matrix[:, j], axis=0)
@@ -43,7 +49,7 @@ def fuzzy(matrix, weights, types, defuzzify, v):
             nadir[j] = np.max(matrix[:, j], axis=0)
 
     # normalized fuzzy difference
-    d = np.zeros(matrix.shape)
+    d = np.zeros(matrix.shape, dtype=resolve_dtype())
     for i in range(matrix.shape[0]):
         for j in range(matrix.shape[1]):
             if types[j] == 1:
@@ -57,21 +63,30 @@ def fuzzy(matrix, weights, types, defuzzify, v):
         weights = np.repeat(weights, 3).reshape((len(weights), 3))
 
     # S, R, Q rankings
-    S, R, Q = np.zeros((matrix.shape[0], 3)), np.zeros(
-        (matrix.shape[0], 3)), np.zeros((matrix.shape[0], 3))
+    S, R = np.zeros((matrix.shape[0], 3), dtype=resolve_dtype()), np.zeros(
+        (matrix.shape[0], 3), dtype=resolve_dtype())
 
     for i in range(matrix.shape[0]):
         S[i] = np.sum(d[i, :] * weights, axis=0)
         R[i] = np.max(d[i, :] * weights, axis=0)
 
-    for i in range(matrix.shape[0]):
-        Q[i] = v * (S[i] - np.flipud(np.min(S, axis=0)))/(np.max(S, axis=0)[2] - np.min(S, axis=0)[0]) + \
-            (1-v)*(R[i] - np.flipud(np.min(R, axis=0))) / \
-            (np.max(R, axis=0)[2] - np.min(R, axis=0)[0])
+    # Q is calculated for each value of v, (len(v), m, 3) if array is given
+    vc = np.asarray(v, dtype=resolve_dtype()).reshape(np.shape(v) + (1, 1))
+    Q = vc * (S - np.flipud(np.min(S, axis=0)))/(np.max(S, axis=0)[2] - np.min(S, axis=0)[0]) + \
+        (1-vc)*(R - np.flipud(np.min(R, axis=0))) / \
+        (np.max(R, axis=0)[2] - np.min(R, axis=0)[0])
 
     # defuzzification
     crisp_S = np.array([defuzzify(s) for s in S])
     crisp_R = np.array([defuzzify(r) for r in R])
-    crisp_Q = np.array([defuzzify(q) for q in Q])
+    crisp_Q = tfn_defuzzify(defuzzify, Q)
+    if np.ndim(v) > 0:
+        # S and R do not depend on v
+        crisp_S = np.broadcast_to(crisp_S, crisp_Q.shape)
+        crisp_R = np.broadcast_to(crisp_R, crisp_Q.shape)
+
+    # intermediate results
+    if trace is not None:
+        trace.update(ideal=ideal, nadir=nadir, d=d, S=S, R=R, Q=Q)
 
     return crisp_S, crisp_R, crisp_Q
@@ -2,7 +2,7 @@
 
 import numpy as np
 
-def fuzzy(matrix, weights, types, normalization, defuzzify):
+def fuzzy(matrix, weights, types, normalization, defuzzify, trace=None):
     """
         Calculates the alternatives preferences based on Triangular Fuzzy Number extension
 
@@ -24,6 +24,9 @@ def fuzzy(matrix, weights, types, normalization, defuzzify):
             defuzzify: callable
                 Function used to defuzzify the TFN into crisp value
 
+            trace : dict, default=None
+                Dictionary filled with intermediate results if given
+
         Returns
         -------
             ndarray:
@@ -54,4 +57,8 @@ def fuzzy(matrix, weights, types, normalization, defuzzify):
     # value of integrated utility
     K = d * Q_def + (1-d) * P_def
 
+    # intermediate results
+    if trace is not None:
+        trace.update(nmatrix=nmatrix, Q=Q, P=P, d=d)
+
     return K
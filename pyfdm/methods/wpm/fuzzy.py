@@ -1,8 +1,9 @@
-# Copyright (c) 2023 Jakub Więckowski
+# Copyright (c) 2023-2024 Jakub Więckowski
 
 import numpy as np
+from ..utils.defuzzifications import tfn_defuzzify
 
-def fuzzy(matrix, weights, normalization, defuzzify):
+def fuzzy(matrix, weights, normalization, defuzzify, trace=None):
     """
         Calculates the alternatives preferences based on Triangular Fuzzy Number extension
 
@@ -18,6 +19,9 @@ def fuzzy(matrix, weights, normalization, defuzzify):
             normalization: callable
                 Function used to normalize the decision matrix
                 
+            trace : dict, default=None
+                Dictionary filled with intermediate results if given
+
         Returns
         -------
             ndarray:
@@ -29,7 +33,8 @@ def fuzzy(matrix, weights, normalization, defuzzify):
     if normalization is not None:
         nmatrix = normalization(matrix)
     else:
-        nmatrix = matrix.copy()
+        # matrix is not modified, strided views are used without copying
+        nmatrix = matrix
 
     if weights.ndim == 1:
         weights = np.repeat(weights, 3).reshape((len(weights), 3))
@@ -39,4 +44,8 @@ def fuzzy(matrix, weights, normalization, defuzzify):
 
     prod_w = np.prod(wmatrix, axis=1)
 
-    return np.array([defuzzify(s) for s in prod_w])
+    # intermediate results
+    if trace is not None:
+        trace.update(nmatrix=nmatrix, prod_w=prod_w)
+
+    return tfn_defuzzify(defuzzify, prod_w)
@@ -1,6 +1,8 @@
-# Copyright (c) 2022-2023 Jakub Więckowski
+# Copyright (c) 2022-2024 Jakub Więckowski
 
 import numpy as np
+from .config import resolve_dtype
+from .codebook import TFNCodebook
 
 __all__ = [
     'equal_weights',
@@ -10,48 +12,59 @@ __all__ = [
 ]
 
 
-def equal_weights(matrix):
+def equal_weights(matrix, dtype=None):
     """
         Calculates the objective weights for Triangular Fuzzy Matrix, each weight will have the same value
 
         Parameters
         ----------
-            matrix: ndarray
+            matrix: ndarray or TFNCodebook
                 Decision matrix / alternatives data
                 Alternatives are in rows and Criteria are in columns
 
+            dtype : dtype, default=None
+                Floating point data type of the result, configured data type if None
+
         Returns
         -------
             ndarray
                 Array of equal weights
     """
 
-    w = np.ones(matrix.shape[1]) / matrix.shape[1]
+    w = np.ones(matrix.shape[1], dtype=resolve_dtype(dtype)) / matrix.shape[1]
     return np.repeat(w, 3).reshape((len(w), 3))
 
 
-def shannon_entropy_weights(matrix):
+def shannon_entropy_weights(matrix, dtype=None):
     """
         Calculates the objective weights for Triangular Fuzzy Matrix, weight depend on the entropy measure in the column
 
         Parameters
         ----------
-            matrix: ndarray
+            matrix: ndarray or TFNCodebook
                 Decision matrix / alternatives data
                 Alternatives are in rows and Criteria are in columns
 
+            dtype : dtype, default=None
+                Floating point data type of the result, configured data type if None
+
         Returns
         -------
             ndarray
                 Array of weights based on matrix entropy
     """
     # https://www.mdpi.com/1099-4300/19/7/373/htm
+    dtype = resolve_dtype(dtype)
 
     # shannon entropy vector
-    e = np.zeros((matrix.shape[1], 3))
-    for j in range(matrix.shape[1]):
-        e[j] = - 1/(np.log(matrix.shape[0])) * \
-            np.sum(matrix[:, j] * np.log(matrix[:, j]), axis=0)
+    if isinstance(matrix, TFNCodebook):
+        e = - 1/(np.log(matrix.shape[0])) * matrix.column_sum(lambda t: t * np.log(t), dtype)
+    else:
+        matrix = np.asarray(matrix, dtype=dtype)
+        e = np.zeros((matrix.shape[1], 3), dtype=dtype)
+        for j in range(matrix.shape[1]):
+            e[j] = - 1/(np.log(matrix.shape[0])) * \
+                np.sum(matrix[:, j] * np.log(matrix[:, j]), axis=0)
 
     # fuzzy diversification vector
     d = 1 - e
@@ -62,39 +75,53 @@ def shannon_entropy_weights(matrix):
     return w
 
 
-def standard_deviation_weights(matrix):
+def standard_deviation_weights(matrix, dtype=None):
     """
         Calculates the objective weights for Triangular Fuzzy Matrix, weight depend on the data standard deviation in the column
 
         Parameters
         ----------
-            matrix: ndarray
+            matrix: ndarray or TFNCodebook
                 Decision matrix / alternatives data
                 Alternatives are in rows and Criteria are in columns
 
+            dtype : dtype, default=None
+                Floating point data type of the result, configured data type if None
+
         Returns
         -------
             ndarray
                 Array of weights based on matrix entropy
     """
-    w = np.std(matrix, axis=0)
+    if isinstance(matrix, TFNCodebook):
+        w = np.sqrt(matrix.variance(dtype))
+    else:
+        matrix = np.asarray(matrix, dtype=resolve_dtype(dtype))
+        w = np.std(matrix, axis=0)
     return w / np.sum(w, axis=0)
 
 
-def variance_weights(matrix):
+def variance_weights(matrix, dtype=None):
     """
         Calculates the objective weights for Triangular Fuzzy Matrix, weight depend on the data variance in the column
 
         Parameters
         ----------
-            matrix: ndarray
+            matrix: ndarray or TFNCodebook
                 Decision matrix / alternatives data
                 Alternatives are in rows and Criteria are in columns
 
+            dtype : dtype, default=None
+                Floating point data type of the result, configured data type if None
+
         Returns
         -------
             ndarray
                 Array of weights based on matrix entropy
     """
-    w = np.var(matrix, axis=0)
+    if isinstance(matrix, TFNCodebook):
+        w = matrix.variance(dtype)
+    else:
+        matrix = np.asarray(matrix, dtype=resolve_dtype(dtype))
+        w = np.var(matrix, axis=0)
     return w / np.sum(w, axis=0)
@@ -23,5 +23,10 @@ setuptools.setup(
         'numpy',
         'scipy',
         'matplotlib'
-    ]
+    ],
+    extras_require={
+        'jit': ['numba'],
+        'pandas': ['pandas'],
+        'arrow': ['pyarrow']
+    }
 )
@@ -0,0 +1,32 @@
+# Copyright (c) 2024 Jakub Więckowski
+
+import numpy as np
+import pytest
+
+
+@pytest.fixture
+def tfn_matrix():
+    """
+        Draws the array of Triangular Fuzzy Numbers with the given shape of alternatives and criteria,
+        components are sorted values drawn uniformly from the given range
+    """
+    def draw(shape, low=1, high=10, seed=0):
+        rng = np.random.default_rng(seed)
+        return np.sort(rng.uniform(low, high, tuple(shape) + (3, )), axis=-1)
+
+    return draw
+
+
+@pytest.fixture
+def weights():
+    return np.array([[0.7, 0.9, 1], [0.9, 1, 1], [0.77, 0.93, 1], [0.43, 0.63, 0.83]])
+
+
+@pytest.fixture
+def crisp_weights():
+    return np.array([0.3, 0.2, 0.25, 0.25])
+
+
+@pytest.fixture
+def types():
+    return np.array([1, -1, 1, -1])
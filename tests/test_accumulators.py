@@ -0,0 +1,55 @@
+# Copyright (c) 2024 Jakub Więckowski
+
+import numpy as np
+from pyfdm.accumulators import *
+from pyfdm.correlations import *
+
+
+def test_correlation_accumulator():
+    """
+        Test veryfing that statistics accumulated in batches equal statistics of all correlations.
+    """
+    np.random.seed(0)
+    reference = np.arange(1, 11)
+    rankings = np.array([np.random.permutation(10) + 1 for _ in range(100)])
+
+    accumulator = CorrelationAccumulator(reference)
+    for batch in np.array_split(rankings, 7):
+        accumulator.update(batch)
+
+    for name, coef in [('ws', ws_rank_similarity_coef), ('weighted_spearman', weighted_spearman_coef), ('pearson', pearson_coef)]:
+        values = np.array([coef(reference, r) for r in rankings])
+        assert np.isclose(accumulator.mean()[name], np.mean(values))
+        assert np.isclose(accumulator.variance()[name], np.var(values))
+        assert np.isclose(accumulator.std(ddof=1)[name], np.std(values, ddof=1))
+
+    # partial accumulators merged
+    first = CorrelationAccumulator(reference).update(rankings[:30])
+    second = CorrelationAccumulator(reference).update(rankings[30:])
+    merged = first.merge(second)
+    assert merged.count == 100
+    assert np.isclose(merged.variance()['ws'], accumulator.variance()['ws'])
+
+
+def test_rank_accumulator():
+    """
+        Test veryfing rank positions histogram and mean ranks accumulated in batches.
+    """
+    rankings = np.array([
+        [1, 2, 3],
+        [2, 1, 3],
+        [1, 3, 2],
+        [1, 2, 3],
+    ])
+    accumulator = RankAccumulator(3)
+    accumulator.update(rankings[:1])
+    accumulator.update(rankings[1:])
+
+    assert (accumulator.histogram == [[3, 1, 0], [1, 2, 1], [0, 1, 3]]).all()
+    assert np.allclose(accumulator.acceptability().sum(axis=1), 1)
+    assert np.allclose(accumulator.mean(), np.mean(rankings, axis=0))
+    assert np.allclose(accumulator.variance(), np.var(rankings, axis=0))
+
+    merged = RankAccumulator(3).update(rankings[:2]).merge(RankAccumulator(3).update(rankings[2:]))
+    assert (merged.histogram == accumulator.histogram).all()
+    assert np.allclose(merged.variance(), accumulator.variance())
@@ -0,0 +1,95 @@
+# Copyright (c) 2024 Jakub Więckowski
+
+import numpy as np
+import pytest
+from pyfdm.adapters import *
+from pyfdm.methods import *
+
+
+@pytest.fixture
+def matrix(tfn_matrix):
+    return tfn_matrix((20, 4))
+
+
+def test_tfn_layout():
+    """
+        Test verifying that columns of components are recognized from names and pairs
+    """
+    criteria, positions = tfn_layout(['C1_l', 'C1_m', 'C1_u', 'C2_m', 'C2_l', 'C2_u'])
+    assert criteria == ['C1', 'C2']
+    assert (positions == [[0, 1, 2], [4, 3, 5]]).all()
+
+    criteria, positions = tfn_layout([('a', 'low'), ('b', 'low'), ('a', 'mid'), ('b', 'mid'), ('a', 'up'), ('b', 'up')],
+                                     components=('low', 'mid', 'up'))
+    assert criteria == ['a', 'b']
+    assert (positions == [[0, 2, 4], [1, 3, 5]]).all()
+
+    with pytest.raises(ValueError):
+        tfn_layout(['C1_l', 'C1_m'])
+    with pytest.raises(ValueError):
+        tfn_layout(['C1_l', 'C1_m', 'C1_u', 'C1_l'])
+    with pytest.raises(ValueError):
+        tfn_layout(['C1_l', 'C1_m', 'C1_x'])
+
+
+def test_from_pandas(matrix):
+    """
+        Test verifying that DataFrames with one block of values are converted without copying
+    """
+    pd = pytest.importorskip('pandas')
+
+    frame = pd.DataFrame(matrix.reshape(20, 12), columns=[f'C{j}_{c}' for j in range(4) for c in 'lmu'])
+    calculated_result = from_pandas(frame, copy=False)
+    assert np.array_equal(calculated_result, matrix)
+    assert np.shares_memory(calculated_result, frame.to_numpy(copy=False))
+    assert not calculated_result.flags.writeable
+
+    # components of all criteria one after another
+    frame = pd.DataFrame(matrix.transpose(0, 2, 1).reshape(20, 12),
+                         columns=pd.MultiIndex.from_product([['l', 'm', 'u'], range(4)]).swaplevel())
+    calculated_result = as_tfn_matrix(frame, copy=False)
+    assert np.array_equal(calculated_result, matrix)
+    assert not calculated_result.flags.c_contiguous
+
+    # columns with different data types are copied
+    frame = frame.astype({(0, 'l'): np.float32})
+    with pytest.raises(ValueError):
+        from_pandas(frame, copy=False)
+    assert np.allclose(from_pandas(frame), matrix)
+
+
+def test_from_arrow(matrix):
+    """
+        Test verifying that Arrow tables with columns of components and fixed size lists are converted
+    """
+    pa = pytest.importorskip('pyarrow')
+
+    table = pa.table({f'C{j}_{c}': matrix[:, j, i] for j in range(4) for i, c in enumerate('lmu')})
+    assert np.array_equal(from_arrow(table), matrix)
+
+    table = pa.table({f'C{j}': pa.FixedSizeListArray.from_arrays(pa.array(matrix[:, j].ravel()), 3) for j in range(4)})
+    assert np.array_equal(as_tfn_matrix(table), matrix)
+
+    # one buffer of TFNs of the criterion
+    table = pa.table({'C0': pa.FixedSizeListArray.from_arrays(pa.array(matrix[:, 0].ravel()), 3)})
+    assert np.array_equal(from_arrow(table, copy=False), matrix[:, :1])
+
+    table = pa.table({'C0_l': [1.0, None], 'C0_m': [2.0, 3.0], 'C0_u': [3.0, 4.0]})
+    with pytest.raises(ValueError):
+        from_arrow(table)
+
+
+def test_strided_matrix(matrix, crisp_weights, types):
+    """
+        Test verifying that methods assess read-only strided views of the decision matrix
+    """
+    strided = np.lib.stride_tricks.as_strided(np.ascontiguousarray(matrix.transpose(1, 2, 0)).transpose(2, 0, 1),
+                                              writeable=False)
+    assert not strided.flags.c_contiguous
+
+    bounds = np.array([[np.min(matrix[:, j, 0]) - 1, np.max(matrix[:, j, 2]) + 1] for j in range(4)])
+    w = crisp_weights
+    for method, args in [(fARAS(), (w, types)), (fCODAS(), (w, types)), (fMABAC(), (w, types)),
+                         (fSPOTIS(), (w, types, bounds)), (fTOPSIS(), (np.repeat(w, 3).reshape(4, 3), types)),
+                         (fVIKOR(), (w, types)), (fWPM(), (w, )), (fWSM(), (w, ))]:
+        assert np.allclose(method(strided, *args), method(matrix, *args))
@@ -0,0 +1,60 @@
+# Copyright (c) 2024 Jakub Więckowski
+
+import numpy as np
+import pytest
+from pyfdm.aggregation import *
+
+
+np.random.seed(9)
+matrices = np.sort(np.random.uniform(1, 9, (6, 4, 3, 3)), axis=3)
+
+experts = np.array([0.1, 0.3, 0.2, 0.1, 0.2, 0.1])
+
+
+def test_aggregation_operators():
+    """
+        Test verifying aggregation operators against formulas applied to stacked matrices
+    """
+    weights = experts / np.sum(experts)
+
+    mmm = min_mean_max_aggregation(matrices)
+    assert (mmm[..., 0] == np.min(matrices[..., 0], axis=0)).all()
+    assert np.allclose(mmm[..., 1], np.mean(matrices[..., 1], axis=0))
+    assert (mmm[..., 2] == np.max(matrices[..., 2], axis=0)).all()
+
+    mgm = min_geometric_max_aggregation(matrices, experts)
+    assert np.allclose(mgm[..., 1], np.prod(matrices[..., 1] ** weights[:, None, None], axis=0))
+
+    assert np.allclose(arithmetic_aggregation(matrices, experts), np.tensordot(weights, matrices, axes=1))
+    assert np.allclose(geometric_aggregation(matrices), np.prod(matrices, axis=0) ** (1/6))
+
+
+def test_aggregation_streaming():
+    """
+        Test verifying that matrices given one by one and merged partial aggregations give the same result
+    """
+    for operator in GroupAggregator.OPERATORS:
+        reference = GroupAggregator(operator).update(matrices, experts).result()
+
+        streamed = (matrix for matrix in matrices)
+        function = globals()[f'{operator}_aggregation']
+        assert np.allclose(function(streamed, experts), reference)
+
+        left = GroupAggregator(operator).update(matrices[:2], experts[:2])
+        right = GroupAggregator(operator)
+        for matrix, weight in zip(matrices[2:], experts[2:]):
+            right.update(matrix, weight)
+        assert np.allclose(left.merge(right).result(), reference)
+        assert left.count == 6
+
+    with pytest.raises(ValueError):
+        GroupAggregator('median')
+
+    for w in [[1, 1, 1, 5], [1, 1]]:
+        with pytest.raises(ValueError):
+            arithmetic_aggregation(iter(matrices[:3]), w)
+        with pytest.raises(ValueError):
+            arithmetic_aggregation(matrices[:3], np.array(w))
+
+    with pytest.raises(ValueError):
+        GroupAggregator().update(matrices[0]).update(matrices[0, :2])
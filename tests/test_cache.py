@@ -0,0 +1,107 @@
+# Copyright (c) 2024 Jakub Więckowski
+
+import threading
+import numpy as np
+from pyfdm.methods import *
+from pyfdm.methods.utils import normalizations, distances
+
+
+matrix = np.array([
+    [[5.7, 7.7, 9.3], [5, 7, 9], [5.7, 7.7, 9], [8.33, 9.67, 10], [3, 5, 7]],
+    [[6.3, 8.3, 9.7], [9, 10, 10], [8.3, 9.7, 10], [9, 10, 10], [7, 9, 10]],
+    [[6.3, 8, 9], [7, 9, 10], [7, 9, 10], [7, 9, 10], [6.3, 8.3, 9.7]]
+])
+
+weights = np.array([[0.7, 0.9, 1], [0.9, 1, 1],
+                    [0.77, 0.93, 1], [0.9, 1, 1], [0.43, 0.63, 0.83]])
+
+types = np.array([1, 1, 1, 1, -1])
+
+
+def test_memoize_hits_and_misses():
+    """
+        Test verifying that repeated identical evaluations are taken from the cache
+    """
+    f_topsis = memoize(fTOPSIS())
+
+    p1 = f_topsis(matrix, weights, types)
+    p2 = f_topsis(matrix.copy(), weights.copy(), types.copy())
+
+    reference = fTOPSIS()
+    assert (p1 == p2).all()
+    assert (p1 == reference(matrix, weights, types)).all()
+    assert (f_topsis.rank() == reference.rank()).all()
+    info = f_topsis.cache.info()
+    assert info.hits == 1
+    assert info.misses == 1
+    assert info.entries == 1
+
+
+def test_memoize_key_configuration():
+    """
+        Test verifying that the cache key distinguishes input data and method configuration
+    """
+    cache = ResultCache()
+    f_linear = memoize(fTOPSIS(), cache=cache)
+    f_vertex = memoize(fTOPSIS(normalization=normalizations.max_normalization), cache=cache)
+    f_euclid = memoize(fTOPSIS(distance=distances.euclidean_distance), cache=cache)
+
+    f_linear(matrix, weights, types)
+    f_vertex(matrix, weights, types)
+    f_euclid(matrix, weights, types)
+    f_linear(matrix, weights, types * -1)
+
+    assert cache.info().misses == 4
+    assert cache.info().hits == 0
+    assert len(cache) == 4
+
+
+def test_result_cache_eviction():
+    """
+        Test verifying the eviction of least recently used entries with entries and bytes limits
+    """
+    cache = ResultCache(max_entries=2)
+    cache.put('a', np.zeros(10))
+    cache.put('b', np.zeros(10))
+    cache.get('a')
+    cache.put('c', np.zeros(10))
+
+    assert 'a' in cache and 'c' in cache and 'b' not in cache
+
+    cache = ResultCache(max_entries=None, max_bytes=200)
+    cache.put('a', np.zeros(10))
+    cache.put('b', np.zeros(10))
+    cache.put('c', np.zeros(10))
+
+    assert len(cache) == 2
+    assert cache.nbytes == 160
+    assert 'a' not in cache
+
+    # returned values are copies
+    value = cache.get('c')
+    value[0] = 1
+    assert cache.get('c')[0] == 0
+
+
+def test_result_cache_threads():
+    """
+        Test verifying the consistency of the cache used by many threads
+    """
+    cache = ResultCache(max_entries=8)
+
+    def work(i):
+        for j in range(200):
+            key = (i + j) % 16
+            if cache.get(key) is None:
+                cache.put(key, np.full(4, key, dtype=float))
+
+    threads = [threading.Thread(target=work, args=(i, )) for i in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    info = cache.info()
+    assert info.entries <= 8
+    assert info.hits + info.misses == 1600
+    assert info.nbytes == 32 * info.entries
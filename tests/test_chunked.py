@@ -0,0 +1,74 @@
+# Copyright (c) 2024 Jakub Więckowski
+
+import numpy as np
+import pytest
+from pyfdm.methods import *
+from pyfdm.methods.utils import normalizations
+
+
+# number of alternatives not divisible by chunk sizes
+@pytest.fixture
+def matrix(tfn_matrix):
+    return tfn_matrix((503, 5))
+
+
+@pytest.fixture
+def weights():
+    return np.array([[0.7, 0.9, 1], [0.9, 1, 1], [0.77, 0.93, 1], [0.9, 1, 1], [0.43, 0.63, 0.83]])
+
+
+@pytest.fixture
+def crisp_weights():
+    return np.array([0.3, 0.2, 0.1, 0.15, 0.25])
+
+
+@pytest.fixture
+def types():
+    return np.array([1, 1, -1, 1, -1])
+
+
+@pytest.fixture
+def mmatrix(tmp_path, matrix):
+    path = tmp_path / 'matrix.npy'
+    np.save(path, matrix)
+    return np.load(path, mmap_mode='r')
+
+
+@pytest.mark.parametrize('normalization', [getattr(normalizations, name) for name in normalizations.__all__])
+def test_evaluate_chunked_topsis(mmatrix, matrix, weights, types, normalization):
+    """
+        Test verifying that chunked fuzzy TOPSIS gives the same preferences for all normalizations
+    """
+    f_topsis = fTOPSIS(normalization=normalization)
+    reference = f_topsis(matrix, weights, types)
+
+    assert np.allclose(evaluate_chunked(f_topsis, mmatrix, weights, types, chunk_size=64), reference)
+
+
+def test_evaluate_chunked_methods(mmatrix, matrix, weights, crisp_weights, types, tmp_path):
+    """
+        Test verifying chunked evaluation of MOORA, WSM and WPM methods written to the memory-mapped file
+    """
+    cases = [
+        (fMOORA(), crisp_weights, types),
+        (fWSM(), crisp_weights, None),
+        (fWSM(normalization=normalizations.vector_normalization), crisp_weights, None),
+        (fWPM(normalization=normalizations.saw_normalization), weights, None),
+    ]
+    for method, w, t in cases:
+        reference = method(matrix, w, t)
+        out = evaluate_chunked(method, mmatrix, w, t, out=tmp_path / 'preferences.npy', chunk_size=100)
+
+        assert isinstance(out, np.memmap)
+        assert np.allclose(np.load(tmp_path / 'preferences.npy'), reference)
+
+
+def test_evaluate_chunked_unsupported(mmatrix, weights, crisp_weights, types):
+    """
+        Test verifying that methods depending on the whole matrix are not evaluated in chunks
+    """
+    with pytest.raises(ValueError):
+        evaluate_chunked(fCODAS(), mmatrix, crisp_weights, types)
+
+    with pytest.raises(ValueError):
+        evaluate_chunked(fTOPSIS(normalization=lambda x, t: x), mmatrix, weights, types)
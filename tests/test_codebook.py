@@ -0,0 +1,92 @@
+# Copyright (c) 2024 Jakub Więckowski
+
+import numpy as np
+import pytest
+from pyfdm.codebook import TFNCodebook
+from pyfdm.config import use_dtype
+from pyfdm.methods import *
+from pyfdm.methods.utils import normalizations
+import pyfdm.weights as fw
+
+
+terms = np.array([[0, 0, 0.1], [0, 0.1, 0.3], [0.1, 0.3, 0.5], [0.3, 0.5, 0.7],
+                  [0.5, 0.7, 0.9], [0.7, 0.9, 1], [0.9, 1, 1]])
+
+np.random.seed(8)
+codes = np.random.randint(2, 7, (500, 4))
+matrix = terms[codes]
+
+types = np.array([1, -1, 1, -1])
+
+
+def test_codebook_encode_decode():
+    """
+        Test verifying encoding of the matrix with given and inferred terms
+    """
+    codebook = TFNCodebook.encode(matrix, terms)
+
+    assert codebook.codes.dtype == np.uint8
+    assert (codebook.codes == codes).all()
+    assert (codebook.decode() == matrix).all()
+    assert (np.asarray(codebook) == matrix).all()
+    assert codebook.shape == matrix.shape
+    assert codebook.nbytes < matrix.nbytes / 20
+
+    with use_dtype(np.float32):
+        assert codebook[:10].dtype == np.asarray(codebook).dtype == np.float32
+        assert (codebook[:10] == matrix[:10].astype(np.float32)).all()
+
+    inferred = TFNCodebook.encode(matrix)
+    assert (inferred.decode() == matrix).all()
+    assert inferred.terms.shape[0] == 5
+
+    with pytest.raises(ValueError):
+        TFNCodebook.encode(matrix, terms[1:3])
+
+
+def test_codebook_statistics():
+    """
+        Test verifying normalizations and weights calculated from counts of terms
+    """
+    codebook = TFNCodebook.encode(matrix, terms)
+
+    for name in normalizations.__all__:
+        normalization = getattr(normalizations, name)
+        assert np.allclose(codebook.normalize(normalization, types), normalization(matrix, types))
+
+    for name in ['shannon_entropy_weights', 'standard_deviation_weights', 'variance_weights']:
+        assert np.allclose(getattr(fw, name)(codebook), getattr(fw, name)(matrix))
+
+
+def test_codebook_methods():
+    """
+        Test verifying that methods accept the encoded matrix
+    """
+    codebook = TFNCodebook.encode(matrix, terms)
+    weights = fw.equal_weights(codebook)
+
+    assert np.allclose(fTOPSIS()(codebook, weights, types), fTOPSIS()(matrix, weights, types))
+    assert np.allclose(fEDAS()(codebook, weights, types), fEDAS()(matrix, weights, types))
+    assert np.allclose(evaluate_chunked(fTOPSIS(), codebook, weights, types, chunk_size=64),
+                       fTOPSIS()(matrix, weights, types))
+
+
+def test_codebook_normalized_methods():
+    """
+        Test verifying that methods with normalization assess the encoded matrix without decoding it
+    """
+    class Encoded(TFNCodebook):
+        def __array__(self, dtype=None, copy=None):
+            raise AssertionError('Encoded matrix should not be decoded')
+
+    codebook = Encoded.encode(matrix, terms)
+    weights = fw.equal_weights(codebook)
+    crisp_weights = np.full(4, 0.25)
+
+    for method, w, args in [(fTOPSIS(), weights, (types, )), (fMOORA(), weights, (types, )),
+                            (fWSM(normalizations.vector_normalization), crisp_weights, ()),
+                            (fWPM(normalizations.saw_normalization), crisp_weights, ())]:
+        result = method.evaluate(codebook, w, *args, intermediates=True)
+        reference = method.evaluate(matrix, w, *args, intermediates=True)
+        assert np.allclose(result.preferences, reference.preferences)
+        assert np.allclose(result.intermediates['nmatrix'], reference.intermediates['nmatrix'])
@@ -0,0 +1,98 @@
+# Copyright (c) 2024 Jakub Więckowski
+
+import numpy as np
+import pytest
+from pyfdm.config import *
+from pyfdm.methods import *
+from pyfdm.methods.utils import normalizations, distances, defuzzifications
+from pyfdm.helpers import generate_fuzzy_matrix
+from pyfdm.correlations import weighted_spearman_coef
+from pyfdm import weights as fw
+
+
+def test_dtype_configuration():
+    """
+        Test verifying global and temporary configuration of the computation data type
+    """
+    assert get_dtype() == np.float64
+
+    with use_dtype(np.float32):
+        assert get_dtype() == np.float32
+        assert resolve_dtype() == np.float32
+        assert resolve_dtype(np.float64) == np.float64
+    assert get_dtype() == np.float64
+
+    set_dtype('float32')
+    try:
+        assert get_dtype() == np.float32
+    finally:
+        set_dtype(np.float64)
+
+    with pytest.raises(ValueError):
+        set_dtype(np.int32)
+
+
+def test_utils_dtype():
+    """
+        Test verifying that normalizations, weights, distances and defuzzifications keep the requested data type
+    """
+    np.random.seed(0)
+    matrix = generate_fuzzy_matrix(6, 4, 1, 10)
+    types = np.array([1, -1, 1, -1])
+
+    for name in normalizations.__all__:
+        nmatrix = getattr(normalizations, name)(matrix, types, dtype=np.float32)
+        assert nmatrix.dtype == np.float32
+        assert np.allclose(nmatrix, getattr(normalizations, name)(matrix, types), rtol=1e-5, atol=1e-6)
+
+    for name in fw.__all__:
+        assert getattr(fw, name)(matrix, dtype=np.float32).dtype == np.float32
+
+    a, b = matrix[0, 0].astype(np.float32), matrix[1, 0].astype(np.float32)
+    for name in distances.__all__:
+        assert np.asarray(getattr(distances, name)(a, b)).dtype == np.float32
+    for name in defuzzifications.__all__:
+        assert np.asarray(getattr(defuzzifications, name)(a)).dtype == np.float32
+
+
+def test_methods_float32_rankings():
+    """
+        Test verifying that float32 computations give rankings close to the float64 ones
+    """
+    np.random.seed(42)
+    matrix = generate_fuzzy_matrix(40, 5, 1, 10)
+    types = np.array([1, -1, 1, 1, -1])
+    weights = np.ones(5) / 5
+    fuzzy_weights = np.repeat(weights, 3).reshape((5, 3))
+    bounds = np.array([[1.0, 10.0]] * 5)
+
+    methods = [
+        (fARAS(), ()), (fCOCOSO(), ()), (fCODAS(), ()), (fCOPRAS(), ()),
+        (fEDAS(), ()), (fMABAC(), ()), (fMAIRCA(), ()), (fMOORA(), ()),
+        (fOCRA(), ()), (fSPOTIS(), (bounds, )), (fWASPAS(), ()), (fWPM(), ()),
+        (fWSM(), ()),
+    ]
+
+    for method, args in methods:
+        p64 = method(matrix, weights, types, *args)
+        r64 = method.rank()
+        p32 = method(matrix, weights, types, *args, dtype=np.float32)
+        r32 = method.rank()
+
+        assert p32.dtype == np.float32
+        assert np.max(np.abs(p64 - p32)) <= 1e-4 * np.max(np.abs(p64))
+        assert weighted_spearman_coef(r64, r32) > 0.99
+
+    f_topsis = fTOPSIS()
+    p64 = f_topsis(matrix, fuzzy_weights, types)
+    with use_dtype(np.float32):
+        p32 = f_topsis(matrix, fuzzy_weights, types)
+    assert p32.dtype == np.float32
+    assert np.allclose(p64, p32, atol=1e-5)
+
+    f_vikor = fVIKOR()
+    p64 = f_vikor(matrix, weights, types)
+    p32 = f_vikor(matrix, weights, types, dtype=np.float32)
+    for a, b in zip(p64, p32):
+        assert b.dtype == np.float32
+        assert np.allclose(a, b, atol=1e-4)
@@ -54,3 +54,32 @@ def test_ws_rank_similarity_coef():
     x = np.array([7, 11, 2, 1, 4, 9, 6, 3, 5, 10, 8, 12])
     y = np.array([7, 11, 3, 2, 4, 9, 6, 1, 5, 10, 8, 12])
     assert np.round(ws_rank_similarity_coef(x, y), 2) == 0.9
+
+
+def test_correlation_matrices():
+    """
+        Test veryfing that correlation matrices equal the pairwise correlation coefficients.
+    """
+    np.random.seed(0)
+    rankings = np.array([np.random.permutation(12) + 1 for _ in range(20)])
+    pairs = [
+        (pearson_coef, pearson_coef_matrix),
+        (weighted_spearman_coef, weighted_spearman_coef_matrix),
+        (ws_rank_similarity_coef, ws_rank_similarity_coef_matrix),
+        (spearman_coef, spearman_rank_coef_matrix),
+    ]
+    for coef, coef_matrix in pairs:
+        reference = np.array([[coef(x, y) for y in rankings] for x in rankings])
+        assert np.allclose(coef_matrix(rankings), reference)
+        assert np.allclose(coef_matrix(rankings, chunk_size=3), reference)
+        assert np.allclose(coef_matrix(rankings[:5], rankings[5:]), reference[:5, 5:])
+
+
+def test_spearman_rank_coef_matrix():
+    """
+        Test veryfing that Spearman rank correlation is calculated based on ranks of values.
+    """
+    x = np.array([[0.1, 0.5, 0.2, 0.9], [1, 5, 2, 9], [0.4, 0.3, 0.2, 0.1]])
+    corr = spearman_rank_coef_matrix(x)
+    assert np.allclose(corr[0, 1], 1)
+    assert np.round(corr[0, 2], 2) == -0.8
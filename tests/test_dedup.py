@@ -0,0 +1,65 @@
+# Copyright (c) 2024 Jakub Więckowski
+
+import numpy as np
+import pytest
+from pyfdm.methods import *
+from pyfdm.methods.utils import normalizations
+
+
+@pytest.fixture
+def matrix():
+    # few linguistic terms, so alternatives are repeated
+    terms = np.array([[1, 2, 3], [2, 3, 4], [3, 4, 5], [4, 5, 6]], dtype=float)
+    return terms[np.random.default_rng(0).integers(0, 4, (200, 4))]
+
+
+def test_unique_alternatives(matrix):
+    """
+        Test verifying that unique alternatives reconstruct the decision matrix
+    """
+    unique, inverse = unique_alternatives(matrix)
+
+    assert unique.shape[0] < matrix.shape[0]
+    assert (unique[inverse] == matrix).all()
+    assert np.unique(matrix.reshape(200, -1), axis=0).shape[0] == unique.shape[0]
+
+
+def test_deduplicated_methods(matrix, weights, crisp_weights, types):
+    """
+        Test verifying that methods assessing only unique alternatives give the same preferences
+    """
+    cases = [
+        (fARAS, {'normalization': normalizations.max_normalization}, (weights, types)),
+        (fMOORA, {'normalization': normalizations.linear_normalization}, (crisp_weights, types)),
+        (fOCRA, {}, (crisp_weights, types)),
+        (fSPOTIS, {}, (crisp_weights, types, np.array([[1, 6]] * 4))),
+        (fTOPSIS, {}, (weights, types)),
+        (fVIKOR, {}, (weights, types)),
+        (fWPM, {}, (crisp_weights, )),
+        (fWSM, {'normalization': normalizations.saw_normalization}, (crisp_weights, )),
+    ]
+    for method, kwargs, args in cases:
+        reference = method(**kwargs)(matrix, *args)
+        calculated = method(deduplicate=True, **kwargs)(matrix, *args)
+
+        assert np.allclose(calculated, reference)
+
+        # intermediate results are given for all alternatives
+        reference = method(**kwargs).evaluate(matrix, *args, intermediates=True).intermediates
+        calculated = method(deduplicate=True, **kwargs).evaluate(matrix, *args, intermediates=True).intermediates
+        assert reference.keys() == calculated.keys()
+        for name in reference:
+            assert np.allclose(calculated[name], reference[name]), name
+
+
+def test_multiplicity_dependence(matrix, crisp_weights, types):
+    """
+        Test verifying that methods and normalizations depending on repeated alternatives are reported
+    """
+    assert multiplicity_dependence(fTOPSIS()) is None
+    assert multiplicity_dependence(fCODAS()) is not None
+    assert multiplicity_dependence(fMABAC()) is not None
+    assert 'sum_normalization' in multiplicity_dependence(fARAS())
+
+    with pytest.raises(ValueError):
+        fMOORA(deduplicate=True)(matrix, crisp_weights, types)
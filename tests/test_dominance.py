@@ -0,0 +1,49 @@
+# Copyright (c) 2024 Jakub Więckowski
+
+import numpy as np
+import pytest
+from pyfdm.dominance import pareto_filter
+from pyfdm.methods.utils.defuzzifications import mean_defuzzification
+
+
+def _brute_force(matrix, types, defuzzify=None):
+    if defuzzify is None:
+        values = np.concatenate([matrix[:, types == 1].reshape(len(matrix), -1),
+                                 -matrix[:, types == -1].reshape(len(matrix), -1)], axis=1)
+    else:
+        values = np.array([[defuzzify(x) for x in row] for row in matrix]) * types
+    return np.array([i for i in range(len(values))
+                     if not np.any(np.all(values >= values[i], axis=1) & np.any(values > values[i], axis=1))])
+
+
+def test_pareto_filter():
+    """
+        Test verifying that only dominated alternatives are removed
+    """
+    matrix = np.array([
+        [[3, 4, 5], [1, 2, 3]],
+        [[5, 6, 7], [3, 4, 5]],
+        [[3, 4, 5], [1, 2, 3]],
+        [[1, 2, 3], [1, 2, 3]],
+        [[3, 4, 6], [1, 2, 2]],
+    ])
+    types = np.array([1, -1])
+
+    # alternative 0 and its copy 2 are dominated by 4, 3 is dominated by 4
+    assert (pareto_filter(matrix, types) == [1, 4]).all()
+
+
+@pytest.mark.parametrize('ordering', ['componentwise', mean_defuzzification])
+def test_pareto_filter_random(ordering):
+    """
+        Test verifying the skyline against pairwise comparison of all alternatives
+    """
+    np.random.seed(5)
+    matrix = np.sort(np.random.randint(0, 6, (400, 3, 3)), axis=2).astype(float)
+    types = np.array([1, -1, 1])
+
+    reference = _brute_force(matrix, types, None if ordering == 'componentwise' else ordering)
+    assert (pareto_filter(matrix, types, ordering) == reference).all()
+
+    with pytest.raises(ValueError):
+        pareto_filter(matrix, types, 'unknown')
@@ -0,0 +1,69 @@
+# Copyright (c) 2024 Jakub Więckowski
+
+import numpy as np
+import pytest
+from pyfdm.methods import *
+from pyfdm.methods.utils import defuzzifications, distances
+
+
+@pytest.fixture
+def matrix(tfn_matrix):
+    return tfn_matrix((7, 4))
+
+
+@pytest.fixture
+def weights():
+    # weights lower than 1, so finite differences are not affected by normalization of weights
+    return np.array([[0.2, 0.3, 0.4], [0.1, 0.25, 0.3], [0.3, 0.35, 0.5], [0.15, 0.2, 0.3]])
+
+
+@pytest.fixture
+def scaled_weights(weights):
+    return weights * 4
+
+
+def _finite_differences(method, matrix, weights, args, h=1e-6):
+    jacobian = np.zeros((matrix.shape[0], ) + weights.shape)
+    for index in np.ndindex(weights.shape):
+        plus, minus = weights.copy(), weights.copy()
+        plus[index] += h
+        minus[index] -= h
+        jacobian[(slice(None), ) + index] = (method(matrix, plus, *args) - method(matrix, minus, *args)) / (2 * h)
+    return jacobian
+
+
+@pytest.mark.parametrize('method, typed, w', [
+    (fARAS(), True, 'weights'),
+    (fARAS(), True, 'crisp_weights'),
+    (fCOPRAS(), True, 'weights'),
+    (fMOORA(), True, 'crisp_weights'),
+    (fTOPSIS(), True, 'weights'),
+    (fTOPSIS(distance=distances.euclidean_distance), True, 'scaled_weights'),
+    (fTOPSIS(distance=distances.mahdavi_distance), True, 'weights'),
+    (fWASPAS(), True, 'weights'),
+    (fWPM(), False, 'weights'),
+    (fWSM(), False, 'crisp_weights'),
+    (fWSM(defuzzify=defuzzifications.lom_defuzzification), False, 'weights'),
+])
+def test_weights_jacobian(request, matrix, types, method, typed, w):
+    """
+        Test verifying that Jacobian of preferences equals the one calculated with finite differences
+    """
+    w = request.getfixturevalue(w)
+    args = (types, ) if typed else ()
+    jacobian = weights_jacobian(method, matrix, w, *args)
+
+    assert jacobian.shape == (matrix.shape[0], ) + w.shape
+    assert np.allclose(jacobian, _finite_differences(method, matrix, w, args), atol=1e-6)
+
+
+def test_weights_jacobian_deduplicated(matrix, weights, crisp_weights, types):
+    """
+        Test verifying Jacobian of method assessing only unique alternatives
+    """
+    repeated = np.concatenate([matrix, matrix[:3]])
+    jacobian = weights_jacobian(fWSM(deduplicate=True), repeated, crisp_weights)
+
+    assert np.allclose(jacobian, weights_jacobian(fWSM(), repeated, crisp_weights))
+    with pytest.raises(ValueError):
+        weights_jacobian(fVIKOR(), matrix, weights, types)
@@ -1,4 +1,4 @@
-# Copyright (c) 2022 Jakub Więckowski
+# Copyright (c) 2022-2024 Jakub Więckowski
 
 import numpy as np
 from pyfdm.helpers import *
@@ -30,3 +30,40 @@ def test_generate_fuzzy_matrix():
     assert np.max(matrix_1) <= 1
     assert np.min(matrix_2) >= 3
     assert np.max(matrix_2) <= 10
+
+
+def test_top_k():
+    """
+        Test veryfing that top k selection agrees with the full ranking in both directions, also in chunks
+    """
+    np.random.seed(3)
+    preferences = np.random.randint(0, 100, 5000).astype(float)
+
+    for descending in [True, False]:
+        reference = np.lexsort((np.arange(5000), -preferences if descending else preferences))[:20]
+
+        assert (top_k(preferences, 20, descending) == reference).all()
+        assert (top_k_chunked(preferences, 20, descending, chunk_size=301) == reference).all()
+        assert (top_k_chunked(np.array_split(preferences, 9), 20, descending) == reference).all()
+
+    assert (top_k(np.array([0.1, 0.3, 0.2]), 10) == [1, 2, 0]).all()
+    assert (top_k(np.array([[0.1, 0.3, 0.2], [0.3, 0.2, 0.1]]), 2) == [[1, 2], [0, 1]]).all()
+
+
+def test_methods_top_k():
+    """
+        Test veryfing that methods select the best alternatives with their ranking direction
+    """
+    from pyfdm.methods import fTOPSIS, fVIKOR
+
+    np.random.seed(5)
+    matrix = generate_fuzzy_matrix(50, 4, 1, 10)
+    weights = np.array([[0.7, 0.9, 1], [0.9, 1, 1], [0.77, 0.93, 1], [0.43, 0.63, 0.83]])
+    types = np.array([1, -1, 1, 1])
+
+    for method in [fTOPSIS(), fVIKOR()]:
+        method(matrix, weights, types)
+        ranking = method.rank()
+        ranking = ranking[-1] if ranking.ndim == 2 else ranking
+
+        assert (np.sort(ranking[method.top_k(5)]) == np.sort(ranking)[:5]).all()
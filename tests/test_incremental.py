@@ -0,0 +1,91 @@
+# Copyright (c) 2024 Jakub Więckowski
+
+import numpy as np
+import pytest
+from pyfdm.methods import *
+from pyfdm.methods.utils import normalizations
+
+
+@pytest.fixture
+def matrix(tfn_matrix):
+    return tfn_matrix((300, 4))
+
+
+def test_incremental_topsis(matrix, weights, types):
+    """
+        Test verifying that appended alternatives give the same preferences as full recomputation
+    """
+    evaluator = IncrementalEvaluator(fTOPSIS(), weights, types, matrix[:200])
+    for start in range(200, 300, 5):
+        evaluator.append(matrix[start:start+5])
+
+        reference = fTOPSIS()(matrix[:start+5], weights, types)
+        assert (evaluator.preferences == reference).all()
+
+    # new extremes require assessment of all alternatives
+    extreme = matrix[:1] * 2
+    evaluator.append(extreme)
+    reference = fTOPSIS()(np.concatenate([matrix, extreme]), weights, types)
+
+    assert (evaluator.preferences == reference).all()
+    assert evaluator.partial_updates > 1
+    assert evaluator.full_updates >= 1
+    f_topsis = fTOPSIS()
+    f_topsis(evaluator.matrix, weights, types)
+    assert (evaluator.rank() == f_topsis.rank()).all()
+
+
+@pytest.mark.parametrize('normalization', [None, normalizations.vector_normalization, normalizations.saw_normalization])
+def test_incremental_wsm(matrix, crisp_weights, normalization):
+    """
+        Test verifying incremental WSM with and without normalization
+    """
+    evaluator = IncrementalEvaluator(fWSM(normalization=normalization), crisp_weights)
+    for chunk in np.array_split(matrix, 7):
+        evaluator.append(chunk)
+
+    assert len(evaluator) == matrix.shape[0]
+    assert np.allclose(evaluator.preferences, fWSM(normalization=normalization)(matrix, crisp_weights))
+    if normalization is None:
+        assert evaluator.full_updates == 0
+
+
+@pytest.mark.parametrize('normalization', [normalizations.vector_normalization, normalizations.sum_normalization,
+                                           normalizations.waspas_normalization, normalizations.max_normalization])
+def test_incremental_moora(matrix, crisp_weights, types, normalization):
+    """
+        Test verifying that MOORA preferences are rescaled when statistics of scaling normalizations change
+    """
+    evaluator = IncrementalEvaluator(fMOORA(normalization), crisp_weights, types)
+    for chunk in np.array_split(matrix, 7):
+        preferences = evaluator.append(chunk)
+
+    assert np.allclose(preferences, fMOORA(normalization)(matrix, crisp_weights, types))
+    if normalization in (normalizations.vector_normalization, normalizations.sum_normalization):
+        assert evaluator.rescaled_updates == 6
+        assert evaluator.full_updates == 0
+    if normalization is normalizations.max_normalization:
+        assert evaluator.rescaled_updates == 0
+
+
+def test_incremental_preferences_copy(matrix, crisp_weights):
+    """
+        Test verifying that preferences given to the caller are not changed by appended alternatives
+    """
+    f_wsm = fWSM(normalization=normalizations.vector_normalization)
+    evaluator = IncrementalEvaluator(f_wsm, crisp_weights, matrix=matrix[:10])
+    preferences, method_preferences = evaluator.append(matrix[10:20]), f_wsm.preferences
+    reference = preferences.copy()
+
+    evaluator.append(matrix[20:])
+    assert (preferences == reference).all() and (method_preferences == reference).all()
+    assert f_wsm.preferences.shape[0] == matrix.shape[0]
+    assert (evaluator.rank() == f_wsm.rank()).all()
+
+
+def test_incremental_unsupported(crisp_weights, types):
+    """
+        Test verifying that only fTOPSIS, fMOORA and fWSM methods are evaluated incrementally
+    """
+    with pytest.raises(ValueError):
+        IncrementalEvaluator(fCODAS(), crisp_weights, types)
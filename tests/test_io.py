@@ -0,0 +1,104 @@
+# Copyright (c) 2024 Jakub Więckowski
+
+import io
+
+import numpy as np
+import pytest
+from pyfdm.io import *
+from pyfdm.methods import fTOPSIS, evaluate_chunked
+
+
+np.random.seed(14)
+matrix = np.sort(np.random.uniform(0, 1, (50, 4, 3)), axis=2)
+
+types = np.array([1, -1, 1, -1])
+
+weights = np.array([[0.2, 0.3, 0.4], [0.1, 0.2, 0.3], [0.3, 0.4, 0.5], [0.2, 0.3, 0.4]])
+
+
+def test_csv():
+    """
+        Test verifying that written decision matrix is read without changes, also in chunks
+    """
+    f = io.StringIO()
+    write_csv(f, matrix)
+    f.seek(0)
+    assert np.array_equal(read_csv(f, chunk_size=7), matrix)
+
+    f.seek(0)
+    chunks = list(iter_csv(f, chunk_size=20))
+    assert [c.shape[0] for c in chunks] == [20, 20, 10]
+
+    text = 'C1;C2\n(1, 2, 3);[4,5,6]\n\n(0.5,1,1.5); (2, 2, 2)\n'
+    assert np.array_equal(read_csv(io.StringIO(text), delimiter=';'),
+                          [[[1, 2, 3], [4, 5, 6]], [[0.5, 1, 1.5], [2, 2, 2]]])
+    assert read_csv(io.StringIO(text), delimiter=';', dtype=np.float32).dtype == np.float32
+
+    for text in ['C1,C2\n"(1, 2, 3)","(4, 5, 6)"\n"(1, 1, 1)"\n', 'C1,C2\n"(1,2)","(3,4,5,6)"\n',
+                 'C1,C2\n(1, 2, 3),4\n', 'C1,C2\n(1, 2, 3),(4, 5, 6\n']:
+        with pytest.raises(ValueError):
+            read_csv(io.StringIO(text))
+
+
+def test_convert_csv(tmp_path):
+    """
+        Test verifying that matrix converted into .npy file is assessed chunk by chunk
+    """
+    write_csv(tmp_path / 'matrix.csv', matrix)
+    converted = convert_csv(tmp_path / 'matrix.csv', tmp_path / 'matrix.npy', chunk_size=16)
+    assert np.array_equal(converted, matrix)
+
+    data = load(tmp_path / 'matrix.npy', mmap_mode='r')
+    assert isinstance(data.matrix, np.memmap)
+    assert np.allclose(evaluate_chunked(fTOPSIS(), data.matrix, weights, types, chunk_size=16),
+                       fTOPSIS()(matrix, weights, types))
+
+
+def test_json():
+    """
+        Test verifying that written decision matrix is read without changes and the structure is checked
+    """
+    f = io.StringIO()
+    write_json(f, matrix)
+    f.seek(0)
+    assert np.array_equal(read_json(f), matrix)
+
+    for text in ['[[[1, 2, 3], [1, 2]]]', '[[[1, 2, 3, 4], [5, 6]]]', '[[[1, 2, 3]], [[1, 2, 3], [4, 5, 6]]]', '[[1, 2, 3]]', '{"matrix": 1}',
+                 '[[[1, 2, null]]]']:
+        with pytest.raises(ValueError):
+            read_json(io.StringIO(text))
+
+
+def test_write_results():
+    """
+        Test verifying that preferences and rankings are written for each alternative
+    """
+    f = io.StringIO()
+    write_results(f, np.array([0.5, 0.2]), np.array([1, 2]), names=['a', 'b'])
+    assert f.getvalue() == 'alternative,preference,rank\na,0.5,1\nb,0.2,2\n'
+
+    f = io.StringIO()
+    write_results(f, (np.array([0.5, 0.2]), np.array([1.0, 2.0])))
+    assert f.getvalue() == 'alternative,preference_1,preference_2\nA1,0.5,1.0\nA2,0.2,2.0\n'
+
+    with pytest.raises(ValueError):
+        write_results(io.StringIO(), np.array([0.5, 0.2]), np.array([1, 2, 3]))
+
+
+def test_save_load(tmp_path):
+    """
+        Test verifying that decision matrix is saved with criteria types and weights
+    """
+    save(tmp_path / 'data.npz', matrix, types, weights)
+    data = load(tmp_path / 'data.npz')
+    assert np.array_equal(data.matrix, matrix)
+    assert np.array_equal(data.types, types)
+    assert np.array_equal(data.weights, weights)
+
+    save(tmp_path / 'matrix.npz', matrix)
+    assert load(tmp_path / 'matrix.npz').types is None
+
+    with pytest.raises(ValueError):
+        save(tmp_path / 'matrix.npy', matrix, types)
+    with pytest.raises(ValueError):
+        save(tmp_path / 'data.npz', matrix, types[:2])
@@ -1,6 +1,7 @@
 # Copyright (c) 2022-2023 Jakub Więckowski
 
 import numpy as np
+import pytest
 from pyfdm.methods import *
 
 
@@ -87,6 +88,36 @@ def test_fCODAS():
     assert (np.round(calculated_result.astype(float), 2) == reference_result).all()
     assert (f_codas.rank() == [1, 4, 3, 5, 2]).all()
 
+def test_fCODAS_sorted():
+    """
+        Test verifying that the O(m log m) fuzzy CODAS assessment equals the pairwise relative assessment
+    """
+    np.random.seed(0)
+    matrix = np.sort(np.random.uniform(1, 10, (60, 4, 3)), axis=2)
+    weights = np.array([0.3, 0.2, 0.4, 0.1])
+    types = np.array([1, -1, 1, -1])
+
+    for tau in [0, 0.02, 0.1, 1]:
+        pairwise = fCODAS()(matrix, weights, types, tau)
+        f_codas = fCODAS(algorithm='sorted')
+        calculated_result = f_codas(matrix, weights, types, tau)
+        assert np.allclose(calculated_result, pairwise)
+
+    # alternatives with equal distances
+    matrix = np.array([
+        [[3, 4, 5],[4, 5, 6],[8, 9, 9]],
+        [[6, 7, 8],[4, 5, 6],[1, 2, 3]],
+        [[3, 4, 5],[4, 5, 6],[8, 9, 9]],
+        [[8, 9, 9],[2, 3, 4],[2, 3, 4]],
+        [[6, 7, 8],[4, 5, 6],[1, 2, 3]],
+    ])
+    weights = np.array([0.394, 0.084, 0.522])
+    types = np.array([-1, 1, 1])
+    assert np.allclose(fCODAS(algorithm='sorted')(matrix, weights, types), fCODAS()(matrix, weights, types))
+
+    with pytest.raises(ValueError):
+        fCODAS(algorithm='windowed')
+
 def test_fCOPRAS():
     """
         Test verifying correctness of the fuzzy COPRAS method combined with Triangular Fuzzy Number
@@ -473,3 +504,33 @@ def test_fWSM():
     reference_result = np.array([2, 3, 1])
 
     assert (f_wsm.rank() == reference_result).all()
+
+
+def test_parameters_array():
+    """
+        Test verifying that arrays of tau, d and v parameters give preferences of each value in rows
+    """
+    np.random.seed(5)
+    matrix = np.sort(np.random.uniform(1, 10, (30, 4, 3)), axis=2)
+    weights = np.array([0.3, 0.2, 0.4, 0.1])
+    types = np.array([1, -1, 1, -1])
+
+    for method, parameters in [(fCODAS(), np.linspace(0, 0.5, 11)),
+                               (fCODAS(algorithm='sorted'), np.linspace(0, 0.5, 11)),
+                               (fCOCOSO(), np.linspace(0, 1, 11))]:
+        calculated_result = method(matrix, weights, types, parameters)
+        reference_result = np.array([method(matrix, weights, types, p) for p in parameters])
+        assert calculated_result.shape == (11, 30)
+        assert np.allclose(calculated_result, reference_result)
+        method(matrix, weights, types, parameters)
+        assert method.rank().shape == (11, 30)
+        assert method.top_k(3).shape == (11, 3)
+
+    f_vikor = fVIKOR()
+    parameters = np.linspace(0, 1, 11)
+    calculated_result = f_vikor(matrix, weights, types, parameters)
+    for i, v in enumerate(parameters):
+        reference_result = fVIKOR()(matrix, weights, types, v)
+        assert all(np.allclose(calculated_result[k][i], reference_result[k]) for k in range(3))
+    assert f_vikor.rank().shape == (3, 11, 30)
+    assert f_vikor.top_k(3).shape == (11, 3)
@@ -0,0 +1,88 @@
+# Copyright (c) 2024 Jakub Więckowski
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+from pyfdm.methods import *
+
+
+matrix = np.array([
+    [[4, 5, 6], [2, 3, 4], [5, 6, 7], [3, 4, 5]],
+    [[3, 4, 5], [4, 5, 6], [2, 3, 4], [1, 2, 3]],
+    [[5, 6, 7], [1, 2, 3], [4, 5, 6], [2, 3, 4]],
+    [[2, 3, 4], [3, 4, 5], [3, 4, 5], [4, 5, 6]],
+    [[1, 2, 3], [5, 6, 7], [3, 4, 5], [2, 3, 4]]
+], dtype=float)
+
+weights = np.array([[0.7, 0.9, 1], [0.9, 1, 1], [0.77, 0.93, 1], [0.43, 0.63, 0.83]])
+
+crisp_weights = np.array([0.3, 0.2, 0.25, 0.25])
+
+types = np.array([1, -1, 1, -1])
+
+bounds = np.array([[1, 7]] * 4)
+
+cases = [
+    (fARAS(), (weights, types)),
+    (fCOCOSO(), (weights, types)),
+    (fCODAS(), (weights, types)),
+    (fCOPRAS(), (weights, types)),
+    (fEDAS(), (weights, types)),
+    (fMABAC(), (weights, types)),
+    (fMAIRCA(), (weights, types)),
+    (fMOORA(), (crisp_weights, types)),
+    (fOCRA(), (crisp_weights, types)),
+    (fSPOTIS(), (crisp_weights, types, bounds)),
+    (fTOPSIS(), (weights, types)),
+    (fVIKOR(), (weights, types)),
+    (fWASPAS(), (weights, types)),
+    (fWPM(), (weights, )),
+    (fWSM(), (weights, )),
+]
+
+
+@pytest.mark.parametrize('method, args', cases)
+def test_evaluate(method, args):
+    """
+        Test verifying that evaluation gives the same results as the method call without changing the object
+    """
+    result = method.evaluate(matrix, *args, intermediates=True)
+
+    assert not hasattr(method, 'preferences')
+    assert isinstance(result, MethodResult)
+    assert result.intermediates
+
+    preferences = method(matrix, *args)
+    assert np.array_equal(np.asarray(result.preferences), np.asarray(preferences))
+    assert np.array_equal(result.ranking, method.rank())
+
+
+def test_evaluate_read_only():
+    """
+        Test verifying that results of the evaluation cannot be modified
+    """
+    result = fTOPSIS().evaluate(matrix, weights, types, intermediates=True)
+
+    with pytest.raises(ValueError):
+        result.preferences[0] = 0
+    with pytest.raises(ValueError):
+        result.intermediates['nmatrix'][0] = 0
+    with pytest.raises(TypeError):
+        result.intermediates['fpis'] = None
+    assert fTOPSIS().evaluate(matrix, weights, types).intermediates is None
+
+
+def test_evaluate_threads():
+    """
+        Test verifying that one method object can be evaluated concurrently from many threads
+    """
+    method = fTOPSIS()
+    samples = [weights * (1 + 0.1 * i) for i in range(32)]
+    expected = [fTOPSIS()(matrix, w, types) for w in samples]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda w: method.evaluate(matrix, w, types), samples))
+
+    for result, preferences in zip(results, expected):
+        assert np.array_equal(result.preferences, preferences)
@@ -0,0 +1,77 @@
+# Copyright (c) 2024 Jakub Więckowski
+
+import numpy as np
+import pytest
+from pyfdm.methods import *
+from pyfdm.methods.utils import normalizations
+from pyfdm.helpers import generate_fuzzy_matrix
+
+calls = []
+
+
+def counted_normalization(matrix, types):
+    calls.append(matrix.shape)
+    return normalizations.minmax_normalization(matrix, types)
+
+
+def test_compare_methods():
+    """
+        Test verifying that the comparison runner gives the same results as separate methods calls
+    """
+    np.random.seed(0)
+    matrix = generate_fuzzy_matrix(8, 4, 1, 10)
+    weights = np.array([0.3, 0.2, 0.4, 0.1])
+    types = np.array([1, -1, 1, -1])
+    bounds = np.array([[1.0, 10.0]] * 4)
+
+    methods = [fARAS(), fCODAS(), fMABAC(), fMOORA(), fSPOTIS(), fVIKOR(), fWSM()]
+    parameters = [{}, {'tau': 0.05}, {}, {}, {'bounds': bounds}, {'v': 0.4}, {}]
+
+    for executor in [None, 'thread', 'process']:
+        preferences, rankings = compare_methods(methods, matrix, weights, types, parameters, executor=executor)
+
+        assert preferences.shape == (len(methods), matrix.shape[0])
+        assert rankings.shape == (len(methods), matrix.shape[0])
+
+        for i, (method, kwargs) in enumerate(zip(methods, parameters)):
+            reference = method(matrix, weights, types, **kwargs)
+            reference_rank = method.rank()
+            if isinstance(reference, tuple):
+                reference, reference_rank = reference[-1], reference_rank[-1]
+            assert np.allclose(preferences[i], reference)
+            assert (rankings[i] == reference_rank).all()
+
+
+def test_compare_methods_shared_normalization():
+    """
+        Test verifying that the normalization shared by methods is calculated once
+    """
+    np.random.seed(1)
+    matrix = generate_fuzzy_matrix(6, 3, 1, 10)
+    weights = np.array([0.5, 0.3, 0.2])
+    types = np.array([1, -1, 1])
+
+    methods = [fMABAC(normalization=counted_normalization), fCODAS(normalization=counted_normalization),
+               fMOORA(normalization=counted_normalization)]
+
+    calls.clear()
+    preferences, _ = compare_methods(methods, matrix, weights, types)
+
+    assert len(calls) == 1
+    assert np.allclose(preferences[0], fMABAC(normalization=counted_normalization)(matrix, weights, types))
+
+
+def test_compare_methods_errors():
+    """
+        Test verifying that errors of shared normalization are raised by methods using it
+    """
+    np.random.seed(2)
+    matrix = generate_fuzzy_matrix(6, 3, 1, 10)
+    weights = np.array([0.5, 0.3, 0.2])
+    types = np.array([1, -1, 1])
+
+    def failing_normalization(matrix, types):
+        raise ValueError('Normalization failed')
+
+    with pytest.raises(ValueError, match='Normalization failed'):
+        compare_methods([fMABAC(normalization=failing_normalization)], matrix, weights, types, executor=None)
@@ -0,0 +1,78 @@
+# Copyright (c) 2024 Jakub Więckowski
+
+import asyncio
+from concurrent.futures import Executor, Future
+
+import numpy as np
+import pytest
+from pyfdm.methods import *
+
+
+@pytest.fixture
+def matrices(tfn_matrix):
+    # requests with different numbers of alternatives
+    return [tfn_matrix((m, 4), seed=m) for m in [3, 5, 8, 2, 6]]
+
+
+async def _gather(evaluator, requests):
+    return await asyncio.gather(*[evaluator.evaluate(*request) for request in requests], return_exceptions=True)
+
+
+def test_async_batched(matrices, weights):
+    """
+        Test verifying that concurrent requests of row separable method are assessed with one call
+    """
+    evaluator = AsyncEvaluator(fWSM(), window=0.05)
+    results = asyncio.run(_gather(evaluator, [(matrix, weights) for matrix in matrices]))
+
+    assert evaluator.batches == 1
+    assert evaluator.calls == 1
+    for matrix, result in zip(matrices, results):
+        assert np.allclose(result, fWSM()(matrix, weights))
+
+
+def test_async_not_separable(matrices, weights, types):
+    """
+        Test verifying that requests of methods depending on all alternatives are assessed separately
+    """
+    evaluator = AsyncEvaluator(fTOPSIS(), window=0.05)
+    results = asyncio.run(_gather(evaluator, [(matrix, weights, types) for matrix in matrices]))
+
+    assert not row_separable(fTOPSIS())
+    assert evaluator.batches == 1
+    assert evaluator.calls == len(matrices)
+    for matrix, result in zip(matrices, results):
+        assert np.allclose(result, fTOPSIS()(matrix, weights, types))
+
+
+def test_async_errors(matrices, weights):
+    """
+        Test verifying that invalid request does not affect other requests in the batch
+    """
+    evaluator = AsyncEvaluator(fWSM(), window=0.05, max_batch=3)
+    requests = [(matrices[0], weights), (matrices[1][..., :2], weights), (matrices[2], weights)]
+    results = asyncio.run(_gather(evaluator, requests))
+
+    assert isinstance(results[1], ValueError)
+    assert np.allclose(results[0], fWSM()(matrices[0], weights))
+    assert np.allclose(results[2], fWSM()(matrices[2], weights))
+
+    with pytest.raises(ValueError):
+        AsyncEvaluator(fWSM(), window=-1)
+
+
+def test_async_cancelled(matrices, weights):
+    """
+        Test verifying that requests are cancelled when their batch is cancelled in the executor
+    """
+    class CancellingExecutor(Executor):
+        def submit(self, fn, *args, **kwargs):
+            future = Future()
+            future.cancel()
+            return future
+
+    evaluator = AsyncEvaluator(fWSM(), window=0.01, executor=CancellingExecutor())
+    results = asyncio.run(asyncio.wait_for(_gather(evaluator, [(matrix, weights) for matrix in matrices]), 5))
+
+    assert all(isinstance(result, asyncio.CancelledError) for result in results)
+
@@ -0,0 +1,37 @@
+# Copyright (c) 2024 Jakub Więckowski
+
+import numpy as np
+from pyfdm.methods import *
+
+
+np.random.seed(6)
+matrix = np.sort(np.random.uniform(1, 10, (60, 5, 3)), axis=2)
+
+types = np.array([1, -1, 1, 1, -1])
+
+
+def test_evaluate_shared():
+    """
+        Test verifying that samples evaluated in worker processes give the same results as sequential evaluation
+    """
+    weights = np.sort(np.random.uniform(0.1, 1, (9, 5, 3)), axis=2)
+
+    calculated = evaluate_shared(fTOPSIS(), matrix, weights, types, max_workers=2)
+    reference = np.array([fTOPSIS()(matrix, w, types) for w in weights])
+
+    assert calculated.shape == (9, 60)
+    assert np.allclose(calculated, reference)
+
+
+def test_evaluate_shared_parameters():
+    """
+        Test verifying evaluation with parameters of each sample and multiple preference vectors
+    """
+    weights = np.sort(np.random.uniform(0.1, 1, (4, 5, 3)), axis=2)
+    parameters = [{'v': v} for v in [0, 0.3, 0.6, 1]]
+
+    calculated = evaluate_shared(fVIKOR(), matrix, weights, types, parameters, max_workers=2, chunksize=1)
+    reference = np.array([fVIKOR()(matrix, w, types, **p) for w, p in zip(weights, parameters)])
+
+    assert calculated.shape == (4, 3, 60)
+    assert np.allclose(calculated, reference)
@@ -0,0 +1,88 @@
+# Copyright (c) 2024 Jakub Więckowski
+
+import numpy as np
+import pytest
+from scipy.stats import triang
+from pyfdm.methods import *
+from pyfdm.methods.utils.normalizations import minmax_normalization, vector_normalization
+from pyfdm.methods.utils.distances import euclidean_distance
+
+
+@pytest.fixture
+def matrix(tfn_matrix):
+    return tfn_matrix((6, 4))
+
+
+def test_triangular_samples(matrix):
+    """
+        Test verifying that drawn values follow triangular distributions of TFNs
+    """
+    samples = triangular_samples(matrix, 100000, 1)
+    a, b, c = matrix[0, 0]
+
+    assert samples.shape == (100000, 6, 4)
+    assert np.all((samples >= matrix[..., 0]) & (samples <= matrix[..., 2]))
+    assert np.isclose(np.mean(samples[:, 0, 0]), (a + b + c) / 3, atol=0.02)
+    assert np.isclose(np.quantile(samples[:, 0, 0], 0.3), triang.ppf(0.3, (b - a) / (c - a), loc=a, scale=c - a), atol=0.02)
+    assert np.all(triangular_samples(np.full((2, 2, 3), 4.0), 10) == 4)
+
+
+def test_smaa_batched(matrix):
+    """
+        Test verifying that results do not depend on the batch size and the weighted sum is calculated in batched form
+    """
+    class CustomWSM(fWSM):
+        pass
+
+    result = smaa(fWSM(), matrix, samples=500, batch_size=64, rng=3)
+    reference = smaa(CustomWSM(), matrix, samples=500, batch_size=500, rng=3)
+
+    assert isinstance(result, SMAAResult)
+    assert np.allclose(result.acceptability, reference.acceptability)
+    assert np.allclose(result.central_weights, reference.central_weights, equal_nan=True)
+    assert np.allclose(np.sum(result.acceptability, axis=0), 1)
+    assert np.allclose(np.sum(result.acceptability, axis=1), 1)
+    assert np.allclose(np.nansum(result.central_weights, axis=1)[result.acceptability[:, 0] > 0], 1)
+
+    # tied alternatives share the better rank
+    tied = np.repeat(matrix[[0, 0, 1], :, 1:2], 3, axis=2)
+    result = smaa(fWSM(), tied, samples=50, rng=3)
+    assert np.array_equal(result.acceptability[0], result.acceptability[1])
+    assert result.acceptability[0, 2] == 0 and result.acceptability[2, 1] == 0
+
+
+def test_smaa_batched_methods(matrix, types):
+    """
+        Test verifying that batched assessments of methods with normalizations match assessments of single samples
+    """
+    weights = np.array([0.2, 0.1, 0.4, 0.3])
+    for method, args in [(fWPM(), ()), (fWSM(vector_normalization), ()), (fTOPSIS(), (types, )),
+                         (fTOPSIS(minmax_normalization, euclidean_distance), (types, )), (fMOORA(), (types, ))]:
+        custom = type('Custom', (type(method), ), {})()
+        custom.__dict__.update(method.__dict__)
+
+        result = smaa(method, matrix, *args, samples=200, rng=5)
+        reference = smaa(custom, matrix, *args, samples=200, rng=5)
+        assert np.allclose(result.acceptability, reference.acceptability)
+        assert np.allclose(result.central_weights, reference.central_weights, equal_nan=True)
+
+        result = smaa(method, matrix, *args, weights=weights, samples=50, rng=5)
+        reference = smaa(custom, matrix, *args, weights=weights, samples=50, rng=5)
+        assert np.allclose(result.acceptability, reference.acceptability)
+
+    with pytest.raises(ValueError):
+        smaa(fWPM(), matrix, weights=np.array([2, 1, 1, 3]), samples=10)
+
+
+def test_smaa_methods(matrix, types):
+    """
+        Test verifying acceptability analysis with methods requiring types and fixed weights
+    """
+    weights = np.full(4, 0.25)
+    for method in [fTOPSIS(), fVIKOR()]:
+        result = smaa(method, matrix, types, weights=weights, samples=50, rng=0)
+        assert np.allclose(np.sum(result.acceptability, axis=1), 1)
+        assert np.allclose(result.central_weights[result.acceptability[:, 0] > 0], weights)
+
+    with pytest.raises(ValueError):
+        smaa(fWSM(), matrix, weights=np.full(3, 1/3))
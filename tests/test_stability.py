@@ -0,0 +1,69 @@
+# Copyright (c) 2024 Jakub Więckowski
+
+import numpy as np
+import pytest
+from pyfdm.methods import *
+
+
+@pytest.fixture
+def matrix(tfn_matrix):
+    return tfn_matrix((8, 4))
+
+
+@pytest.fixture
+def fuzzy_weights(tfn_matrix):
+    return tfn_matrix((4, ), 0.1, 1)
+
+
+def _ranking(method, matrix, w, args, target):
+    ranking = method.evaluate(matrix, w, *args).ranking
+    ranking = ranking[-1] if ranking.ndim == 2 else ranking
+    return ranking if target == 'ranking' else ranking == np.min(ranking)
+
+
+def _weights_at(w, j, x):
+    if w.ndim == 1:
+        changed = w * (1 - x) / (1 - w[j])
+        changed[j] = x
+        return changed
+    changed = w.copy()
+    changed[j] *= x
+    return changed
+
+
+@pytest.mark.parametrize('method, typed, w', [
+    (fWSM(), False, 'crisp_weights'),
+    (fWSM(), False, 'fuzzy_weights'),
+    (fARAS(), True, 'crisp_weights'),
+    (fTOPSIS(), True, 'fuzzy_weights'),
+    (fVIKOR(), True, 'crisp_weights'),
+])
+@pytest.mark.parametrize('target', ['ranking', 'top'])
+def test_weight_stability(request, matrix, types, method, typed, w, target):
+    """
+        Test verifying that ranking remains the same within the intervals and changes right outside them
+    """
+    w = request.getfixturevalue(w)
+    args = (types, ) if typed else ()
+    intervals = weight_stability(method, matrix, w, *args, target=target)
+    reference = _ranking(method, matrix, w, args, target)
+
+    assert intervals.shape == (4, 2)
+    for j, (lower, upper) in enumerate(intervals):
+        position = w[j] if w.ndim == 1 else 1
+        assert lower <= position <= upper
+        for x in np.linspace(lower, min(upper, 20), 12)[1:-1]:
+            assert np.array_equal(_ranking(method, matrix, _weights_at(w, j, x), args, target), reference)
+        if lower > 0:
+            assert not np.array_equal(_ranking(method, matrix, _weights_at(w, j, lower - 1e-5), args, target), reference)
+        if upper < (1 if w.ndim == 1 else np.inf):
+            assert not np.array_equal(_ranking(method, matrix, _weights_at(w, j, upper + 1e-5), args, target), reference)
+
+
+def test_weight_stability_degenerate(matrix, types):
+    """
+        Test verifying that crisp weight equal to 1 is rejected instead of dividing by zero
+    """
+    for method, args in [(fWSM(), ()), (fVIKOR(), (types, ))]:
+        with pytest.raises(ValueError):
+            weight_stability(method, matrix, np.array([0, 1., 0, 0]), *args)
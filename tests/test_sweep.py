@@ -0,0 +1,81 @@
+# Copyright (c) 2024 Jakub Więckowski
+
+import itertools
+
+import numpy as np
+import pytest
+from pyfdm.methods import *
+from pyfdm.methods.utils import defuzzifications, distances, normalizations
+
+
+@pytest.fixture
+def matrix(tfn_matrix):
+    return tfn_matrix((10, 4))
+
+
+@pytest.fixture
+def fuzzy_weights(tfn_matrix):
+    return tfn_matrix((4, ), 0.1, 1)
+
+
+norms = [normalizations.linear_normalization, normalizations.minmax_normalization, normalizations.vector_normalization]
+
+
+def _distance(a, b):
+    # distance of single TFNs only, calculated for each pair
+    return float(np.sum(np.abs(np.asarray(a) - np.asarray(b))))
+
+
+def test_sweep_topsis(matrix, fuzzy_weights, types):
+    """
+        Test verifying that results of configurations are the same as results of methods objects
+        and each normalization is computed once
+    """
+    grid = {'normalization': norms, 'distance': [distances.euclidean_distance, distances.hamming_distance]}
+    result = sweep(fTOPSIS, grid, matrix, fuzzy_weights, types)
+
+    assert result.preferences.shape == (6, 10)
+    assert result.rankings.shape == (6, 10)
+    assert result.stages['normalization'].misses == 3
+    assert result.stages['normalization'].hits == 3
+    for i, (n, d) in enumerate(itertools.product(*grid.values())):
+        assert result.configurations[i]['normalization'] == n.__name__
+        assert result.configurations[i]['distance'] == d.__name__
+        assert np.allclose(result.preferences[i], fTOPSIS(n, d)(matrix, fuzzy_weights, types))
+
+
+def test_sweep_distances(matrix, crisp_weights, types):
+    """
+        Test verifying that distances are reused by configurations with different other parameters
+        and by both distance parameters with the same function
+    """
+    grid = {'normalization': norms[:2], 'distance_1': [_distance, distances.euclidean_distance],
+            'distance_2': [_distance, distances.vertex_distance], 'algorithm': ['pairwise', 'sorted']}
+    result = sweep(fCODAS, grid, matrix, crisp_weights, types)
+
+    assert result.stages['distance'].misses == 6
+    assert result.stages['distance'].hits == 26
+    for i, parameters in enumerate(itertools.product(*grid.values())):
+        assert np.allclose(result.preferences[i], fCODAS(*parameters)(matrix, crisp_weights, types))
+
+
+def test_sweep_vikor(matrix, crisp_weights, types):
+    """
+        Test verifying that results of fVIKOR approaches are stacked for configurations
+    """
+    grid = {'defuzzify': [defuzzifications.mean_defuzzification, defuzzifications.height_defuzzification]}
+    result = sweep(fVIKOR, grid, matrix, crisp_weights, types)
+
+    assert result.preferences.shape == (2, 3, 10)
+    assert result.rankings.shape == (2, 3, 10)
+    assert np.allclose(result.preferences[1], fVIKOR(defuzzify=defuzzifications.height_defuzzification)(matrix, crisp_weights, types))
+
+
+def test_sweep_errors(matrix, crisp_weights):
+    """
+        Test verifying that empty grids are rejected
+    """
+    with pytest.raises(ValueError):
+        sweep(fWSM, {}, matrix, crisp_weights)
+    with pytest.raises(ValueError):
+        sweep(fWSM, {'normalization': []}, matrix, crisp_weights)
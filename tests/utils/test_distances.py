@@ -1,4 +1,4 @@
-# Copyright (c) 2022-2023 Jakub Więckowski
+# Copyright (c) 2022-2024 Jakub Więckowski
 
 import numpy as np
 import pyfdm.methods.utils.distances as dist
@@ -145,3 +145,22 @@ def test_chebyshev_distance():
     reference_value = 3
 
     assert np.round(calculated_value, 3) == reference_value
+
+def test_tfn_distances():
+    """
+        Test veryfing that distances between arrays of TFNs equal distances calculated for each pair.
+        Reference value: Self-calculated empirical verification
+    """
+    np.random.seed(0)
+    x = np.sort(np.random.uniform(0, 1, (5, 4, 3)), axis=2)
+    y = np.sort(np.random.uniform(0, 1, (4, 3)), axis=1)
+
+    def custom_distance(a, b):
+        return max([abs(a[i] - b[i]) for i in range(3)])
+
+    for distance in [getattr(dist, name) for name in dist.__all__] + [custom_distance]:
+        calculated_value = dist.tfn_distances(distance, x, y)
+        reference_value = np.array([[distance(x[i, j], y[j]) for j in range(4)] for i in range(5)])
+
+        assert calculated_value.shape == (5, 4)
+        assert np.allclose(calculated_value, reference_value)
@@ -0,0 +1,113 @@
+# Copyright (c) 2024 Jakub Więckowski
+
+import numpy as np
+import pytest
+from pyfdm.methods import fCODAS, fEDAS, fSPOTIS
+from pyfdm.methods.codas import fuzzy as codas
+from pyfdm.methods.edas import fuzzy as edas
+from pyfdm.methods.spotis import fuzzy as spotis
+from pyfdm.methods.utils import distances, jit, normalizations
+
+
+@pytest.fixture
+def matrix(tfn_matrix):
+    return tfn_matrix((12, 4))
+
+
+@pytest.fixture
+def bounds():
+    return np.array([[1, 10]] * 4)
+
+
+def test_resolve_backend():
+    """
+        Test verifying selection of the backend
+    """
+    assert jit.resolve_backend('numpy') == 'numpy'
+    assert jit.resolve_backend('auto') == ('numba' if jit.NUMBA_AVAILABLE else 'numpy')
+    with pytest.raises(ValueError):
+        jit.resolve_backend('cuda')
+    if not jit.NUMBA_AVAILABLE:
+        with pytest.warns(RuntimeWarning):
+            assert jit.resolve_backend('numba') == 'numpy'
+
+
+@pytest.mark.parametrize('distance', list(jit.JIT_DISTANCES))
+def test_jit_distances(matrix, distance):
+    """
+        Test verifying that compiled distances give the same results as distances functions
+    """
+    a, b = matrix[:, 0], matrix[:, 1]
+    assert np.allclose(jit.jit_distances(distance, a, b), distances.tfn_distances(distance, a, b))
+
+
+@pytest.mark.parametrize('defuzzify', list(jit.JIT_DEFUZZIFICATIONS))
+def test_jit_edas(matrix, weights, types, defuzzify):
+    """
+        Test verifying that kernel of fuzzy EDAS gives the same preferences as NumPy implementation
+    """
+    expected_trace, calculated_trace = {}, {}
+    with np.errstate(all='ignore'):
+        expected = edas.fuzzy(matrix, weights, types, defuzzify, expected_trace, backend='numpy')
+        calculated = edas.fuzzy(matrix, weights, types, defuzzify, calculated_trace, backend='numba')
+
+    assert np.allclose(calculated, expected, equal_nan=True)
+    assert np.array_equal(calculated_trace['pda'], expected_trace['pda'])
+    assert np.array_equal(calculated_trace['nda'], expected_trace['nda'])
+
+
+@pytest.mark.parametrize('distance', [distances.euclidean_distance, distances.vertex_distance])
+def test_jit_codas(matrix, weights, types, distance):
+    """
+        Test verifying that kernels of fuzzy CODAS give the same preferences as NumPy implementation
+    """
+    args = (matrix, weights, types, normalizations.max_normalization, distance, distances.hamming_distance, 0.02)
+
+    assert np.allclose(codas.fuzzy(*args, backend='numba'), codas.fuzzy(*args, backend='numpy'))
+
+
+def test_jit_spotis(matrix, crisp_weights, types, bounds):
+    """
+        Test verifying that kernel of fuzzy SPOTIS gives the same preferences as NumPy implementation
+    """
+    isp = bounds[np.arange(4), ((types + 1) // 2)]
+    expected = spotis.fuzzy(matrix, crisp_weights, None, bounds, isp, backend='numpy')
+    calculated = spotis.fuzzy(matrix, crisp_weights, None, bounds, isp, backend='numba')
+
+    assert np.allclose(calculated, expected)
+
+
+def test_jit_methods(matrix, weights, crisp_weights, types, bounds):
+    """
+        Test verifying that methods objects give the same preferences with both backends
+    """
+    for method, args in [(fCODAS, (weights, types)), (fEDAS, (weights, types)), (fSPOTIS, (crisp_weights, types, bounds))]:
+        assert np.allclose(method(backend='auto')(matrix, *args), method(backend='numpy')(matrix, *args))
+
+
+def test_jit_dtype(matrix, weights, crisp_weights, types, bounds):
+    """
+        Test verifying that compiled kernels keep the float32 data type of inputs
+    """
+    a, b = matrix[:, 0].astype(np.float32), matrix[:, 1].astype(np.float32)
+    assert jit.jit_distances(distances.euclidean_distance, a, b).dtype == np.float32
+
+    for method, args in [(fCODAS, (weights, types)), (fEDAS, (weights, types)), (fSPOTIS, (crisp_weights, types, bounds))]:
+        calculated = method(backend='auto')(matrix, *args, dtype=np.float32)
+        assert calculated.dtype == np.float32
+        assert np.allclose(calculated, method(backend='numpy')(matrix, *args, dtype=np.float32), rtol=1e-4, atol=1e-6)
+
+
+@pytest.mark.parametrize('normalization', [getattr(normalizations, name) for name in normalizations.__all__])
+@pytest.mark.parametrize('distance', list(jit.JIT_DISTANCES))
+def test_jit_parity(matrix, weights, types, distance, normalization):
+    """
+        Test verifying that kernels give the same results as NumPy implementation for all distances and normalizations,
+        including nan and inf from division by zero
+    """
+    a, b = np.zeros((3, 3)), np.array([[0, 0, 0], [0, 1, 2], [1, 2, 3]], dtype=float)
+    with np.errstate(all='ignore'):
+        assert np.allclose(jit.jit_distances(distance, a, b), distances.tfn_distances(distance, a, b), equal_nan=True)
+
+        args = (matrix, weights, types, normalization, distance, distance, 0.02)
+        assert np.allclose(codas.fuzzy(*args, backend='numba'), codas.fuzzy(*args, backend='numpy'), equal_nan=True)
@@ -1,6 +1,7 @@
-# Copyright (c) 2022-2023 Jakub Więckowski
+# Copyright (c) 2022-2024 Jakub Więckowski
 
 import numpy as np
+import pytest
 import pyfdm.methods.utils.normalizations as norms
 
 
@@ -211,4 +212,47 @@ def test_cocoso_normalization():
     calculated_value = norms.cocoso_normalization(matrix, types)
     reference_value = np.array([0.293, 0.589, 0.901])
 
-    assert (np.round(calculated_value[0, 0].astype(float), 3) == reference_value).all() or np.sum(np.abs(calculated_value[0, 0] - reference_value)) < 0.05
\ No newline at end of file
+    assert (np.round(calculated_value[0, 0].astype(float), 3) == reference_value).all() or np.sum(np.abs(calculated_value[0, 0] - reference_value)) < 0.05
+
+def test_normalization_statistics_merge():
+    """
+        Test veryfing that statistics calculated for shards and merged give the same normalization as the whole matrix
+    """
+    np.random.seed(7)
+    matrix = np.sort(np.random.uniform(1, 10, (101, 4, 3)), axis=2)
+    types = np.array([1, -1, 1, -1])
+
+    whole = norms.NormalizationStatistics.fit(matrix)
+    merged = norms.NormalizationStatistics.combine(
+        norms.NormalizationStatistics.fit(shard) for shard in np.array_split(matrix, 5))
+
+    assert merged.count == whole.count == 101
+    assert (merged.min == whole.min).all() and (merged.max == whole.max).all()
+    assert np.allclose(merged.sum_squares, whole.sum_squares)
+
+    for name in norms.__all__:
+        normalization = getattr(norms, name)
+        reference = normalization(matrix, types)
+        shards = [norms.apply_normalization(normalization, merged, shard, types)
+                  for shard in np.array_split(matrix, 3)]
+
+        assert np.allclose(np.concatenate(shards), reference)
+
+
+def test_normalization_statistics_fields():
+    """
+        Test veryfing that only statistics read by the normalization are gathered
+    """
+    np.random.seed(7)
+    matrix = np.sort(np.random.uniform(1, 10, (20, 4, 3)), axis=2)
+
+    statistics = norms.NormalizationStatistics.fit(matrix, normalization=norms.vector_normalization)
+    assert statistics.fields == ('sum_squares', )
+    assert statistics.min is None and statistics.sum is None
+    assert np.allclose(statistics.sum_squares, norms.NormalizationStatistics.fit(matrix).sum_squares)
+
+    with pytest.raises(ValueError):
+        statistics.values(norms.minmax_normalization)
+    with pytest.raises(ValueError):
+        norms.NormalizationStatistics.fit(matrix, normalization=np.sum)
+